@@ -8,11 +8,14 @@ import time
 from contextlib import suppress
 from pathlib import Path
 from platform import system
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 from pymmcore_plus.core._device import Device
 from pymmcore_plus.core._mmcore_plus import CMMCorePlus
 
+if TYPE_CHECKING:
+    from useq import MDASequence
+
 try:
     import typer
     from rich import print
@@ -241,6 +244,11 @@ def run(
         None, help="Number of time points to acquire."
     ),
     dry_run: bool = typer.Option(False, help="Do not run the acquisition."),
+    estimate: bool = typer.Option(
+        False,
+        help="Estimate the duration of the acquisition on the loaded configuration "
+        "without running it (no hardware is moved).",
+    ),
     axis_order: str | None = typer.Option(
         None, help="Order of axes to acquire (e.g. 'TPCZ')."
     ),
@@ -326,9 +334,42 @@ def run(
 
     core = pymmcore_plus.CMMCorePlus.instance()
     core.loadSystemConfiguration(config or "MMConfig_demo.cfg")
+
+    if estimate:
+        _print_estimate(core, _mda)
+        raise typer.Exit(0)
+
     core.run_mda(_mda)
 
 
+def _print_estimate(core: CMMCorePlus, sequence: "MDASequence") -> None:
+    from rich.table import Table
+
+    from pymmcore_plus.mda import estimate_sequence
+
+    est = estimate_sequence(core, sequence)
+
+    table = Table(title="Estimated acquisition time")
+    table.add_column("Cause")
+    table.add_column("Time (s)", justify="right")
+    for cause, seconds in est.breakdown_s.items():
+        table.add_row(cause, f"{seconds:.3f}")
+    table.add_row("total", f"{est.total_s:.3f}", style="bold")
+    print(table)
+
+    print(f"Events: {est.n_events}  Images: {est.n_images}")
+    print(
+        f"Sequenced events: {est.n_sequenced_events} "
+        f"(longest: {est.max_sequence_length})"
+    )
+    if est.n_autofocus:
+        print(f"[yellow]Autofocus events (not timed): {est.n_autofocus}")
+    peak_mb = est.peak_buffer_bytes / 1024**2
+    capacity_mb = est.buffer_capacity_bytes / 1024**2
+    color = "green" if est.fits_in_buffer else "bold red"
+    print(f"[{color}]Peak buffer memory: {peak_mb:.1f} MB (of {capacity_mb:.0f} MB)")
+
+
 @app.command()
 def build_dev(
     devices: list[str] | None = typer.Argument(
@@ -466,6 +507,13 @@ def bench(
     number: int = typer.Option(
         10, "-n", "--number", help="Number of iterations for each test."
     ),
+    profile: Path | None = typer.Option(
+        None,
+        "--profile",
+        dir_okay=False,
+        help="Measure device latencies (this MOVES HARDWARE) and save the "
+        "profile to this JSON file, for use with `CMMCorePlus.loadLatencyProfile`.",
+    ),
 ) -> None:
     """Run a benchmark of Core and Devices loaded with `config` (or Demo)."""
     from rich.console import Console
@@ -489,6 +537,14 @@ def bench(
         core.loadSystemConfiguration()
     console.log("Loaded.", style="bright_blue")
 
+    if profile is not None:
+        from pymmcore_plus.core import profile_latencies
+
+        with console.status("Measuring device latencies ..."):
+            profile_latencies(core, repeats=number).save(profile)
+        console.log(f"Latency profile saved to {profile}", style="bright_blue")
+        return
+
     table = Table()
     table.add_column("Method")
     table.add_column("Time (ms)")
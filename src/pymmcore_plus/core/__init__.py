@@ -16,11 +16,14 @@ __all__ = [
     "DeviceProperty",
     "DeviceType",
     "FocusDirection",
+    "FrameStream",
     "GalvoDevice",
     "GenericDevice",
     "HubDevice",
     "ImageProcessorDevice",
     "Keyword",
+    "LatencyModel",
+    "LatencyProfile",
     "MagnifierDevice",
     "Metadata",
     "PixelFormat",
@@ -33,8 +36,10 @@ __all__ = [
     "SignalIODevice",
     "StageDevice",
     "StateDevice",
+    "StateMirror",
     "XYStageDevice",
     "iter_sequenced_events",
+    "profile_latencies",
 ]
 
 from ._adapter import DeviceAdapter
@@ -71,7 +76,10 @@ from ._device import (
     StateDevice,
     XYStageDevice,
 )
+from ._latency import LatencyModel, LatencyProfile, profile_latencies
 from ._metadata import Metadata
 from ._mmcore_plus import CMMCorePlus
 from ._property import DeviceProperty
 from ._sequencing import SequencedEvent, iter_sequenced_events
+from ._state_mirror import StateMirror
+from ._stream import FrameStream
@@ -0,0 +1,375 @@
+"""Calibrated per-rig device latencies."""
+
+from __future__ import annotations
+
+import json
+import time
+from contextlib import suppress
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+from pymmcore_plus._logger import logger
+
+from ._constants import DeviceType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from ._mmcore_plus import CMMCorePlus
+
+__all__ = ["LatencyModel", "LatencyProfile", "profile_latencies"]
+
+PROFILE_VERSION = 1
+
+
+class LatencyModel(NamedTuple):
+    """Linear model of the time a move takes as a function of distance.
+
+    `ms = offset_ms + ms_per_um * distance_um`
+    """
+
+    offset_ms: float = 0.0
+    ms_per_um: float = 0.0
+
+    def __call__(self, distance_um: float) -> float:
+        """Return the predicted move time (in ms) for `distance_um`."""
+        return self.offset_ms + self.ms_per_um * abs(distance_um)
+
+    @classmethod
+    def fit(
+        cls, distances_um: Sequence[float], times_ms: Sequence[float]
+    ) -> LatencyModel:
+        """Least-squares fit of measured `times_ms` against `distances_um`."""
+        d = np.abs(np.asarray(distances_um, dtype=float))
+        t = np.asarray(times_ms, dtype=float)
+        if d.size == 0:
+            return cls()
+        if np.ptp(d) == 0:
+            # all moves were the same distance: only the offset is measurable
+            return cls(max(float(t.mean()), 0.0), 0.0)
+        slope, offset = np.polyfit(d, t, 1)
+        return cls(max(float(offset), 0.0), max(float(slope), 0.0))
+
+
+@dataclass
+class LatencyProfile:
+    """Measured device latencies for a specific microscope.
+
+    A profile is created by [`profile_latencies`][pymmcore_plus.core.profile_latencies]
+    (or `mmcore bench --profile`), saved to JSON, and loaded into a core with
+    [`CMMCorePlus.loadLatencyProfile`][pymmcore_plus.CMMCorePlus.loadLatencyProfile].
+    [`estimate_sequence`][pymmcore_plus.mda.estimate_sequence] uses it to predict
+    acquisition times, and the `*_ms` methods below may be used by planners to
+    compare the cost of alternative event orderings.
+
+    All times are in milliseconds and include the time spent in `waitForDevice`.
+
+    Attributes
+    ----------
+    xy_stages : dict[str, LatencyModel]
+        Settle time of each XY stage as a function of the distance moved (the
+        larger of the X and Y displacements).
+    stages : dict[str, LatencyModel]
+        Settle time of each (Z) stage as a function of the distance moved.
+    state_devices : dict[str, dict[int, dict[int, float]]]
+        Switch time of each state device, mapping `{from_state: {to_state: ms}}`.
+    shutters : dict[str, tuple[float, float]]
+        `(open_ms, close_ms)` latency of each shutter.
+    wait_overhead_ms : dict[str, float]
+        Time taken by `waitForDevice` on each device when it is idle.
+    """
+
+    xy_stages: dict[str, LatencyModel] = field(default_factory=dict)
+    stages: dict[str, LatencyModel] = field(default_factory=dict)
+    state_devices: dict[str, dict[int, dict[int, float]]] = field(default_factory=dict)
+    shutters: dict[str, tuple[float, float]] = field(default_factory=dict)
+    wait_overhead_ms: dict[str, float] = field(default_factory=dict)
+
+    # ------------------------ queries ------------------------
+
+    def xy_move_ms(
+        self, label: str, start: Sequence[float], end: Sequence[float]
+    ) -> float | None:
+        """Predicted time to move XY stage `label` from `start` to `end`.
+
+        Returns `None` if the stage has not been profiled.
+        """
+        if (model := self.xy_stages.get(label)) is None:
+            return None
+        dist = max(abs(end[0] - start[0]), abs(end[1] - start[1]))
+        return model(dist) if dist else 0.0
+
+    def stage_move_ms(self, label: str, start: float, end: float) -> float | None:
+        """Predicted time to move stage `label` from `start` to `end`.
+
+        Returns `None` if the stage has not been profiled.
+        """
+        if (model := self.stages.get(label)) is None:
+            return None
+        return model(end - start) if end != start else 0.0
+
+    def state_switch_ms(self, label: str, start: int, end: int) -> float | None:
+        """Predicted time to switch state device `label` from `start` to `end`.
+
+        If the specific transition was not measured, the mean of all measured
+        transitions for the device is returned. Returns `None` if the device has not
+        been profiled.
+        """
+        if not (pairs := self.state_devices.get(label)):
+            return None
+        if start == end:
+            return 0.0
+        if (ms := pairs.get(start, {}).get(end)) is not None:
+            return ms
+        all_ms = [v for targets in pairs.values() for v in targets.values()]
+        return sum(all_ms) / len(all_ms) if all_ms else None
+
+    def shutter_ms(self, label: str, open: bool) -> float | None:
+        """Predicted time to open (or close) shutter `label`.
+
+        Returns `None` if the shutter has not been profiled.
+        """
+        if (times := self.shutters.get(label)) is None:
+            return None
+        return times[0] if open else times[1]
+
+    # ------------------------ serialization ------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable dict representation of the profile."""
+        return {
+            "version": PROFILE_VERSION,
+            "xy_stages": {k: v._asdict() for k, v in self.xy_stages.items()},
+            "stages": {k: v._asdict() for k, v in self.stages.items()},
+            "state_devices": {
+                dev: {
+                    str(a): {str(b): ms for b, ms in targets.items()}
+                    for a, targets in pairs.items()
+                }
+                for dev, pairs in self.state_devices.items()
+            },
+            "shutters": {
+                k: {"open_ms": o, "close_ms": c} for k, (o, c) in self.shutters.items()
+            },
+            "wait_overhead_ms": dict(self.wait_overhead_ms),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LatencyProfile:
+        """Create a profile from the output of `to_dict`."""
+        if (version := data.get("version", PROFILE_VERSION)) > PROFILE_VERSION:
+            raise ValueError(f"Unsupported latency profile version: {version}")
+        return cls(
+            xy_stages={
+                k: LatencyModel(**v) for k, v in data.get("xy_stages", {}).items()
+            },
+            stages={k: LatencyModel(**v) for k, v in data.get("stages", {}).items()},
+            state_devices={
+                dev: {
+                    int(a): {int(b): float(ms) for b, ms in targets.items()}
+                    for a, targets in pairs.items()
+                }
+                for dev, pairs in data.get("state_devices", {}).items()
+            },
+            shutters={
+                k: (float(v["open_ms"]), float(v["close_ms"]))
+                for k, v in data.get("shutters", {}).items()
+            },
+            wait_overhead_ms={
+                k: float(v) for k, v in data.get("wait_overhead_ms", {}).items()
+            },
+        )
+
+    def save(self, path: str | Path) -> None:
+        """Write the profile to a JSON file at `path`."""
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2))
+
+    @classmethod
+    def load(cls, path: str | Path) -> LatencyProfile:
+        """Read a profile from a JSON file at `path`."""
+        return cls.from_dict(json.loads(Path(path).read_text()))
+
+
+# ------------------------ profiling ------------------------
+
+DEFAULT_XY_DISTANCES: tuple[float, ...] = (10, 100, 1000, 5000)
+DEFAULT_Z_DISTANCES: tuple[float, ...] = (1, 10, 50, 200)
+
+
+def profile_latencies(
+    core: CMMCorePlus,
+    *,
+    xy_distances: Sequence[float] = DEFAULT_XY_DISTANCES,
+    z_distances: Sequence[float] = DEFAULT_Z_DISTANCES,
+    repeats: int = 3,
+    max_states: int = 12,
+) -> LatencyProfile:
+    """Measure device latencies on `core` and fit a [`LatencyProfile`][].
+
+    !!! warning
+
+        This **moves hardware**: every XY stage and stage is moved by each of the
+        requested distances (in the positive direction, and back), every state device
+        is switched between its states, and every shutter is opened and closed.
+        Make sure that the sample and objectives are safe before running this.
+        Positions and states are restored when profiling is done.
+
+    Parameters
+    ----------
+    core : CMMCorePlus
+        A core with a loaded configuration.
+    xy_distances : Sequence[float]
+        Distances (in µm) to move each XY stage.
+    z_distances : Sequence[float]
+        Distances (in µm) to move each stage.
+    repeats : int
+        Number of times to repeat each measurement.
+    max_states : int
+        State devices with more states than this are only profiled for transitions
+        between their first `max_states` states.
+
+    Returns
+    -------
+    LatencyProfile
+        The fitted profile. Use `LatencyProfile.save()` to write it to disk.
+    """
+    profile = LatencyProfile()
+
+    def _timed(func: Callable[[], Any], label: str) -> float:
+        t0 = time.perf_counter()
+        func()
+        core.waitForDevice(label)
+        return (time.perf_counter() - t0) * 1000
+
+    for label in core.getLoadedDevices():
+        try:
+            dev_type = core.getDeviceType(label)
+        except Exception:  # pragma: no cover
+            continue
+        if dev_type in (DeviceType.Core, DeviceType.Any, DeviceType.Unknown):
+            continue
+
+        try:
+            if dev_type == DeviceType.XYStage:
+                profile.xy_stages[label] = _profile_xy_stage(
+                    core, label, xy_distances, repeats, _timed
+                )
+            elif dev_type == DeviceType.Stage:
+                profile.stages[label] = _profile_stage(
+                    core, label, z_distances, repeats, _timed
+                )
+            elif dev_type == DeviceType.State:
+                profile.state_devices[label] = _profile_state_device(
+                    core, label, repeats, max_states, _timed
+                )
+            elif dev_type == DeviceType.Shutter:
+                profile.shutters[label] = _profile_shutter(core, label, repeats, _timed)
+        except Exception as e:
+            logger.warning("Failed to profile device %r: %s", label, e)
+            continue
+
+        # waitForDevice on an idle device
+        with suppress(Exception):
+            t0 = time.perf_counter()
+            for _ in range(repeats):
+                core.waitForDevice(label)
+            overhead = (time.perf_counter() - t0) * 1000 / repeats
+            profile.wait_overhead_ms[label] = overhead
+
+    return profile
+
+
+def _profile_xy_stage(
+    core: CMMCorePlus,
+    label: str,
+    distances: Sequence[float],
+    repeats: int,
+    timed: Callable[[Callable[[], Any], str], float],
+) -> LatencyModel:
+    x0, y0 = core.getXYPosition(label)
+    dists: list[float] = []
+    times: list[float] = []
+    try:
+        for d in distances:
+            for _ in range(repeats):
+                for x in (x0 + d, x0):
+                    times.append(
+                        timed(partial(core.setXYPosition, label, x, y0), label)
+                    )
+                    dists.append(d)
+    finally:
+        core.setXYPosition(label, x0, y0)
+        core.waitForDevice(label)
+    return LatencyModel.fit(dists, times)
+
+
+def _profile_stage(
+    core: CMMCorePlus,
+    label: str,
+    distances: Sequence[float],
+    repeats: int,
+    timed: Callable[[Callable[[], Any], str], float],
+) -> LatencyModel:
+    z0 = core.getPosition(label)
+    dists: list[float] = []
+    times: list[float] = []
+    try:
+        for d in distances:
+            for _ in range(repeats):
+                for z in (z0 + d, z0):
+                    times.append(timed(partial(core.setPosition, label, z), label))
+                    dists.append(d)
+    finally:
+        core.setPosition(label, z0)
+        core.waitForDevice(label)
+    return LatencyModel.fit(dists, times)
+
+
+def _profile_state_device(
+    core: CMMCorePlus,
+    label: str,
+    repeats: int,
+    max_states: int,
+    timed: Callable[[Callable[[], Any], str], float],
+) -> dict[int, dict[int, float]]:
+    initial = core.getState(label)
+    n_states = min(core.getNumberOfStates(label), max_states)
+    pairs: dict[int, dict[int, float]] = {}
+    try:
+        for a in range(n_states):
+            for b in range(n_states):
+                if a == b:
+                    continue
+                samples = []
+                for _ in range(repeats):
+                    core.setState(label, a)
+                    core.waitForDevice(label)
+                    samples.append(timed(partial(core.setState, label, b), label))
+                pairs.setdefault(a, {})[b] = float(np.median(samples))
+    finally:
+        core.setState(label, initial)
+        core.waitForDevice(label)
+    return pairs
+
+
+def _profile_shutter(
+    core: CMMCorePlus,
+    label: str,
+    repeats: int,
+    timed: Callable[[Callable[[], Any], str], float],
+) -> tuple[float, float]:
+    initial = core.getShutterOpen(label)
+    opens: list[float] = []
+    closes: list[float] = []
+    try:
+        for _ in range(repeats):
+            opens.append(timed(partial(core.setShutterOpen, label, True), label))
+            closes.append(timed(partial(core.setShutterOpen, label, False), label))
+    finally:
+        core.setShutterOpen(label, initial)
+        core.waitForDevice(label)
+    return float(np.median(opens)), float(np.median(closes))
@@ -7,8 +7,8 @@ import time
 import warnings
 import weakref
 from collections import defaultdict, deque
-from contextlib import contextmanager, suppress
-from datetime import datetime
+from collections.abc import Mapping
+from contextlib import ExitStack, contextmanager, suppress
 from pathlib import Path
 from re import Pattern
 from textwrap import dedent
@@ -41,11 +41,14 @@ from ._constants import (
     DeviceType,
     FocusDirection,
     Keyword,
-    PixelType,
     PropertyType,
 )
+from ._latency import LatencyProfile
 from ._metadata import Metadata
 from ._property import DeviceProperty
+from ._state_mirror import StateMirror
+from ._stream import FrameStream
+from ._tags import DEFAULT_TAG_PROFILE, TAG_PROFILES, TagBuilder
 from .events import CMMCoreSignaler, PCoreSignaler, _get_auto_core_callback_class
 
 if TYPE_CHECKING:
@@ -59,6 +62,9 @@ if TYPE_CHECKING:
     from pymmcore_plus.mda._runner import DimensionOverride, SingleOutput
     from pymmcore_plus.metadata.schema import SummaryMetaV1
 
+    from ._stream import DropPolicy
+    from ._tags import TagProfile
+
     _T = TypeVar("_T")
     _DT = TypeVar("_DT", bound=_device.Device)
     ListOrTuple = list[_T] | tuple[_T, ...]
@@ -163,6 +169,16 @@ LABEL = pymmcore.g_Keyword_Label
 STATE_PROPS = (STATE, LABEL)
 
 
+def _same_property_value(current: Any, value: Any) -> bool:
+    """Return True if property `value` is equivalent to the `current` value."""
+    if str(current) == str(value):
+        return True
+    try:
+        return float(current) == float(value)
+    except (TypeError, ValueError):
+        return False
+
+
 class TaggedImage(NamedTuple):
     pix: np.ndarray
     tags: dict[str, Any]
@@ -261,6 +277,14 @@ class CMMCorePlus(pymmcore.CMMCore):
         self._last_config: tuple[str, str] = ("", "")
         # last position set by setXYPosition, None means currentXYStageDevice
         self._last_xy_position: dict[str | None, tuple[float, float]] = {}
+        # calibrated device latencies, see loadLatencyProfile
+        self._latency_profile: LatencyProfile | None = None
+        # per-thread depth of `setProperties` calls, which take care of
+        # propertyChanged emission for the whole batch.
+        self._prop_batch = threading.local()
+        # see setPropertyEmissionPolicy
+        self._emission_before_from_cache: bool = False
+        self._emission_native_devices: frozenset[str] = frozenset()
 
         self._mm_path = mm_path or find_micromanager()
         if not adapter_paths and self._mm_path:
@@ -270,6 +294,9 @@ class CMMCorePlus(pymmcore.CMMCore):
 
         self._events = _get_auto_core_callback_class()()
         self._callback_relay = MMCallbackRelay(self.events)
+        self._state_mirror = StateMirror(self)
+        self._tag_builder = TagBuilder(self)
+        self._tag_profile: TagProfile = DEFAULT_TAG_PROFILE
 
         super().registerCallback(self._callback_relay)
 
@@ -666,6 +693,30 @@ class CMMCorePlus(pymmcore.CMMCore):
         cfg = super().getSystemStateCache()
         return cfg if native else Configuration.from_configuration(cfg)
 
+    def getSystemStateMirror(self) -> StateMirror:
+        """Return a live mapping of `{(device, property): value}` for the system state.
+
+        :sparkles: *This method is new in `CMMCorePlus`.*
+
+        Unlike `getSystemStateCache`, which walks every device property on each call,
+        the returned [`StateMirror`][pymmcore_plus.core.StateMirror] is populated once
+        and then kept up to date by core signals, so reading from it is just a dict
+        lookup.  Its `version` attribute is incremented whenever the state may have
+        changed.
+
+        Examples
+        --------
+        ```python
+        state = core.getSystemStateMirror()
+        state["Camera", "Binning"]  # '1'
+        last_version = state.version
+        ...
+        if state.version != last_version:
+            ...  # something changed
+        ```
+        """
+        return self._state_mirror
+
     # metadata methods that don't require instantiating metadata first
 
     @overload
@@ -1626,6 +1677,8 @@ class CMMCorePlus(pymmcore.CMMCore):
         output: SingleOutput | Sequence[SingleOutput] | None = None,
         block: bool = False,
         dimension_overrides: dict[str, DimensionOverride] | None = None,
+        pyramid_levels: int = 0,
+        view_cache_bytes: int = 0,
     ) -> Thread:
         """Run a sequence of [useq.MDAEvent][] on a new thread.
 
@@ -1657,6 +1710,12 @@ class CMMCorePlus(pymmcore.CMMCore):
         dimension_overrides : dict[str, DimensionOverride] | None, optional
             Per-dimension storage overrides, keyed by dimension name.
             See `MDARunner.run` for details.
+        pyramid_levels : int, optional
+            Number of additional multiscale levels to write for OME-Zarr output.
+            See `MDARunner.run` for details.
+        view_cache_bytes : int, optional
+            Size of the in-memory frame cache for `mda.get_view()`, by default 0.
+            See `MDARunner.run` for details.
 
         Returns
         -------
@@ -1671,7 +1730,12 @@ class CMMCorePlus(pymmcore.CMMCore):
         th = Thread(
             target=self.mda.run,
             args=(events,),
-            kwargs={"output": output, "dimension_overrides": dimension_overrides},
+            kwargs={
+                "output": output,
+                "dimension_overrides": dimension_overrides,
+                "pyramid_levels": pyramid_levels,
+                "view_cache_bytes": view_cache_bytes,
+            },
         )
         th.start()
         if block:
@@ -1699,6 +1763,10 @@ class CMMCorePlus(pymmcore.CMMCore):
         self,
         img: np.ndarray,
         ncomponents: int | None = None,
+        *,
+        channel_order: Literal["RGB", "BGRA"] = "RGB",
+        copy: bool = True,
+        out: np.ndarray | None = None,
     ) -> np.ndarray:
         """Fix img shape/dtype based on `self.getNumberOfComponents()`.
 
@@ -1707,12 +1775,28 @@ class CMMCorePlus(pymmcore.CMMCore):
         convert images with n_components > 1
         to a shape (w, h, num_components) and dtype `img.dtype.itemsize//ncomp`
 
+        By default, 4-component (BGRA) images are converted to a new (contiguous) RGB
+        array.  To avoid copying every frame (e.g. for live display), pass
+        `copy=False` to get a (non-contiguous) view of `img` instead, and/or
+        `channel_order="BGRA"` to keep the native channel order (including alpha),
+        or `out` to write the result into a preallocated array.  For example:
+        `core.fixImage(core.getImage(fix=False), copy=False)`.
+
         Parameters
         ----------
         img : np.ndarray
             input image
         ncomponents : int, optional
             number of components in the image, by default `self.getNumberOfComponents()`
+        channel_order : {"RGB", "BGRA"}
+            Channel order of the last axis of 4-component images, by default "RGB".
+            "BGRA" is the order in which the camera stores them.
+        copy : bool
+            If False, 4-component images are returned as a view of `img`, rather than
+            a copy.  By default True.
+        out : np.ndarray, optional
+            If provided, the output is written into this array (which must have the
+            output shape and a compatible dtype), and `out` is returned.
 
         Returns
         -------
@@ -1721,11 +1805,27 @@ class CMMCorePlus(pymmcore.CMMCore):
         """
         if ncomponents is None:
             ncomponents = self.getNumberOfComponents()
-        if ncomponents == 4 and img.ndim != 3:
-            new_shape = (*img.shape, 4)
-            img = img.view(dtype=f"u{img.dtype.itemsize // 4}").reshape(new_shape)
-            img = img[..., [2, 1, 0]]  # Convert from BGRA to RGB
-        return img
+        if ncomponents != 4 or img.ndim == 3:
+            if out is not None:
+                out[...] = img
+                return out
+            return img
+
+        new_shape = (*img.shape, 4)
+        bgra = img.view(dtype=f"u{img.dtype.itemsize // 4}").reshape(new_shape)
+        if channel_order == "BGRA":
+            if out is not None:
+                out[...] = bgra
+                return out
+            return bgra.copy() if copy else bgra
+        if out is not None:
+            # one strided copy per channel is faster than copying a reversed view
+            for i in range(3):
+                out[..., i] = bgra[..., 2 - i]
+            return out
+        if copy:
+            return bgra[..., [2, 1, 0]]  # Convert from BGRA to RGB
+        return bgra[..., 2::-1]  # BGRA to RGB, as a strided view
 
     def getPhysicalCameraDevice(self, channel_index: int = 0) -> str:
         """Return the name of the actual camera device for a given channel index.
@@ -1767,71 +1867,62 @@ class CMMCorePlus(pymmcore.CMMCore):
         img, meta = self.popNextImageAndMD(channel_index, 0)
         return TaggedImage(img, self.getTags(meta, channel_index))
 
-    # this matches the MMCoreJ implementation ... which we may or may not want to do?
     def getTags(
-        self, meta: Metadata | None = None, channel_index: int | None = None
+        self,
+        meta: Metadata | None = None,
+        channel_index: int | None = None,
+        *,
+        profile: TagProfile | None = None,
     ) -> dict[str, Any]:
         """Return a dict of metadata tags for the state of the core.
 
-        NOTE: this function is pretty slow, and is potentially called on every frame
-        of an acquisition. It would be nice to determine what is absolutely necessary,
-        and possible allow the user to specify what they want to include.
-
         :sparkles: *This method is new in `CMMCorePlus`.* It returns only the `.tags`
         attribute of what you would get with `getTaggedImage()` or
         `popNextTaggedImage()`.
-        """
-        # TODO: make these keys into an enum or something somewhere...
-        # you shouldn't have to search the code to find out what keys are available
 
-        tags = dict(meta) if meta else {}
-        for dev, label, val in self.getSystemStateCache():
-            tags[f"{dev}-{label}"] = val
+        This is potentially called on every frame of an acquisition, so everything
+        that doesn't change between frames (image geometry, pixel size, and the
+        system state cache) is cached, and updated by core signals.
 
-        tags["BitDepth"] = self.getImageBitDepth()
-
-        # NOTE: AcqEngJ appears to also add this as PixelSize_um
-        # while MMCoreJ uses PixelSizeUm?  not sure why both are needed
-        tags["PixelSizeUm"] = self.getPixelSizeUm(True)  # true == cached
-
-        affine = self.getPixelSizeAffine(True)  # true == cached
-        tags["PixelSizeAffine"] = ";".join(str(x) for x in affine)
-        tags["ROI"] = "-".join(str(x) for x in self.getROI())
-        tags["Width"] = self.getImageWidth()
-        tags["Height"] = self.getImageHeight()
-        tags["PixelType"] = str(
-            PixelType.for_bytes(self.getBytesPerPixel(), self.getNumberOfComponents())
+        Parameters
+        ----------
+        meta : Metadata | None
+            Image metadata (e.g. from `popNextImageAndMD`) to include in the tags.
+        channel_index : int | None
+            Camera channel index (for multi-camera devices).
+        profile : {"minimal", "mmcorej", "full"} | None
+            Which set of tags to include. "minimal" includes only image geometry,
+            pixel size, camera and time; "mmcorej" (the default) matches the tags
+            provided by MMCoreJ (including the full system state cache); "full" adds
+            the current stage positions (which requires querying the stages).
+            If `None`, the profile set with `setTagProfile` is used.
+        """
+        return self._tag_builder.build(
+            meta, channel_index, self._tag_profile if profile is None else profile
         )
-        tags["Frame"] = 0
-        tags["FrameIndex"] = 0
-        tags["Position"] = "Default"
-        tags["PositionIndex"] = 0
-        tags["Slice"] = 0
-        tags["SliceIndex"] = 0
 
-        try:
-            channel_group = self.getPropertyFromCache("Core", "ChannelGroup")
-            channel: str = self.getCurrentConfigFromCache(channel_group)
-        except Exception:
-            channel = "Default"
-        tags["Channel"] = channel
-        tags["ChannelIndex"] = 0
+    def setTagProfile(self, profile: TagProfile) -> None:
+        """Set the default tag profile used by `getTags` and `*TaggedImage` methods.
 
-        with suppress(Exception):
-            tags["Binning"] = self.getProperty(self.getCameraDevice(), "Binning")
+        :sparkles: *This method is new in `CMMCorePlus`.*
 
-        if channel_index is not None:
-            tags["CameraChannelIndex"] = channel_index
-            tags["ChannelIndex"] = channel_index
-            tags["Camera"] = self.getPhysicalCameraDevice(channel_index)
+        Parameters
+        ----------
+        profile : {"minimal", "mmcorej", "full"}
+            The tag profile. See `getTags` for details.
+        """
+        if profile not in TAG_PROFILES:
+            raise ValueError(
+                f"Unknown tag profile {profile!r}. Must be one of {set(TAG_PROFILES)}"
+            )
+        self._tag_profile = profile
 
-        # these are added by AcqEngJ
-        # yyyy-MM-dd HH:mm:ss.mmmmmm  # NOTE AcqEngJ omits microseconds
-        tags["Time"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+    def getTagProfile(self) -> TagProfile:
+        """Return the default tag profile used by `getTags`.
 
-        # used by Runner
-        tags["PerfCounter"] = time.perf_counter()
-        return tags
+        :sparkles: *This method is new in `CMMCorePlus`.*
+        """
+        return self._tag_profile
 
     def snap(self, numChannel: int | None = None, *, fix: bool = True) -> np.ndarray:
         """Snap and return an image.
@@ -1899,6 +1990,55 @@ class CMMCorePlus(pymmcore.CMMCore):
         self._do_start_continuous_sequence_acquisition(intervalMs)
         self.events.continuousSequenceAcquisitionStarted.emit()
 
+    def stream(
+        self,
+        fps: float | None = None,
+        drop_policy: DropPolicy = "drop_oldest",
+        *,
+        maxsize: int = 8,
+        interval_ms: float = 0,
+    ) -> FrameStream:
+        """Stream frames from a continuous sequence acquisition.
+
+        :sparkles: *This method is new in `CMMCorePlus`.*
+
+        Returns a [`FrameStream`][pymmcore_plus.core.FrameStream], which starts a
+        continuous sequence acquisition (if one isn't already running) and drains the
+        circular buffer on a background thread.  Use it as a context manager (the
+        acquisition is stopped on exit) and/or iterate over it to get `(image,
+        metadata)` tuples.  Frames that the consumer can't keep up with are dropped
+        (according to `drop_policy`) and counted in `frames_dropped`.
+
+        Parameters
+        ----------
+        fps : float | None
+            Maximum number of frames per second to yield.  By default, all frames.
+        drop_policy : {"drop_oldest", "drop_newest", "latest"}
+            Which frame to drop when `maxsize` frames are waiting to be consumed: the
+            oldest (the default), or the newest.  With `"latest"`, only the most
+            recent frame is ever kept.
+        maxsize : int
+            Maximum number of frames waiting to be consumed, by default 8.
+        interval_ms : float
+            Interval between frames, passed to `startContinuousSequenceAcquisition`.
+
+        Examples
+        --------
+        >>> with core.stream(fps=20, drop_policy="latest") as stream:
+        ...     for img, md in stream:
+        ...         viewer.set_image(img)
+        ...         if done:
+        ...             break
+        >>> stream.frames_dropped
+        """
+        return FrameStream(
+            self,
+            fps=fps,
+            drop_policy=drop_policy,
+            maxsize=maxsize,
+            interval_ms=interval_ms,
+        )
+
     @overload
     def startSequenceAcquisition(
         self, numImages: int, intervalMs: float, stopOnOverflow: bool, /
@@ -1930,6 +2070,8 @@ class CMMCorePlus(pymmcore.CMMCore):
                 f"got {len(args)}."
             )
 
+        # image geometry can't change during the sequence: refresh cached tags now
+        self._tag_builder.invalidate_static()
         self.events.sequenceAcquisitionStarting.emit(*args)
         self._do_start_sequence_acquisition(*args)
         self.events.sequenceAcquisitionStarted.emit(*args)
@@ -2344,6 +2486,95 @@ class CMMCorePlus(pymmcore.CMMCore):
             )
         return summary_metadata(self, include_time=include_time, cached=cached)
 
+    def loadLatencyProfile(self, fileName: str | Path) -> LatencyProfile:
+        """Load a latency profile (JSON) of calibrated device latencies for this rig.
+
+        :sparkles: *This method is new in `CMMCorePlus`.*
+
+        Latency profiles are created with
+        [`profile_latencies`][pymmcore_plus.core.profile_latencies] (or
+        `mmcore bench --profile`), and are used by
+        [`estimate_sequence`][pymmcore_plus.mda.estimate_sequence] to predict the
+        duration of an acquisition.
+
+        Parameters
+        ----------
+        fileName : str | Path
+            Path to a JSON file written by `LatencyProfile.save()`.
+
+        Returns
+        -------
+        LatencyProfile
+            The loaded profile (also available with `getLatencyProfile()`).
+        """
+        self._latency_profile = LatencyProfile.load(fileName)
+        return self._latency_profile
+
+    def setLatencyProfile(self, profile: LatencyProfile | None) -> None:
+        """Set (or clear, with `None`) the latency profile for this core.
+
+        :sparkles: *This method is new in `CMMCorePlus`.*
+        """
+        self._latency_profile = profile
+
+    def getLatencyProfile(self) -> LatencyProfile | None:
+        """Return the current latency profile, or `None` if none has been loaded.
+
+        :sparkles: *This method is new in `CMMCorePlus`.*
+        """
+        return self._latency_profile
+
+    def setPropertyEmissionPolicy(
+        self,
+        *,
+        before_from_cache: bool | None = None,
+        native_callback_devices: Iterable[str] | None = None,
+    ) -> None:
+        """Configure how `propertyChanged` emission is ensured for property setters.
+
+        :sparkles: *This method is new in `CMMCorePlus`.*
+
+        By default, `setProperty`, `setState` and `setStateLabel` read the affected
+        properties with `getProperty` both before and after setting them, and emit
+        `events.propertyChanged` if they changed.  These reads may be hardware
+        round-trips.  This method allows trading some of that safety for speed.
+
+        Parameters
+        ----------
+        before_from_cache : bool | None
+            If `True`, the "before" values are read from the system state cache
+            (`getPropertyFromCache`) instead of from the device. If `None` (the
+            default), the current setting is left unchanged.
+        native_callback_devices : Iterable[str] | None
+            Device labels or device adapter library names whose adapters are known
+            to reliably fire native `OnPropertyChanged` callbacks. For these
+            devices, no properties are read at all: emission is left to the
+            native callbacks. If `None` (the default), the current setting is left
+            unchanged.  Use an empty sequence to clear it.
+        """
+        if before_from_cache is not None:
+            self._emission_before_from_cache = bool(before_from_cache)
+        if native_callback_devices is not None:
+            self._emission_native_devices = frozenset(native_callback_devices)
+
+    def _fires_native_property_callbacks(self, device: str) -> bool:
+        """Whether `device` is trusted to emit native property change callbacks."""
+        if not (trusted := self._emission_native_devices):
+            return False
+        if device in trusted:
+            return True
+        try:
+            return self.getDeviceLibrary(device) in trusted
+        except Exception:  # pragma: no cover
+            return False
+
+    def _get_property_before(self, device: str, prop: str) -> Any:
+        """Read a property value before a change, honoring the emission policy."""
+        if self._emission_before_from_cache:
+            with suppress(Exception):
+                return self.getPropertyFromCache(device, prop)
+        return self.getProperty(device, prop)
+
     @contextmanager
     def _property_change_emission_ensured(
         self, device: str, properties: Sequence[str]
@@ -2359,6 +2590,13 @@ class CMMCorePlus(pymmcore.CMMCore):
         properties : Sequence[str]
             a sequence of property names to monitor
         """
+        batched = getattr(self._prop_batch, "depth", 0)
+        if batched or self._fires_native_property_callbacks(device):
+            # emission is handled by an enclosing `setProperties` call, or
+            # by the device adapter itself
+            yield
+            return
+
         # make sure that changing either state device property emits both signals
         if (
             len(properties) == 1
@@ -2367,7 +2605,7 @@ class CMMCorePlus(pymmcore.CMMCore):
         ):
             properties = STATE_PROPS
         try:
-            before = [self.getProperty(device, p) for p in properties]
+            before = [self._get_property_before(device, p) for p in properties]
         except Exception as e:
             logger.warning(
                 "Error getting properties %s on %s: %s. "
@@ -2446,6 +2684,132 @@ class CMMCorePlus(pymmcore.CMMCore):
                 with suppress(AttributeError):
                     getattr(self, f"set{k}")(v)
 
+    def setProperties(
+        self,
+        properties: Mapping[tuple[str, str], bool | float | int | str]
+        | Iterable[tuple[str, str, bool | float | int | str]],
+        *,
+        skip_unchanged: bool = True,
+        wait: bool = True,
+    ) -> None:
+        """Set many device properties at once.
+
+        :sparkles: *This method is new in `CMMCorePlus`.*
+
+        Settings are grouped by device and issued in the order given. Rather than
+        checking each property for changes before and after setting it (as
+        `setProperty` does), the whole batch is checked once:  "before" values are
+        read from the system state cache, each touched device is waited for once
+        after all settings have been issued, and `events.propertyChanged` is then
+        emitted once for each property that actually changed (see also
+        [`setPropertyEmissionPolicy`][pymmcore_plus.CMMCorePlus.setPropertyEmissionPolicy]).
+
+        Parameters
+        ----------
+        properties : Mapping[tuple[str, str], Any] | Iterable[tuple[str, str, Any]]
+            Either a mapping of `{(device, property): value}` or an iterable of
+            `(device, property, value)` tuples (such as a `Configuration`).
+        skip_unchanged : bool
+            If `True` (the default), properties whose value in the system state
+            cache already matches the requested value are not set.
+        wait : bool
+            If `True` (the default), wait for each device that was touched before
+            reading back the new property values.
+
+        Raises
+        ------
+        RuntimeError
+            If any of the properties could not be set.  All other properties are
+            still set (and their changes emitted) before the error is raised.
+
+        Examples
+        --------
+        ```python
+        core.setProperties(
+            {
+                ("Camera", "Binning"): 2,
+                ("Camera", "PixelType"): "16bit",
+                ("Dichroic", "Label"): "Q505LP",
+            }
+        )
+        ```
+        """
+        items = (
+            properties.items()
+            if isinstance(properties, Mapping)
+            else (((dev, prop), val) for dev, prop, val in properties)
+        )
+        by_device: dict[str, dict[str, Any]] = {}
+        for (dev, prop), value in items:
+            by_device.setdefault(dev, {})[prop] = value
+
+        # properties to monitor for changes, with their (cached) initial values
+        monitored: dict[str, tuple[str, ...]] = {}
+        before: dict[tuple[str, str], Any] = {}
+        for dev, props in list(by_device.items()):
+            names = tuple(props)
+            if any(p in STATE_PROPS for p in names):
+                with suppress(Exception):
+                    if self.getDeviceType(dev) is DeviceType.StateDevice:
+                        names = tuple(dict.fromkeys((*names, *STATE_PROPS)))
+            for prop in names:
+                with suppress(Exception):
+                    before[(dev, prop)] = self.getPropertyFromCache(dev, prop)
+            if skip_unchanged:
+                for prop, value in list(props.items()):
+                    if (dev, prop) in before and _same_property_value(
+                        before[(dev, prop)], value
+                    ):
+                        del props[prop]
+                if not props:
+                    del by_device[dev]
+                    continue
+            monitored[dev] = names
+
+        errors: list[str] = []
+        changed: list[tuple[str, str, Any]] = []
+        relay = self._callback_relay
+        # devices that emit their own (native) callbacks need no monitoring
+        native = {d for d in monitored if self._fires_native_property_callbacks(d)}
+        with ExitStack() as stack:
+            for dev, names in monitored.items():
+                if dev not in native:
+                    stack.enter_context(relay.property_suppressed(dev, names))
+
+            batch = self._prop_batch
+            batch.depth = getattr(batch, "depth", 0) + 1
+            try:
+                for dev, props in by_device.items():
+                    for prop, value in props.items():
+                        try:
+                            self.setProperty(dev, prop, value)
+                        except Exception as e:
+                            errors.append(f"{dev}-{prop}={value!r}: {e}")
+            finally:
+                batch.depth -= 1
+
+            for dev, names in monitored.items():
+                if wait and dev != Keyword.CoreDevice:
+                    try:
+                        self.waitForDevice(dev)
+                    except Exception as e:  # pragma: no cover
+                        errors.append(f"{dev}: {e}")
+                if dev in native:
+                    continue
+                for prop in names:
+                    try:
+                        after = self.getProperty(dev, prop)
+                    except Exception:  # pragma: no cover
+                        continue
+                    if (dev, prop) not in before or before[(dev, prop)] != after:
+                        relay.register_property_emission(dev, prop, after)
+                        changed.append((dev, prop, after))
+
+        for dev, prop, val in changed:
+            self.events.propertyChanged.emit(dev, prop, val)
+        if errors:
+            raise RuntimeError("Failed to set properties:\n  " + "\n  ".join(errors))
+
     def canSequenceEvents(
         self, e1: MDAEvent, e2: MDAEvent, cur_length: int = -1
     ) -> bool:
@@ -0,0 +1,174 @@
+"""Python-side mirror of the core's system state cache."""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from ._mmcore_plus import CMMCorePlus
+
+
+class StateMirror(Mapping[tuple[str, str], str]):
+    """A live, read-only mapping of `{(device, property): value}`.
+
+    This mirrors `CMMCorePlus.getSystemStateCache()`, but is populated only once and
+    then kept up to date by core signals:
+
+    - `propertyChanged` updates the value of a single property.
+    - `configSet` refreshes the devices in the applied preset.
+    - `stagePositionChanged`, `XYStagePositionChanged` and `exposureChanged`
+      refresh the properties of the device that moved (or changed exposure).
+    - `systemConfigurationLoaded` and `propertiesChanged` trigger a full rebuild.
+
+    Refreshes are lazy: they happen the next time the mirror is read, so reading
+    state is (most of the time) just a dict lookup.
+
+    Values reflect the last state reported by the core. Like the system state
+    cache, they may be stale if a device changes without notifying the core.
+
+    The `version` attribute is incremented every time the state may have changed,
+    so consumers can cheaply detect changes (and cache anything derived from the
+    state) by comparing it with the last version they saw, and update what they
+    derived using only the properties returned by `changes_since`.
+
+    Don't instantiate this directly; use
+    [`CMMCorePlus.getSystemStateMirror`][pymmcore_plus.CMMCorePlus.getSystemStateMirror].
+    """
+
+    def __init__(self, core: CMMCorePlus) -> None:
+        self._core_ref = weakref.ref(core)
+        self._data: dict[tuple[str, str], str] = {}
+        self._stale = True  # full rebuild required
+        self._dirty: set[str] = set()  # devices to refresh
+        self._version = 0
+        # {(device, property): version} of changed properties, latest change last
+        self._changed: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self._rebuilt = 0  # version of the last full rebuild
+        self._lock = threading.RLock()
+
+        ev = core.events
+        ev.propertyChanged.connect(self._on_property_changed)
+        ev.configSet.connect(self._on_config_set)
+        ev.stagePositionChanged.connect(self._mark_device)
+        ev.XYStagePositionChanged.connect(self._mark_device)
+        ev.exposureChanged.connect(self._mark_device)
+        ev.systemConfigurationLoaded.connect(self.invalidate)
+        ev.propertiesChanged.connect(self.invalidate)
+
+    @property
+    def version(self) -> int:
+        """Counter incremented whenever the mirrored state may have changed."""
+        return self._version
+
+    def invalidate(self) -> None:
+        """Rebuild the whole mirror (from `getSystemStateCache`) on next access."""
+        with self._lock:
+            self._stale = True
+            self._version += 1
+
+    def set_value(self, device: str, prop: str, value: Any) -> None:
+        """Record a new `value` for `(device, prop)`."""
+        value = str(value)
+        with self._lock:
+            if self._data.get((device, prop)) != value:
+                self._version += 1
+                self._set((device, prop), value)
+
+    def changes_since(self, version: int) -> dict[tuple[str, str], str] | None:
+        """Return `{(device, property): value}` of properties changed after `version`.
+
+        Returns None if the whole mirror has been rebuilt since `version` (in which
+        case anything derived from the state should be rebuilt too).
+        """
+        with self._lock:
+            data = self._sync()
+            if version < self._rebuilt:
+                return None
+            changes: dict[tuple[str, str], str] = {}
+            for key in reversed(self._changed):
+                if self._changed[key] <= version:
+                    break
+                changes[key] = data[key]
+            return changes
+
+    def device_state(self, device: str) -> dict[str, str]:
+        """Return `{property: value}` for all mirrored properties of `device`."""
+        return {p: v for (d, p), v in self._sync().items() if d == device}
+
+    # ----------------------- Mapping interface -----------------------
+
+    def __getitem__(self, key: tuple[str, str]) -> str:
+        return self._sync()[key]
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return iter(list(self._sync()))
+
+    def __len__(self) -> int:
+        return len(self._sync())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._sync()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} v{self._version} ({len(self)} properties)>"
+
+    # ------------------------- private -------------------------
+
+    def _sync(self) -> dict[tuple[str, str], str]:
+        """Perform any pending refreshes and return the underlying dict."""
+        if not (self._stale or self._dirty):
+            return self._data
+        if (core := self._core_ref()) is None:  # pragma: no cover
+            return self._data
+        with self._lock:
+            if self._stale:
+                self._stale = False
+                self._dirty.clear()
+                self._data = {
+                    (dev, prop): str(val)
+                    for dev, prop, val in core.getSystemStateCache()
+                }
+                self._changed.clear()
+                self._rebuilt = self._version
+            while self._dirty:
+                device = self._dirty.pop()
+                with suppress(Exception):
+                    for prop in core.getDevicePropertyNames(device):
+                        with suppress(Exception):
+                            val = str(core.getPropertyFromCache(device, prop))
+                            if self._data.get((device, prop)) != val:
+                                self._set((device, prop), val)
+        return self._data
+
+    def _set(self, key: tuple[str, str], value: str) -> None:
+        """Store `value`, and record that `key` changed in the current version."""
+        self._data[key] = value
+        self._changed[key] = self._version
+        self._changed.move_to_end(key)
+
+    def _on_property_changed(self, device: str, prop: str, value: Any) -> None:
+        self.set_value(device, prop, value)
+
+    def _mark_device(self, device: str, *_: Any) -> None:
+        with self._lock:
+            self._dirty.add(device)
+            self._version += 1
+
+    def _on_config_set(self, group: str, preset: str) -> None:
+        if (core := self._core_ref()) is None:  # pragma: no cover
+            return
+        try:
+            devices = {dev for dev, *_ in core.getConfigData(group, preset)}
+        except Exception:
+            self.invalidate()
+            return
+        with self._lock:
+            self._dirty.update(devices)
+            self._version += 1
@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Literal
+
+from pymmcore_plus._logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    import numpy as np
+    from typing_extensions import Self  # py311
+
+    from ._metadata import Metadata
+    from ._mmcore_plus import CMMCorePlus
+
+    DropPolicy = Literal["drop_oldest", "drop_newest", "latest"]
+
+DROP_POLICIES = ("drop_oldest", "drop_newest", "latest")
+
+
+class FrameStream:
+    """Frames of a continuous sequence acquisition, drained on a background thread.
+
+    Use [`CMMCorePlus.stream`][pymmcore_plus.CMMCorePlus.stream] to create one.
+
+    While the stream is running, a background thread pops every image (and its
+    metadata) from the circular buffer as soon as it arrives, so the buffer doesn't
+    overflow however slowly the frames are consumed.  Frames are kept in a queue of at
+    most `maxsize` frames, from which they are yielded by iterating over the stream.
+    Frames that don't fit in the queue (or that arrive faster than `fps`) are
+    dropped, and counted in `frames_dropped`.
+
+    Parameters
+    ----------
+    core : CMMCorePlus
+        The core to stream from.
+    fps : float | None
+        Maximum number of frames per second to queue.  Frames arriving sooner than
+        `1/fps` after the last queued frame are dropped.  By default, all frames are
+        queued.
+    drop_policy : {"drop_oldest", "drop_newest", "latest"}
+        What to do when the queue is full: drop the oldest queued frame (the default),
+        or the newly arrived frame.  `"latest"` only ever keeps the most recent frame
+        (i.e. `maxsize=1` and `"drop_oldest"`).
+    maxsize : int
+        Maximum number of frames in the queue, by default 8.
+    interval_ms : float
+        Interval between frames, passed to `startContinuousSequenceAcquisition`.
+    """
+
+    def __init__(
+        self,
+        core: CMMCorePlus,
+        *,
+        fps: float | None = None,
+        drop_policy: DropPolicy = "drop_oldest",
+        maxsize: int = 8,
+        interval_ms: float = 0,
+    ) -> None:
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(
+                f"drop_policy must be one of {DROP_POLICIES}, got {drop_policy!r}"
+            )
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self._core = core
+        self.fps = fps
+        self.drop_policy = drop_policy
+        self.maxsize = 1 if drop_policy == "latest" else maxsize
+        self.interval_ms = interval_ms
+
+        self._queue: deque[tuple[np.ndarray, Metadata]] = deque()
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started_acquisition = False
+        self._error: BaseException | None = None
+        self._frames_received = 0
+        self._frames_dropped = 0
+        self._last_queued = -float("inf")
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.stop()
+
+    def __iter__(self) -> Iterator[tuple[np.ndarray, Metadata]]:
+        """Yield `(image, metadata)` until the stream is stopped.
+
+        If the stream isn't running, it is started, and stopped when iteration ends
+        (e.g. on `break`).
+        """
+        owner = not self.is_running()
+        if owner:
+            self.start()
+        try:
+            while (item := self.get()) is not None:
+                yield item
+        finally:
+            if owner:
+                self.stop()
+
+    @property
+    def frames_received(self) -> int:
+        """Number of frames popped from the circular buffer since `start`."""
+        return self._frames_received
+
+    @property
+    def frames_dropped(self) -> int:
+        """Number of received frames that were dropped since `start`."""
+        return self._frames_dropped
+
+    def is_running(self) -> bool:
+        """Return True if the drain thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the continuous acquisition (if needed) and the drain thread."""
+        if self.is_running():
+            return
+        core = self._core
+        self._stop.clear()
+        self._error = None
+        self._queue.clear()
+        self._frames_received = self._frames_dropped = 0
+        self._last_queued = -float("inf")
+        if not core.isSequenceRunning():
+            core.startContinuousSequenceAcquisition(self.interval_ms)
+            self._started_acquisition = True
+        self._thread = threading.Thread(
+            target=self._drain, name="FrameStream", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the drain thread, and the acquisition if it was started by `start`."""
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread is not None:
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+        if self._started_acquisition:
+            self._started_acquisition = False
+            self._core.stopSequenceAcquisition()
+
+    def get(self, timeout: float | None = None) -> tuple[np.ndarray, Metadata] | None:
+        """Return the next `(image, metadata)`, or None if stopped (or timed out).
+
+        Any error raised on the drain thread is re-raised here.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        with self._cond:
+            while not self._queue:
+                if self._error is not None:
+                    raise self._error
+                if self._stop.is_set():
+                    return None
+                remaining = None if deadline is None else deadline - time.perf_counter()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self._cond.wait(remaining)
+            return self._queue.popleft()
+
+    def _drain(self) -> None:
+        core = self._core
+        # poll at (roughly) twice the frame rate, for at most 10 ms
+        poll = min(max(core.getExposure(), self.interval_ms) / 2000, 0.01)
+        overflow_logged = False
+        try:
+            while not self._stop.is_set():
+                if not core.getRemainingImageCount():
+                    if not core.isSequenceRunning():
+                        break
+                    if core.isBufferOverflowed() and not overflow_logged:
+                        logger.warning("Circular buffer overflowed while streaming.")
+                        overflow_logged = True
+                    self._stop.wait(poll)
+                    continue
+                self._put(core.popNextImageAndMD())
+        except Exception as e:
+            self._error = e
+        finally:
+            self._stop.set()
+            with self._cond:
+                self._cond.notify_all()
+
+    def _put(self, item: tuple[np.ndarray, Metadata]) -> None:
+        self._frames_received += 1
+        now = time.perf_counter()
+        if self.fps and now - self._last_queued < 1 / self.fps:
+            self._frames_dropped += 1
+            return
+        with self._cond:
+            if len(self._queue) >= self.maxsize:
+                self._frames_dropped += 1
+                if self.drop_policy == "drop_newest":
+                    return
+                self._queue.popleft()
+            self._queue.append(item)
+            self._last_queued = now
+            self._cond.notify()
@@ -0,0 +1,225 @@
+"""Builder for the metadata tags returned by `CMMCorePlus.getTags`."""
+
+from __future__ import annotations
+
+import time
+import weakref
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, Literal
+
+from ._constants import Keyword, PixelType
+
+if TYPE_CHECKING:
+    from typing import TypeAlias
+
+    from ._metadata import Metadata
+    from ._mmcore_plus import CMMCorePlus
+
+TagProfile: TypeAlias = Literal["minimal", "mmcorej", "full"]
+
+# Sections of tags that make up each profile.
+#   image:      BitDepth, Width, Height, PixelType, ROI, Binning
+#   pixel_size: PixelSizeUm, PixelSizeAffine
+#   state:      "<device>-<property>" for every property in the system state cache
+#   channel:    Channel (current preset of the channel group)
+#   indices:    Frame, Position, Slice (and their *Index), ChannelIndex (MMCoreJ)
+#   camera:     Camera, CameraChannelIndex, ChannelIndex (for a given channel_index)
+#   time:       Time, PerfCounter
+#   position:   XPositionUm, YPositionUm, ZPositionUm (read from the stages)
+TAG_PROFILES: dict[str, frozenset[str]] = {
+    "minimal": frozenset({"image", "pixel_size", "camera", "time"}),
+    "mmcorej": frozenset(
+        {"image", "pixel_size", "state", "channel", "indices", "camera", "time"}
+    ),
+    "full": frozenset(
+        {
+            "image",
+            "pixel_size",
+            "state",
+            "channel",
+            "indices",
+            "camera",
+            "time",
+            "position",
+        }
+    ),
+}
+DEFAULT_TAG_PROFILE: TagProfile = "mmcorej"
+
+# these are always the same (for MMCoreJ compatibility)
+_INDEX_TAGS = {
+    "Frame": 0,
+    "FrameIndex": 0,
+    "Position": "Default",
+    "PositionIndex": 0,
+    "Slice": 0,
+    "SliceIndex": 0,
+    "ChannelIndex": 0,
+}
+
+
+class TagBuilder:
+    """Builds tag dicts for images, caching whatever doesn't change per frame.
+
+    The image geometry/pixel size tags are cached and invalidated by core signals
+    (`roiSet`, `pixelSizeChanged`, `propertyChanged`, `configSet`, etc...).  The
+    system state tags are derived from the core's `StateMirror`: when its version
+    changes, only the tags of the properties that changed are updated (they are only
+    rebuilt from scratch when the mirror itself is).
+    """
+
+    def __init__(self, core: CMMCorePlus) -> None:
+        self._core_ref = weakref.ref(core)
+        self._static: dict[str, Any] | None = None
+        # (state mirror version, "<device>-<property>" tags)
+        self._state: tuple[int, dict[str, str]] = (-1, {})
+        self._channel: str | None = None
+        # (second, formatted-second) for the Time tag
+        self._time_prefix: tuple[int, str] = (-1, "")
+
+        ev = core.events
+        for sig in (
+            ev.roiSet,
+            ev.pixelSizeChanged,
+            ev.pixelSizeAffineChanged,
+            ev.imageSnapped,
+            ev.continuousSequenceAcquisitionStarting,
+            ev.sequenceAcquisitionStopped,
+        ):
+            sig.connect(self.invalidate_static)
+        for sig in (ev.systemConfigurationLoaded, ev.propertiesChanged, ev.configSet):
+            sig.connect(self.invalidate)
+        ev.channelGroupChanged.connect(self._invalidate_channel)
+        ev.propertyChanged.connect(self._on_property_changed)
+
+    def invalidate(self, *_: Any) -> None:
+        """Clear all cached tags."""
+        self._static = self._channel = None
+
+    def invalidate_static(self, *_: Any) -> None:
+        """Clear the cached image geometry and pixel size tags."""
+        self._static = None
+
+    def _invalidate_channel(self, *_: Any) -> None:
+        self._channel = None
+
+    def _on_property_changed(self, device: str, prop: str, value: str) -> None:
+        # any property may change the current channel preset
+        self._channel = None
+        # camera properties (e.g. binning) may change the image geometry,
+        # and core properties may change the current camera.
+        if device == Keyword.CoreDevice or (
+            (core := self._core_ref()) is not None and device == core.getCameraDevice()
+        ):
+            self._static = None
+
+    # ------------------------------------------------------------------
+
+    def build(
+        self,
+        meta: Metadata | None = None,
+        channel_index: int | None = None,
+        profile: TagProfile | str = DEFAULT_TAG_PROFILE,
+    ) -> dict[str, Any]:
+        if (core := self._core_ref()) is None:  # pragma: no cover
+            raise RuntimeError("The CMMCorePlus instance has been garbage collected.")
+        try:
+            sections = TAG_PROFILES[profile]
+        except KeyError:
+            raise ValueError(
+                f"Unknown tag profile {profile!r}. Must be one of {set(TAG_PROFILES)}"
+            ) from None
+
+        tags = dict(meta) if meta else {}
+        if "state" in sections:
+            mirror = core.getSystemStateMirror()
+            last_version, state = self._state
+            if last_version != mirror.version:
+                # read the version first: changes while updating trigger another update
+                version = mirror.version
+                if (changes := mirror.changes_since(last_version)) is None:
+                    state = {f"{d}-{p}": val for (d, p), val in mirror.items()}
+                else:
+                    for (dev, prop), val in changes.items():
+                        state[f"{dev}-{prop}"] = val
+                self._state = (version, state)
+            tags.update(state)
+
+        if (static := self._static) is None:
+            static = self._static = _static_tags(core)
+        if "image" in sections:
+            tags.update(static["image"])
+        if "pixel_size" in sections:
+            tags.update(static["pixel_size"])
+
+        if "indices" in sections:
+            tags.update(_INDEX_TAGS)
+        if "channel" in sections:
+            if (channel := self._channel) is None:
+                channel = self._channel = _current_channel(core)
+            tags["Channel"] = channel
+
+        if channel_index is not None and "camera" in sections:
+            tags["CameraChannelIndex"] = channel_index
+            tags["ChannelIndex"] = channel_index
+            tags["Camera"] = core.getPhysicalCameraDevice(channel_index)
+
+        if "position" in sections:
+            with suppress(Exception):
+                if core.getXYStageDevice():
+                    x, y = core.getXYPosition()
+                    tags["XPositionUm"] = x
+                    tags["YPositionUm"] = y
+            with suppress(Exception):
+                if core.getFocusDevice():
+                    tags["ZPositionUm"] = core.getZPosition()
+
+        if "time" in sections:
+            # these are added by AcqEngJ
+            # yyyy-MM-dd HH:mm:ss.mmmmmm  # NOTE AcqEngJ omits microseconds
+            tags["Time"] = self._now()
+            # used by Runner
+            tags["PerfCounter"] = time.perf_counter()
+        return tags
+
+    def _now(self) -> str:
+        """Current local time as `%Y-%m-%d %H:%M:%S.%f` (faster than datetime)."""
+        now = time.time()
+        sec = int(now)
+        if (prefix := self._time_prefix)[0] != sec:
+            fmt = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(sec))
+            prefix = self._time_prefix = (sec, fmt)
+        return f"{prefix[1]}.{int((now - sec) * 1e6):06d}"
+
+
+def _static_tags(core: CMMCorePlus) -> dict[str, dict[str, Any]]:
+    image: dict[str, Any] = {
+        "BitDepth": core.getImageBitDepth(),
+        "ROI": "-".join(str(x) for x in core.getROI()),
+        "Width": core.getImageWidth(),
+        "Height": core.getImageHeight(),
+        "PixelType": str(
+            PixelType.for_bytes(core.getBytesPerPixel(), core.getNumberOfComponents())
+        ),
+    }
+    with suppress(Exception):
+        image["Binning"] = core.getProperty(core.getCameraDevice(), Keyword.Binning)
+
+    # NOTE: AcqEngJ appears to also add this as PixelSize_um
+    # while MMCoreJ uses PixelSizeUm?  not sure why both are needed
+    affine = core.getPixelSizeAffine(True)  # true == cached
+    pixel_size = {
+        "PixelSizeUm": core.getPixelSizeUm(True),  # true == cached
+        "PixelSizeAffine": ";".join(str(x) for x in affine),
+    }
+    return {"image": image, "pixel_size": pixel_size}
+
+
+def _current_channel(core: CMMCorePlus) -> str:
+    try:
+        channel_group = core.getPropertyFromCache(
+            Keyword.CoreDevice, Keyword.CoreChannelGroup
+        )
+        return str(core.getCurrentConfigFromCache(channel_group))
+    except Exception:
+        return "Default"
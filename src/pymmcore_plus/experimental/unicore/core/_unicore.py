@@ -529,6 +529,7 @@ class UniMMCore(CMMCorePlus):
         with self._pydevices[label] as dev:
             value = dev.get_property_value(propName)
             self._state_cache[(label, propName)] = value
+        self._state_mirror.set_value(label, propName, value)
         return value
 
     def getPropertyFromCache(
@@ -562,6 +563,7 @@ class UniMMCore(CMMCorePlus):
         with self._pydevices[label] as dev:
             dev.set_property_value(propName, propValue)
             self._state_cache[(label, propName)] = propValue
+        self._state_mirror.set_value(label, propName, propValue)
 
     def getPropertyType(self, label: str, propName: str) -> PropertyType:
         if label not in self._pydevices:  # pragma: no cover
@@ -1,5 +1,7 @@
 from ._engine import MDAEngine
+from ._estimate import SequenceEstimate, estimate_sequence
 from ._protocol import PMDAEngine
+from ._recent_frames import RecentFrames
 from ._runner import (
     FinishReason,
     MDARunner,
@@ -17,9 +19,12 @@ __all__ = [
     "MDARunner",
     "PMDAEngine",
     "PMDASignaler",
+    "RecentFrames",
     "RunState",
     "RunnerStatus",
+    "SequenceEstimate",
     "SkipEvent",
     "SupportsFrameReady",
+    "estimate_sequence",
     "mda_listeners_connected",
 ]
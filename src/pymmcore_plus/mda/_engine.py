@@ -6,7 +6,7 @@ import weakref
 from collections import defaultdict
 from contextlib import suppress
 from functools import cache
-from typing import TYPE_CHECKING, Literal, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
 
 import numpy as np
 import useq
@@ -163,6 +163,16 @@ class MDAEngine(PMDAEngine):
         # sequence of (device, property) of all properties used in any of the presets
         # in the channel group.
         self._config_device_props: dict[str, Sequence[tuple[str, str]]] = {}
+        # (device, property, value) settings of each (group, preset).
+        self._config_data: dict[tuple[str, str], Sequence[tuple[str, str, str]]] = {}
+
+        # shadow of the last applied/reported value of each (device, property) and
+        # of the exposure of each camera.  Used to send only the properties that
+        # differ between consecutive events. Kept in sync with `propertyChanged` and
+        # `exposureChanged` while a sequence is running, and reset at the start of
+        # every sequence.
+        self._prop_shadow: dict[tuple[str, str], str] = {}
+        self._exposure_shadow: dict[str, float] = {}
 
     @property
     def include_frame_position_metadata(self) -> IncludePositionArg:
@@ -233,6 +243,8 @@ class MDAEngine(PMDAEngine):
         # https://github.com/pymmcore-plus/pymmcore-plus/issues/503
         core._last_config = ("", "")  # noqa: SLF001
         core._last_xy_position.clear()  # noqa: SLF001
+        self._reset_shadow()
+        self._connect_shadow(core, True)
 
         self._update_config_device_props()
         # get if the autofocus is engaged at the start of the sequence
@@ -386,7 +398,7 @@ class MDAEngine(PMDAEngine):
         mmcore = self.mmcore
         if event.exposure is not None:
             try:
-                mmcore.setExposure(event.exposure)
+                self._set_event_exposure(event.exposure)
             except Exception as e:
                 logger.warning("Failed to set exposure. %s", e)
         if event.properties is not None:
@@ -495,6 +507,9 @@ class MDAEngine(PMDAEngine):
 
     def teardown_sequence(self, sequence: MDASequence) -> None:
         """Perform any teardown required after the sequence has been executed."""
+        if core := self._mmcore_ref():
+            self._connect_shadow(core, False)
+
         # restore initial state if enabled and state was captured
         if self.restore_initial_state and self._initial_state:
             self._restore_initial_state()
@@ -716,12 +731,19 @@ class MDAEngine(PMDAEngine):
         if event.exposure_sequence:
             core.startExposureSequence(core.getCameraDevice())
         elif event.exposure is not None:
-            core.setExposure(event.exposure)
+            self._set_event_exposure(event.exposure)
 
         if event.property_sequences:
             for dev, prop in event.property_sequences:
                 core.startPropertySequence(dev, prop)
 
+        # we don't know where sequenced values will be left at the end of the
+        # sequence: make sure they are sent again by the next event.
+        for key in event.property_sequences:
+            self._prop_shadow.pop(key, None)
+        if event.exposure_sequence:
+            self._exposure_shadow.pop(core.getCameraDevice(), None)
+
     def _await_sequence_acquisition(
         self, timeout: float = 5.0, poll_interval: float = 0.2
     ) -> None:
@@ -1010,17 +1032,70 @@ class MDAEngine(PMDAEngine):
         if (ch := event.channel) is None:
             return
 
-        # comparison with _last_config is a fast/rough check ... which may miss subtle
-        # differences if device properties have been individually set in the meantime.
-        # could also compare to the system state, with:
-        # data = self.mmcore.getConfigData(ch.group, ch.config)
-        # if self.mmcore.getSystemStateCache().isConfigurationIncluded(data):
-        #     ...
-        if (ch.group, ch.config) != self.mmcore._last_config:  # noqa: SLF001
-            try:
-                self.mmcore.setConfig(ch.group, ch.config)
-            except Exception as e:
-                logger.warning("Failed to set channel. %s", e)
+        core = self.mmcore
+        key = (ch.group, ch.config)
+        try:
+            if (data := self._config_data.get(key)) is None:
+                data = self._config_data[key] = tuple(core.getConfigData(*key))
+
+            # Only send the properties whose last known value differs from the
+            # preset.  Changes made in the meantime (by this engine or elsewhere) are
+            # tracked in the shadow via the propertyChanged signal.
+            shadow = self._prop_shadow
+            changed = [(d, p, v) for d, p, v in data if shadow.get((d, p)) != v]
+            if changed and len(changed) == len(data):
+                core.setConfig(*key)
+            else:
+                core.setProperties(changed, skip_unchanged=False, wait=False)
+                if key != core._last_config:  # noqa: SLF001
+                    # emit configSet as `core.setConfig` would have done
+                    core._last_config = key  # noqa: SLF001
+                    core.events.configSet.emit(*key)
+        except Exception as e:
+            logger.warning("Failed to set channel. %s", e)
+            return
+        shadow.update(((d, p), v) for d, p, v in changed)
+
+    def _set_event_exposure(self, exposure: float) -> None:
+        """Set the exposure of the current camera, unless it is already set."""
+        core = self.mmcore
+        camera = core.getCameraDevice()
+        if self._exposure_shadow.get(camera) != exposure:
+            core.setExposure(exposure)
+            self._exposure_shadow[camera] = exposure
+
+    # ----------------- shadow of applied device properties -----------------
+
+    def _reset_shadow(self) -> None:
+        self._prop_shadow.clear()
+        self._exposure_shadow.clear()
+        self._config_data.clear()
+
+    def _connect_shadow(self, core: CMMCorePlus, connect: bool) -> None:
+        """(Dis)connect the signals that keep the property shadow in sync."""
+        ev = core.events
+        slots = [
+            (ev.propertyChanged, self._on_shadow_property_changed),
+            (ev.exposureChanged, self._on_shadow_exposure_changed),
+            (ev.configDefined, self._on_shadow_config_changed),
+            (ev.configDeleted, self._on_shadow_config_changed),
+            (ev.systemConfigurationLoaded, self._reset_shadow),
+        ]
+        for signal, slot in slots:
+            # disconnect first so that we never connect twice
+            with suppress(Exception):
+                signal.disconnect(slot)
+            if connect:
+                signal.connect(slot)
+
+    def _on_shadow_property_changed(self, device: str, prop: str, value: str) -> None:
+        self._prop_shadow[(device, prop)] = value
+
+    def _on_shadow_exposure_changed(self, device: str, value: float) -> None:
+        self._exposure_shadow[device] = value
+
+    def _on_shadow_config_changed(self, group: str, preset: str, *_: Any) -> None:
+        self._config_data.pop((group, preset), None)
 
     def _set_event_z(self, event: MDAEvent) -> None:
         # skip if no Z stage device is found
@@ -1033,8 +1108,12 @@ class MDAEngine(PMDAEngine):
         self.mmcore.setZPosition(cast("float", event.z_pos) + correction)
 
     def _set_event_properties(self, properties: Sequence[useq.PropertyTuple]) -> None:
-        """Set device properties, using setPosition for stage devices."""
+        """Set device properties, using setPosition for stage devices.
+
+        All other properties are set in a single batch with `core.setProperties`.
+        """
         core = self.mmcore
+        batch: dict[tuple[str, str], Any] = {}
         for dev, prop, value in properties:
             try:
                 if prop == Keyword.Position:
@@ -1052,13 +1131,18 @@ class MDAEngine(PMDAEngine):
                     elif dev_type == DeviceType.Stage:
                         core.setPosition(dev, float(value))
                     else:
-                        core.setProperty(dev, prop, value)
+                        batch[(dev, prop)] = value
                 else:
-                    core.setProperty(dev, prop, value)
+                    batch[(dev, prop)] = value
             except Exception as e:
                 logger.warning(
                     "Failed to set property %s of device %s. %s", prop, dev, e
                 )
+        if batch:
+            try:
+                core.setProperties(batch)
+            except Exception as e:
+                logger.warning("%s", e)
 
     def _set_event_roi(self, event: MDAEvent) -> None:
         """Set the camera ROI for this event.
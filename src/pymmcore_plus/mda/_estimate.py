@@ -0,0 +1,388 @@
+"""Dry-run timing estimates for MDA sequences."""
+
+from __future__ import annotations
+
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from useq import AcquireImage, HardwareAutofocus
+
+from pymmcore_plus.core._constants import Keyword
+from pymmcore_plus.core._sequencing import SequencedEvent, iter_sequenced_events
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+    from useq import MDAEvent
+
+    from pymmcore_plus import CMMCorePlus
+    from pymmcore_plus.core import LatencyProfile
+
+__all__ = ["SequenceEstimate", "estimate_sequence"]
+
+# camera properties (in ms) that are commonly used by device adapters to report
+# the sensor readout time.
+_READOUT_PROPS = ("ReadoutTime", "Readout Time", "ReadoutTime(ms)")
+_CAUSES = (
+    "waiting",
+    "xy_travel",
+    "z_travel",
+    "device_delays",
+    "shutter",
+    "exposure",
+    "readout",
+)
+STATE_PROPS = (Keyword.State, Keyword.Label)
+
+
+@dataclass(frozen=True, slots=True)
+class SequenceEstimate:
+    """Estimated cost of running a sequence of events on a given core.
+
+    Returned by [`estimate_sequence`][pymmcore_plus.mda.estimate_sequence].
+
+    Attributes
+    ----------
+    total_s : float
+        Estimated total duration of the acquisition, in seconds.
+    breakdown_s : Mapping[str, float]
+        Estimated time spent on each cause, in seconds. Keys are `"waiting"`
+        (idle time imposed by `min_start_time`), `"xy_travel"`, `"z_travel"`,
+        `"device_delays"`, `"shutter"`, `"exposure"`, and `"readout"`.
+    n_events : int
+        Number of (unsequenced) `MDAEvent`s in the input.
+    n_images : int
+        Number of images that will be acquired (including all camera channels).
+    n_sequenced_events : int
+        Number of `SequencedEvent`s that the events were combined into.
+    max_sequence_length : int
+        Length of the longest `SequencedEvent`. (0 if nothing is sequenced.)
+    n_autofocus : int
+        Number of hardware autofocus events. These are not included in `total_s`.
+    peak_buffer_bytes : int
+        Largest number of bytes that a single hardware-triggered sequence will
+        place in the circular buffer.
+    buffer_capacity_bytes : int
+        Size of the core's circular buffer, in bytes.
+    """
+
+    total_s: float = 0.0
+    breakdown_s: Mapping[str, float] = field(default_factory=dict)
+    n_events: int = 0
+    n_images: int = 0
+    n_sequenced_events: int = 0
+    max_sequence_length: int = 0
+    n_autofocus: int = 0
+    peak_buffer_bytes: int = 0
+    buffer_capacity_bytes: int = 0
+
+    @property
+    def fits_in_buffer(self) -> bool:
+        """Whether the largest sequence fits in the circular buffer."""
+        return self.peak_buffer_bytes <= self.buffer_capacity_bytes
+
+
+def estimate_sequence(
+    core: CMMCorePlus,
+    events: Iterable[MDAEvent],
+    *,
+    use_hardware_sequencing: bool | None = None,
+    xy_speed: float | None = None,
+    z_speed: float | None = None,
+    profile: LatencyProfile | None = None,
+) -> SequenceEstimate:
+    """Estimate how long `events` will take to run on `core`, without moving hardware.
+
+    Events are combined into `SequencedEvent`s exactly as the default
+    [`MDAEngine`][pymmcore_plus.mda.MDAEngine] would (using
+    [`iter_sequenced_events`][pymmcore_plus.core.iter_sequenced_events]), and the
+    cost of each event is modeled from the currently loaded devices:
+
+    - exposure (from the event, or the current camera exposure)
+    - camera readout time (from a `ReadoutTime` camera property, if present)
+    - stage travel, from a calibrated latency profile, or given `xy_speed` and
+      `z_speed`
+    - state device switching times (from a latency profile) and device delays
+      (`core.getDeviceDelayMs`) of every device that is moved or whose
+      properties change between events
+    - shutter latency (from a latency profile) when autoshutter is enabled
+    - idle time imposed by each event's `min_start_time`
+
+    Only getters are called on `core`; no hardware is moved.
+
+    Parameters
+    ----------
+    core : CMMCorePlus
+        A core with a loaded configuration.
+    events : Iterable[MDAEvent]
+        The events to estimate. This may be a `useq.MDASequence`.
+    use_hardware_sequencing : bool | None
+        Whether to combine events into hardware-triggered sequences. If `None`
+        (the default), the value of `core.mda.engine.use_hardware_sequencing` is used.
+    xy_speed : float | None
+        Speed of the XY stage in µm/ms. If `None` (the default), XY moves are
+        assumed to be instantaneous (aside from the stage's device delay).
+    z_speed : float | None
+        Speed of the focus stage in µm/ms. If `None` (the default), Z moves are
+        assumed to be instantaneous (aside from the stage's device delay).
+    profile : LatencyProfile | None
+        Calibrated device latencies (see
+        [`profile_latencies`][pymmcore_plus.core.profile_latencies]). If `None`
+        (the default), `core.getLatencyProfile()` is used. Devices found in the
+        profile take precedence over `xy_speed`, `z_speed` and device delays.
+
+    Returns
+    -------
+    SequenceEstimate
+        The estimated time, broken down by cause, along with sequencing and
+        buffer statistics.
+    """
+    if use_hardware_sequencing is None:
+        engine = core.mda.engine
+        use_hardware_sequencing = getattr(engine, "use_hardware_sequencing", True)
+
+    if profile is None:
+        profile = core.getLatencyProfile()
+
+    est = _Estimator(core, xy_speed=xy_speed, z_speed=z_speed, profile=profile)
+    _events = iter_sequenced_events(core, events) if use_hardware_sequencing else events
+    for event in _events:
+        est.feed(event)
+    return est.result()
+
+
+class _Estimator:
+    """Simulated clock that accumulates the cost of each event."""
+
+    def __init__(
+        self,
+        core: CMMCorePlus,
+        *,
+        xy_speed: float | None = None,
+        z_speed: float | None = None,
+        profile: LatencyProfile | None = None,
+    ) -> None:
+        self.core = core
+        self.xy_speed = xy_speed
+        self.z_speed = z_speed
+        self.profile = profile
+
+        self.breakdown: dict[str, float] = dict.fromkeys(_CAUSES, 0.0)
+        self.n_events = 0
+        self.n_images = 0
+        self.n_sequenced = 0
+        self.max_seq_len = 0
+        self.n_autofocus = 0
+        self.peak_buffer = 0
+
+        # simulated clocks, in ms
+        self._now = 0.0
+        self._event_t0 = 0.0
+
+        self._xy_stage = core.getXYStageDevice()
+        self._focus = core.getFocusDevice()
+        self._camera = core.getCameraDevice()
+        self._shutter = core.getShutterDevice() if core.getAutoShutter() else ""
+        self._n_cam_channels = max(core.getNumberOfCameraChannels(), 1)
+        self._exposure = core.getExposure() if self._camera else 0.0
+        self._readout = self._readout_ms()
+        self._image_bytes = core.getImageBufferSize() if self._camera else 0
+
+        self._xy: tuple[float, float] | None = None
+        self._z: float | None = None
+        with suppress(Exception):
+            if self._xy_stage:
+                self._xy = tuple(core.getXYPosition())  # type: ignore [assignment]
+        with suppress(Exception):
+            if self._focus:
+                self._z = core.getPosition(self._focus)
+
+        self._last_config: tuple[str, str] | None = None
+        self._last_props: dict[tuple[str, str], str] = {}
+        self._delays: dict[str, float] = {}
+
+    # -------------------------------------------------------------
+
+    def feed(self, event: MDAEvent) -> None:
+        if event.reset_event_timer:
+            self._event_t0 = self._now
+
+        # idle time imposed by the time plan
+        if event.min_start_time:
+            go_at = self._event_t0 + event.min_start_time * 1000
+            if go_at > self._now:
+                self._add("waiting", go_at - self._now)
+
+        if isinstance(event.action, HardwareAutofocus):
+            self.n_autofocus += 1
+            return
+        if not isinstance(event.action, (AcquireImage, type(None))):
+            return
+
+        if isinstance(event, SequencedEvent):
+            self._feed_sequenced(event)
+        else:
+            self._feed_single(event)
+
+    def _feed_single(self, event: MDAEvent) -> None:
+        self.n_events += 1
+        self._setup_costs(event, move_xy=True, move_z=True)
+        exposure = self._exposure if event.exposure is None else event.exposure
+        self._exposure = exposure
+        self._add_shutter_cost()
+        self._add("exposure", exposure)
+        self._add("readout", self._readout * self._n_cam_channels)
+        self.n_images += self._n_cam_channels
+
+    def _feed_sequenced(self, event: SequencedEvent) -> None:
+        n = len(event.events)
+        self.n_events += n
+        self.n_sequenced += 1
+        self.max_seq_len = max(self.max_seq_len, n)
+        self._setup_costs(
+            event, move_xy=not event.x_sequence, move_z=not event.z_sequence
+        )
+
+        exposure = self._exposure if event.exposure is None else event.exposure
+        exposures = event.exposure_sequence or (exposure,) * n
+        self._exposure = exposures[-1]
+        self._add_shutter_cost()
+        # in a hardware-triggered sequence, readout of one frame overlaps with the
+        # exposure of the next, so only the non-overlapping part adds to the total
+        for exp in exposures:
+            self._add("exposure", exp)
+            self._add("readout", max(self._readout - exp, 0))
+
+        if event.x_sequence:
+            self._xy = (event.x_sequence[-1], event.y_sequence[-1])
+        if event.z_sequence:
+            self._z = event.z_sequence[-1]
+
+        n_images = n * self._n_cam_channels
+        self.n_images += n_images
+        self.peak_buffer = max(self.peak_buffer, n_images * self._image_bytes)
+
+    def _setup_costs(self, event: MDAEvent, *, move_xy: bool, move_z: bool) -> None:
+        """Accumulate stage travel and device delays required to setup `event`."""
+        # time for each device to settle (waitForSystem after setup_event)
+        settle: dict[str, float] = {}
+        profile = self.profile
+
+        if move_xy and (event.x_pos is not None or event.y_pos is not None):
+            start = end = self._xy
+            if start is not None:
+                x0, y0 = start
+                x = x0 if event.x_pos is None else event.x_pos
+                y = y0 if event.y_pos is None else event.y_pos
+                self._xy = end = (x, y)
+            if stage := self._xy_stage:
+                ms = None
+                if profile and start and end:
+                    ms = profile.xy_move_ms(stage, start, end)
+                if ms is None:
+                    settle[stage] = self._delay(stage)
+                    if start and end and self.xy_speed:
+                        # XY stages generally move both axes simultaneously
+                        dist = max(abs(end[0] - start[0]), abs(end[1] - start[1]))
+                        ms = dist / self.xy_speed
+                self._add("xy_travel", ms or 0.0)
+
+        if move_z and event.z_pos is not None:
+            z0, self._z = self._z, event.z_pos
+            if focus := self._focus:
+                ms = None
+                if profile and z0 is not None:
+                    ms = profile.stage_move_ms(focus, z0, event.z_pos)
+                if ms is None:
+                    settle[focus] = self._delay(focus)
+                    if z0 is not None and self.z_speed:
+                        ms = abs(event.z_pos - z0) / self.z_speed
+                self._add("z_travel", ms or 0.0)
+
+        changes: list[tuple[str, str, str]] = []
+        if (ch := event.channel) is not None:
+            if (ch.group, ch.config) != self._last_config:
+                self._last_config = (ch.group, ch.config)
+                with suppress(Exception):
+                    changes.extend(self.core.getConfigData(ch.group, ch.config))
+        changes.extend((d, p, str(v)) for d, p, v in event.properties or ())
+
+        for dev, prop, val in changes:
+            if (old := self._prop_value(dev, prop)) == val:
+                continue
+            self._last_props[(dev, prop)] = val
+            ms = None
+            if profile and prop in STATE_PROPS:
+                a, b = self._state(dev, prop, old), self._state(dev, prop, val)
+                if a is not None and b is not None:
+                    ms = profile.state_switch_ms(dev, a, b)
+            settle[dev] = max(
+                settle.get(dev, 0.0), self._delay(dev) if ms is None else ms
+            )
+
+        if settle:
+            # devices settle in parallel: the system wait is the longest delay.
+            self._add("device_delays", max(settle.values()))
+
+    # -------------------------------------------------------------
+
+    def _add(self, key: str, ms: float) -> None:
+        self.breakdown[key] += ms
+        self._now += ms
+
+    def _delay(self, device: str) -> float:
+        if device not in self._delays:
+            delay = 0.0
+            with suppress(Exception):
+                delay = self.core.getDeviceDelayMs(device)
+            self._delays[device] = delay
+        return self._delays[device]
+
+    def _add_shutter_cost(self) -> None:
+        """Autoshutter opens and closes the shutter around each exposure/sequence."""
+        if self.profile and self._shutter:
+            open_ms = self.profile.shutter_ms(self._shutter, open=True) or 0.0
+            close_ms = self.profile.shutter_ms(self._shutter, open=False) or 0.0
+            self._add("shutter", open_ms + close_ms)
+
+    def _prop_value(self, device: str, prop: str) -> str | None:
+        key = (device, prop)
+        if key not in self._last_props:
+            with suppress(Exception):
+                self._last_props[key] = self.core.getPropertyFromCache(device, prop)
+        return self._last_props.get(key)
+
+    def _state(self, device: str, prop: str, value: str | None) -> int | None:
+        if value is None:
+            return None
+        with suppress(Exception):
+            if prop == Keyword.State:
+                return int(value)
+            return self.core.getStateFromLabel(device, value)
+        return None
+
+    def _readout_ms(self) -> float:
+        if not (cam := self._camera):
+            return 0.0
+        for prop in _READOUT_PROPS:
+            with suppress(Exception):
+                if self.core.hasProperty(cam, prop):
+                    return float(self.core.getProperty(cam, prop))
+        return 0.0
+
+    def result(self) -> SequenceEstimate:
+        capacity = 0
+        with suppress(Exception):
+            capacity = self.core.getCircularBufferMemoryFootprint() * 1024 * 1024
+        return SequenceEstimate(
+            total_s=self._now / 1000,
+            breakdown_s={k: v / 1000 for k, v in self.breakdown.items()},
+            n_events=self.n_events,
+            n_images=self.n_images,
+            n_sequenced_events=self.n_sequenced,
+            max_sequence_length=self.max_seq_len,
+            n_autofocus=self.n_autofocus,
+            peak_buffer_bytes=self.peak_buffer,
+            buffer_capacity_bytes=capacity,
+        )
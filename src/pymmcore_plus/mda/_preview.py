@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from pymmcore_plus._logger import exceptions_logged
+from pymmcore_plus.mda._pyramid import block_mean
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from useq import MDAEvent
+
+    from pymmcore_plus.metadata.schema import FrameMetaV1
+
+    PreviewMode = Literal["bin", "stride"]
+
+
+def downsample(img: np.ndarray, max_size: int, mode: PreviewMode = "bin") -> np.ndarray:
+    """Downsample the YX dimensions of `img` to at most `max_size`.
+
+    YX are the last two dimensions, except for RGB(A) images (3 dimensions, with at
+    most 4 in the last, as returned by `CMMCorePlus.fixImage`), for which they are
+    the first two.  The same integer factor is used for Y and X (so the aspect ratio
+    is preserved).  With `mode="bin"`, blocks of pixels are averaged; with
+    `mode="stride"`, every n-th pixel is taken (faster, but aliased).  `img` is
+    returned unchanged if it is already small enough.
+    """
+    rgb = img.ndim == 3 and img.shape[-1] <= 4
+    yx = img.shape[:2] if rgb else img.shape[-2:]
+    factor = math.ceil(max(yx) / max_size) if max_size > 0 else 1
+    if factor <= 1:
+        return img
+    if mode == "stride":
+        if rgb:
+            return np.ascontiguousarray(img[::factor, ::factor])
+        return np.ascontiguousarray(img[..., ::factor, ::factor])
+    if rgb:
+        binned = block_mean(np.moveaxis(img, -1, 0), factor)
+        return np.ascontiguousarray(np.moveaxis(binned, 0, -1))
+    return block_mean(img, factor)
+
+
+class PreviewTap:
+    """Produces downsampled, rate-limited previews of frames on a worker thread.
+
+    Frames passed to `submit` (on the acquisition thread) are only *stored*: the
+    latest frame of each (camera, channel) replaces any frame of the same (camera,
+    channel) that hasn't been previewed yet.  A worker thread downsamples the stored
+    frames (see `downsample`) at most `fps` times per second, and calls
+    `emit(preview, event, meta)` for each.  Frames are never copied on the
+    acquisition thread, so `submit` must not be passed a buffer that is reused.
+
+    Parameters
+    ----------
+    emit : Callable[[np.ndarray, MDAEvent, FrameMetaV1], Any]
+        Called (on the worker thread) with each preview.
+    max_size : int
+        Maximum size (in pixels) of the longest side of the preview, by default 512.
+    fps : float
+        Maximum number of previews per second, per (camera, channel).  If 0 (the
+        default), previews are disabled and `submit` does nothing.
+    mode : {"bin", "stride"}
+        How frames are downsampled, by default "bin" (block average).
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[np.ndarray, MDAEvent, FrameMetaV1], Any],
+        max_size: int = 512,
+        fps: float = 0,
+        mode: PreviewMode = "bin",
+    ) -> None:
+        self.max_size = max_size
+        self.fps = fps
+        self.mode: PreviewMode = mode
+        self._emit = emit
+        self._pending: dict[Any, tuple[np.ndarray, MDAEvent, FrameMetaV1]] = {}
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._n_emitted = 0
+
+    @property
+    def n_emitted(self) -> int:
+        """Number of previews emitted since the tap was started."""
+        return self._n_emitted
+
+    def submit(self, img: np.ndarray, event: MDAEvent, meta: FrameMetaV1) -> None:
+        """Store `img` for previewing, starting the worker thread if needed."""
+        if self.fps <= 0:
+            return
+        channel = event.channel.config if event.channel else None
+        with self._cond:
+            self._pending[(meta.get("camera_device"), channel)] = (img, event, meta)
+            if self._thread is None:
+                self._stop.clear()
+                self._n_emitted = 0
+                self._thread = threading.Thread(
+                    target=self._run, name="PreviewTap", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def stop(self) -> None:
+        """Preview any remaining frames, and stop the worker thread."""
+        with self._cond:
+            thread, self._thread = self._thread, None
+            self._stop.set()
+            self._cond.notify()
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stop.is_set():
+                    self._cond.wait()
+                items, self._pending = self._pending, {}
+            start = time.perf_counter()
+            for img, event, meta in items.values():
+                with exceptions_logged():
+                    preview = downsample(img, self.max_size, self.mode)
+                    self._emit(preview, event, meta)
+                    self._n_emitted += 1
+            if self._stop.is_set():
+                with self._cond:
+                    if not self._pending:
+                        return
+                continue
+            # wait out the rest of the frame period (or until stopped)
+            if self.fps > 0:
+                self._stop.wait(1 / self.fps - (time.perf_counter() - start))
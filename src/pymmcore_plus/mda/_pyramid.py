@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import queue
+import threading
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def block_mean(img: np.ndarray, factor: int = 2) -> np.ndarray:
+    """Downsample the last two (YX) dimensions of `img` by averaging blocks.
+
+    The image is cropped to a multiple of `factor` along Y and X, and each
+    `factor x factor` block is replaced by its mean (cast back to `img.dtype`).
+    """
+    *lead, h, w = img.shape
+    h2, w2 = h // factor, w // factor
+    blocks = img[..., : h2 * factor, : w2 * factor].reshape(
+        *lead, h2, factor, w2, factor
+    )
+    out: np.ndarray = blocks.mean(axis=(-3, -1))
+    if np.issubdtype(img.dtype, np.integer):
+        out = np.rint(out, out=out)
+    return out.astype(img.dtype, copy=False)
+
+
+def pyramid_shape(shape: tuple[int, ...], level: int, factor: int = 2) -> tuple:
+    """Return the shape of `level` (0 = full resolution) for an array of `shape`."""
+    *lead, h, w = shape
+    for _ in range(level):
+        h, w = h // factor, w // factor
+    return (*lead, h, w)
+
+
+def pyramid_levels(img: np.ndarray, levels: int, factor: int = 2) -> list[np.ndarray]:
+    """Return `levels` progressively downsampled versions of `img`.
+
+    Level `n` (1-based) is downsampled by `factor**n` relative to `img`.
+    """
+    out = []
+    for _ in range(levels):
+        img = block_mean(img, factor)
+        out.append(img)
+    return out
+
+
+_STOP = object()
+
+
+class PyramidBuilder:
+    """Computes downsampled pyramid levels for incoming frames on a worker thread.
+
+    Each frame passed to `submit` is downsampled (by block mean) `levels` times by
+    `factor`, and `write(key, level, data)` is called for each level (starting at 1) on
+    the worker thread.  `key` is any object that identifies where the frame belongs
+    (e.g. an `(array, index)` tuple).
+
+    `submit` blocks when `max_pending` frames are waiting to be processed, so that
+    a slow disk doesn't cause frames to accumulate in memory.  Errors raised on the
+    worker thread are re-raised on the next call to `submit` or `flush`.
+
+    Parameters
+    ----------
+    write : Callable[[Any, int, np.ndarray], Any]
+        Called (on the worker thread) with each downsampled level.
+    levels : int
+        Number of downsampled levels to compute, by default 3 (2x, 4x, 8x).
+    factor : int
+        Downsampling factor between consecutive levels, by default 2.
+    max_pending : int
+        Maximum number of frames waiting to be processed, by default 64.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Any, int, np.ndarray], Any],
+        levels: int = 3,
+        factor: int = 2,
+        max_pending: int = 64,
+    ) -> None:
+        self.levels = levels
+        self.factor = factor
+        self._write = write
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_pending)
+        self._error: BaseException | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, key: Any, frame: np.ndarray) -> None:
+        """Queue `frame` to be downsampled and written under `key`."""
+        self._raise_error()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._work, name="PyramidBuilder", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((key, frame))
+
+    def flush(self) -> None:
+        """Block until all queued frames have been processed."""
+        self._queue.join()
+        self._raise_error()
+
+    def close(self) -> None:
+        """Process all queued frames and stop the worker thread."""
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(_STOP)
+                self._thread.join()
+                self._thread = None
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        if (error := self._error) is not None:
+            self._error = None
+            raise error
+
+    def _work(self) -> None:
+        while (item := self._queue.get()) is not _STOP:
+            try:
+                if self._error is None:
+                    key, frame = item
+                    for n, data in enumerate(
+                        pyramid_levels(frame, self.levels, self.factor), 1
+                    ):
+                        self._write(key, n, data)
+            except BaseException as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
+        self._queue.task_done()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from useq import MDAEvent
+
+    from pymmcore_plus.metadata.schema import FrameMetaV1
+
+    RingKey = tuple[str | None, str | None]  # (camera, channel)
+
+
+class _Ring:
+    __slots__ = ("count", "data", "events", "head", "metas")
+
+    def __init__(self, depth: int, shape: tuple[int, ...], dtype: np.dtype) -> None:
+        self.data = np.empty((depth, *shape), dtype=dtype)
+        self.events: list[MDAEvent | None] = [None] * depth
+        self.metas: list[FrameMetaV1 | None] = [None] * depth
+        self.head = 0  # slot of the next frame
+        self.count = 0  # number of valid frames
+
+    def push(self, img: np.ndarray, event: MDAEvent, meta: FrameMetaV1) -> None:
+        np.copyto(self.data[self.head], img)
+        self.events[self.head] = event
+        self.metas[self.head] = meta
+        self.head = (self.head + 1) % len(self.data)
+        self.count = min(self.count + 1, len(self.data))
+
+    def slot(self, age: int) -> int:
+        """Slot of the frame `age` frames before the latest (0 = latest)."""
+        return (self.head - 1 - age) % len(self.data)
+
+
+class RecentFrames:
+    """Rings of the last `depth` frames of each (camera, channel).
+
+    The buffer of each ring is allocated when the first frame of that (camera,
+    channel) arrives (and again only if the frame shape or dtype changes), after which
+    frames are copied into it without further allocation.  Frames returned by
+    `latest` are read-only views into the rings by default: they are only valid until
+    `depth` more frames of the same (camera, channel) arrive.  Pass `copy=True` to
+    keep them for longer.
+
+    Parameters
+    ----------
+    depth : int
+        Number of frames to keep for each (camera, channel).  If 0 (the default),
+        no frames are kept.
+    """
+
+    def __init__(self, depth: int = 0) -> None:
+        self._depth = depth
+        self._rings: dict[RingKey, _Ring] = {}
+        # most recently updated ring for each camera, channel, and overall
+        self._latest: dict[Hashable, _Ring] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def depth(self) -> int:
+        """Number of frames kept for each (camera, channel).
+
+        Setting this discards all frames (and buffers).
+        """
+        return self._depth
+
+    @depth.setter
+    def depth(self, depth: int) -> None:
+        if depth < 0:
+            raise ValueError("depth must be non-negative.")
+        with self._lock:
+            self._depth = depth
+            self._rings.clear()
+            self._latest.clear()
+
+    def keys(self) -> list[RingKey]:
+        """Return the (camera, channel) pairs that have frames."""
+        with self._lock:
+            return [k for k, ring in self._rings.items() if ring.count]
+
+    def clear(self) -> None:
+        """Forget all frames (the buffers are kept for reuse)."""
+        with self._lock:
+            for ring in self._rings.values():
+                ring.head = ring.count = 0
+                ring.events = [None] * len(ring.data)
+                ring.metas = [None] * len(ring.data)
+            self._latest.clear()
+
+    def push(self, img: np.ndarray, event: MDAEvent, meta: FrameMetaV1) -> None:
+        """Copy `img` into the ring of its (camera, channel)."""
+        if not self._depth:
+            return
+        channel = event.channel.config if event.channel else None
+        key = (meta.get("camera_device"), channel)
+        with self._lock:
+            ring = self._rings.get(key)
+            if (
+                ring is None
+                or ring.data.shape[1:] != img.shape
+                or ring.data.dtype != img.dtype
+            ):
+                ring = self._rings[key] = _Ring(self._depth, img.shape, img.dtype)
+            ring.push(img, event, meta)
+            self._latest[("camera", key[0])] = ring
+            self._latest[("channel", channel)] = ring
+            self._latest[None] = ring
+
+    def latest(
+        self,
+        channel: str | None = None,
+        camera: str | None = None,
+        *,
+        copy: bool = False,
+    ) -> np.ndarray | None:
+        """Return the most recent frame, or None if there isn't one.
+
+        Parameters
+        ----------
+        channel : str | None
+            Channel (config name) of the frame.  If None, any channel.
+        camera : str | None
+            Camera device label of the frame.  If None, any camera.
+        copy : bool
+            Return a copy, rather than a read-only view into the ring.
+        """
+        if (item := self.latest_item(channel, camera)) is None:
+            return None
+        frame = item[0]
+        return frame.copy() if copy else frame
+
+    def latest_item(
+        self, channel: str | None = None, camera: str | None = None
+    ) -> tuple[np.ndarray, MDAEvent, FrameMetaV1] | None:
+        """Return `(frame, event, meta)` of the most recent frame (see `latest`)."""
+        with self._lock:
+            if (ring := self._find(channel, camera)) is None or not ring.count:
+                return None
+            slot = ring.slot(0)
+            return (
+                _readonly(ring.data[slot]),
+                ring.events[slot],  # type: ignore[return-value]
+                ring.metas[slot],
+            )
+
+    def recent(
+        self,
+        n: int | None = None,
+        channel: str | None = None,
+        camera: str | None = None,
+    ) -> np.ndarray:
+        """Return (a copy of) the last `n` frames (default all), oldest first.
+
+        Frames are from a single (camera, channel) ring: the one matching `channel`
+        and `camera` that was most recently updated.  The result has shape
+        `(n_frames, *frame_shape)`, with `n_frames` 0 if there are no frames.
+        """
+        with self._lock:
+            if (ring := self._find(channel, camera)) is None:
+                return np.empty((0, 0, 0))
+            n = ring.count if n is None else min(n, ring.count)
+            slots = [ring.slot(age) for age in range(n - 1, -1, -1)]
+            return ring.data[slots]
+
+    def _find(self, channel: str | None, camera: str | None) -> _Ring | None:
+        if channel is not None and camera is not None:
+            return self._rings.get((camera, channel))
+        if channel is not None:
+            return self._latest.get(("channel", channel))
+        if camera is not None:
+            return self._latest.get(("camera", camera))
+        return self._latest.get(None)
+
+
+def _readonly(ary: np.ndarray) -> np.ndarray:
+    view = ary.view()
+    view.flags.writeable = False
+    return view
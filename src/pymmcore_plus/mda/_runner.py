@@ -18,6 +18,8 @@ from useq import MDASequence
 
 from pymmcore_plus._logger import exceptions_logged, logger
 from pymmcore_plus.mda._generator_sequence import GeneratorMDASequence
+from pymmcore_plus.mda._preview import PreviewTap
+from pymmcore_plus.mda._recent_frames import RecentFrames
 from pymmcore_plus.mda._sink import OmeWritersSink
 
 from ._protocol import PMDAEngine
@@ -199,6 +201,8 @@ class MDARunner:
         self._pause_interval: float = 0.1  # sec to wait between checking pause state
         self._handlers: WeakSet[SupportsFrameReady] = WeakSet()
         self._sink: SinkProtocol | None = None
+        self._recent_frames = RecentFrames()
+        self._preview = PreviewTap(self._signals.previewReady.emit)
         self._sequence: MDASequence | None = None
         # timer for the full sequence, reset only once at the beginning of the sequence
         self._sequence_t0: float = 0.0
@@ -342,6 +346,8 @@ class MDARunner:
         output: SingleOutput | Sequence[SingleOutput] | None = None,
         overwrite: bool = False,
         dimension_overrides: dict[str, DimensionOverride] | None = None,
+        pyramid_levels: int = 0,
+        view_cache_bytes: int = 0,
     ) -> None:
         """Run the multi-dimensional acquisition defined by `sequence`.
 
@@ -393,11 +399,25 @@ class MDARunner:
             Values are dicts of Dimension fields ("chunk_size", "shard_size_chunks")
             to apply on top of the sequence-derived dimensions. Example:
             `{"t": {"chunk_size": 1}, "y": {"chunk_size": 256}}`.
+        pyramid_levels : int, optional
+            Number of additional multiscale levels (each downsampled 2x in XY) to write
+            *when output is an OME-Zarr `str`, `Path` or `AcquisitionSettings`*.
+            The levels are built from each frame as it arrives, on a worker thread
+            (see `OmeWritersSink`).
+            Default is 0 (no pyramid).
+        view_cache_bytes : int, optional
+            If greater than 0, keep up to this many bytes of recently written (and
+            read) frames in memory, to serve reads from `get_view` *when output is a
+            `str`, `Path` or `AcquisitionSettings`*. Default is 0 (no cache).
         """
         error = None
         sequence = events if isinstance(events, MDASequence) else GeneratorMDASequence()
         handlers, sink = self._coerce_outputs(
-            output, overwrite=overwrite, dimension_overrides=dimension_overrides
+            output,
+            overwrite=overwrite,
+            dimension_overrides=dimension_overrides,
+            pyramid_levels=pyramid_levels,
+            view_cache_bytes=view_cache_bytes,
         )
         self._sink = sink
         with self._handlers_connected(handlers):
@@ -417,6 +437,51 @@ class MDARunner:
         if error is not None:
             raise error
 
+    @property
+    def recent_frames(self) -> RecentFrames:
+        """Rings of the most recent frames of each (camera, channel).
+
+        Disabled by default; set `recent_frames.depth` to the number of frames to keep
+        for each (camera, channel).  Frames are kept until the next run starts.
+
+        Examples
+        --------
+        >>> core.mda.recent_frames.depth = 4
+        >>> core.run_mda(sequence)
+        >>> core.mda.latest("DAPI")  # the last DAPI frame
+        >>> core.mda.recent_frames.recent(4, "DAPI")  # the last 4 DAPI frames
+        """
+        return self._recent_frames
+
+    @property
+    def preview(self) -> PreviewTap:
+        """Settings of the downsampled previews emitted by `events.previewReady`.
+
+        Disabled by default; set `preview.fps` (maximum previews per second for each
+        camera and channel) to enable it.  Previews are made on a worker thread, so
+        that displays connected to `previewReady` (instead of `frameReady`) don't slow
+        down the acquisition.  Set `preview.max_size` (longest side in pixels, default
+        512), and `preview.mode` (`"bin"` or `"stride"`).
+
+        Examples
+        --------
+        >>> core.mda.preview.fps = 10
+        >>> core.mda.preview.max_size = 256
+        >>> core.mda.events.previewReady.connect(viewer.set_image)
+        """
+        return self._preview
+
+    def latest(
+        self, channel: str | None = None, camera: str | None = None
+    ) -> np.ndarray | None:
+        """Return the most recent frame (of `channel` and/or `camera`), if any.
+
+        The frame is a read-only view into the `recent_frames` ring, which must be
+        enabled by setting `recent_frames.depth`.  See
+        [`RecentFrames.latest`][pymmcore_plus.mda.RecentFrames.latest].
+        """
+        return self._recent_frames.latest(channel, camera)
+
     def get_view(self) -> SinkView | None:
         """Array-like view of the current data sink, if it exists."""
         if self._sink is None:  # pragma: no cover
@@ -470,6 +535,8 @@ class MDARunner:
         output: SingleOutput | Sequence[SingleOutput] | None,
         overwrite: bool = False,
         dimension_overrides: dict[str, DimensionOverride] | None = None,
+        pyramid_levels: int = 0,
+        view_cache_bytes: int = 0,
     ) -> tuple[list[SupportsFrameReady], SinkProtocol | None]:
         """Normalize and validate output into a list of frameReady handlers, and a sink.
 
@@ -499,6 +566,8 @@ class MDARunner:
                     item,
                     overwrite=overwrite,
                     dimension_overrides=dimension_overrides,
+                    pyramid_levels=pyramid_levels,
+                    view_cache_bytes=view_cache_bytes,
                 )
             else:
                 if not callable(getattr(item, "frameReady", None)):
@@ -538,6 +607,8 @@ class MDARunner:
         _skip: Callable | None = self._sink.skip if self._sink is not None else None
         _emit_event_started = self._signals.eventStarted.emit
         _emit_frame_ready = self._signals.frameReady.emit
+        _push_recent = self._recent_frames.push
+        _submit_preview = self._preview.submit
         for event in _events:
             if event.reset_event_timer:
                 self._reset_event_timer()
@@ -577,6 +648,8 @@ class MDARunner:
                             meta["runner_time_ms"] = runner_time_ms
                         if _append is not None:
                             _append(img, sub_event, meta)
+                        _push_recent(img, sub_event, meta)
+                        _submit_preview(img, sub_event, meta)
                         with exceptions_logged():
                             _emit_frame_ready(img, sub_event, meta)
                 finally:
@@ -658,6 +731,7 @@ class MDARunner:
             self._pause_requested = False
         self._paused_time = 0.0
         self._sequence = sequence
+        self._recent_frames.clear()
 
         meta = self._engine.setup_sequence(sequence)
 
@@ -745,6 +819,9 @@ class MDARunner:
             except Exception as e:  # pragma: no cover
                 logger.error("Error closing data sink: %s", e)
 
+        # emit the remaining previews before sequenceFinished
+        self._preview.stop()
+
         if hasattr(self._engine, "teardown_sequence"):
             # Guarded like _sink.close() above: a failing teardown must not
             # prevent sequenceFinished from being emitted or the runner from
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import contextlib
+import json
+import math
 import warnings
-from typing import TYPE_CHECKING, Any, Protocol
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, cast
 
+import numpy as np
 from ome_writers import (
     AcquisitionSettings,
     Dimension,
+    OmeZarrFormat,
     create_stream,
     useq_to_acquisition_settings,
 )
@@ -13,12 +19,13 @@ from pydantic import BaseModel
 
 from pymmcore_plus._logger import logger
 from pymmcore_plus.mda._generator_sequence import GeneratorMDASequence
+from pymmcore_plus.mda._pyramid import PyramidBuilder, pyramid_shape
+from pymmcore_plus.mda._view_cache import CachedView, FrameCache
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
-    from pathlib import Path
+    from collections.abc import Iterator, Mapping
 
-    import numpy as np
+    import tensorstore as ts
     from ome_writers import OMEStream
     from ome_writers._useq import AcquisitionSettingsDict
     from useq import MDAEvent, MDASequence
@@ -39,17 +46,42 @@ class OmeWritersSink(SinkProtocol):
     """Our default built-in data sink.
 
     uses ome-writers to write to OME-Zarr or OME-TIFF, or scratch (tmp/memory).
+
+    If `pyramid_levels` is greater than 0 (and the output is OME-Zarr), that many
+    additional multiscale levels are written for each image, each downsampled 2x in
+    XY (by block averaging) relative to the previous one, with the same zarr format
+    and compression as the full resolution data.  The levels are built as frames
+    arrive, on a worker thread (see `PyramidBuilder`), and are added to the
+    multiscales metadata of each image when the sink is closed.
+
+    If `view_cache_bytes` is greater than 0, the most recently written (and read)
+    frames, up to that many bytes, are kept in memory, and single-frame reads from
+    `get_view` are served from memory when possible, rather than being read back
+    (and decompressed) from storage.  See `view_cache_stats` for the hit rate.
     """
 
     def __init__(
         self,
         settings: AcquisitionSettings,
         dimension_overrides: dict[str, DimensionOverride] | None = None,
+        pyramid_levels: int = 0,
+        view_cache_bytes: int = 0,
     ) -> None:
         self._settings = settings
         self._dimension_overrides = dimension_overrides or {}
+        self._pyramid_levels = pyramid_levels
+        self._pyramid: PyramidBuilder | None = None
+        # (group path, levels) of each position, and the position/storage index of
+        # each frame (in acquisition order), while a pyramid is being built
+        self._pyramid_groups: list[tuple[str, _ZarrPyramid]] = []
+        self._frame_locations: Iterator[tuple[int, tuple[int, ...]]] = iter(())
         self._stream: OMEStream | None = None
         self._summary_meta: SummaryMetaV1 | None = None
+        self._view_cache = FrameCache(view_cache_bytes) if view_cache_bytes else None
+        # number of frames (appended or skipped) so far, and the size of each
+        # (non-frame) dimension, to find the view index of each frame
+        self._n_frames = 0
+        self._frame_counts: tuple[int | None, ...] = ()
 
     @classmethod
     def from_output(
@@ -57,18 +89,24 @@ class OmeWritersSink(SinkProtocol):
         output: str | Path | AcquisitionSettings,
         overwrite: bool = False,
         dimension_overrides: dict[str, DimensionOverride] | None = None,
+        pyramid_levels: int = 0,
+        view_cache_bytes: int = 0,
     ) -> OmeWritersSink:
+        kwargs: dict[str, Any] = {
+            "dimension_overrides": dimension_overrides,
+            "pyramid_levels": pyramid_levels,
+            "view_cache_bytes": view_cache_bytes,
+        }
         if isinstance(output, AcquisitionSettings):
-            return cls(output, dimension_overrides=dimension_overrides)
+            return cls(output, **kwargs)
         stripped = str(output).rstrip("/").rstrip(":").lower()
         if stripped in ("memory", "scratch"):
             return cls(
                 AcquisitionSettings(format="scratch", overwrite=overwrite),  # pyright: ignore
-                dimension_overrides=dimension_overrides,
+                **kwargs,
             )
         return cls(
-            AcquisitionSettings(root_path=str(output), overwrite=overwrite),
-            dimension_overrides=dimension_overrides,
+            AcquisitionSettings(root_path=str(output), overwrite=overwrite), **kwargs
         )
 
     def setup(self, sequence: MDASequence, meta: SummaryMetaV1 | None) -> None:
@@ -140,21 +178,143 @@ class OmeWritersSink(SinkProtocol):
         self._stream = create_stream(self._settings)
         self._summary_meta = meta
         self._set_summary_metadata()
+        self._n_frames = 0
+        self._frame_counts = tuple(d.count for d in self._settings.dimensions[:-2])
+        if self._view_cache is not None:
+            self._view_cache.clear()
+        if self._pyramid_levels > 0:
+            self._setup_pyramid()
 
     def append(self, img: np.ndarray, event: MDAEvent, meta: FrameMetaV1) -> None:
         self._stream.append(img, frame_metadata=_frame_meta_to_ome(meta))  # type: ignore[union-attr]
+        if self._pyramid is not None:
+            try:
+                # copy, in case the caller reuses the buffer
+                self._pyramid.submit(
+                    next(self._frame_locations), np.array(img, copy=True)
+                )
+            except Exception as e:
+                logger.warning("Failed to write pyramid levels: %s", e, exc_info=True)
+                self._stop_pyramid()
+        if self._view_cache is not None and (index := self._view_index()) is not None:
+            # copy, in case the caller reuses the buffer
+            self._view_cache.put(index, np.array(img, copy=True))
+        self._n_frames += 1
 
     def skip(self, *, frames: int = 1) -> None:
         self._stream.skip(frames=frames)  # type: ignore[union-attr]
+        if self._pyramid is not None:
+            # skipped frames are left at the fill value in every level
+            for _ in range(frames):
+                next(self._frame_locations)
+        self._n_frames += frames
+
+    @property
+    def view_cache_stats(self) -> dict[str, int] | None:
+        """Hits, misses, and size of the `get_view` frame cache (None if disabled)."""
+        return None if self._view_cache is None else self._view_cache.stats
+
+    def _view_index(self) -> tuple[int, ...] | None:
+        """Return the view index of the next frame.
+
+        Frames are written in acquisition order, which is also the order of the
+        view's dimensions.  Returns None if the index can't be determined (only the
+        first dimension may be unbounded).
+        """
+        if not (counts := self._frame_counts):
+            return ()
+        if (inner := _known_counts(counts[1:])) is None:
+            return None
+        first, rest = divmod(self._n_frames, math.prod(inner))
+        if counts[0] is not None and first >= counts[0]:
+            return None
+        return (first, *(int(i) for i in np.unravel_index(rest, inner)))
+
+    def _is_written(self, index: tuple[int, ...]) -> bool:
+        """Return True if the frame at view `index` has been written (or skipped)."""
+        inner = _known_counts(self._frame_counts[1:])
+        if inner is None or len(index) != len(self._frame_counts):
+            return False
+        linear = 0
+        for i, size in zip(index, (*inner, 1), strict=True):
+            linear = (linear + i) * size
+        return linear < self._n_frames
 
     def close(self) -> None:
         if self._stream is not None:
+            if self._pyramid is not None:
+                self._finish_pyramid()
             self._stream.close()
 
+    def _setup_pyramid(self) -> None:
+        """Create the (empty) downsampled levels of each image in the output."""
+        settings = self._settings
+        if not isinstance(settings.format, OmeZarrFormat) or not settings.root_path:
+            logger.warning(
+                "pyramid_levels is only supported for OME-Zarr output, got %r",
+                settings.format.name,
+            )
+            return
+        # this is also what the stream uses to route frames to positions
+        from ome_writers._router import FrameRouter
+
+        root = Path(settings.output_path)
+        try:
+            # group paths of the images, in position order
+            groups = list(self._stream.get_metadata())  # type: ignore[union-attr]
+            if len(groups) != len(settings.positions):  # pragma: no cover
+                raise ValueError(f"expected one image group per position: {groups}")
+            self._pyramid_groups = [
+                (group, _ZarrPyramid(root / group, self._pyramid_levels))
+                for group in groups
+            ]
+        except Exception as e:
+            logger.warning("Failed to create pyramid levels: %s", e, exc_info=True)
+            self._pyramid_groups = []
+            return
+        self._frame_locations = iter(FrameRouter(settings))
+        self._pyramid = PyramidBuilder(
+            self._write_pyramid_level, levels=self._pyramid_levels
+        )
+
+    def _write_pyramid_level(
+        self, key: tuple[int, tuple[int, ...]], level: int, data: np.ndarray
+    ) -> None:
+        """Called by the PyramidBuilder (on its worker thread) for each level."""
+        position, index = key
+        self._pyramid_groups[position][1].write(index, level, data)
+
+    def _finish_pyramid(self) -> None:
+        """Wait for the pending levels, and add them to the multiscales metadata."""
+        try:
+            self._pyramid.close()  # type: ignore[union-attr]
+            metadata = self._stream.get_metadata()  # type: ignore[union-attr]
+            for group, pyramid in self._pyramid_groups:
+                multiscales = metadata[group]["ome"]["multiscales"][0]
+                multiscales["datasets"] = [
+                    *multiscales["datasets"][:1],
+                    *pyramid.datasets,
+                ]
+            self._stream.update_metadata(metadata)  # type: ignore[union-attr]
+        except Exception as e:
+            logger.warning("Failed to write pyramid levels: %s", e, exc_info=True)
+        self._stop_pyramid()
+
+    def _stop_pyramid(self) -> None:
+        if (pyramid := self._pyramid) is not None:
+            self._pyramid = None
+            with contextlib.suppress(Exception):
+                pyramid.close()
+        self._pyramid_groups = []
+        self._frame_locations = iter(())
+
     def get_view(self) -> SinkView | None:
         if self._stream is None:
             return None
-        return self._stream.view(dynamic_shape=True, strict=False)
+        view = self._stream.view(dynamic_shape=True, strict=False)
+        if self._view_cache is not None:
+            return CachedView(view, self._view_cache, self._is_written)
+        return view
 
     def _set_summary_metadata(self) -> None:
         """Attach acquisition-level summary metadata to the stream.
@@ -174,6 +334,11 @@ class OmeWritersSink(SinkProtocol):
             logger.warning("Failed to attach summary metadata: %s", e, exc_info=True)
 
 
+def _known_counts(counts: tuple[int | None, ...]) -> tuple[int, ...] | None:
+    """Return `counts` if none of them are unbounded (None), else None."""
+    return None if None in counts else cast("tuple[int, ...]", counts)
+
+
 def _unbounded_3d_settings(
     width: int, height: int, pixel_size_um: float | None = None
 ) -> AcquisitionSettingsDict:
@@ -203,6 +368,101 @@ def _unbounded_3d_settings(
     }
 
 
+class _ZarrPyramid:
+    """Downsampled levels of the first dataset of an OME-Zarr image `group`.
+
+    The levels are created (empty) next to the full resolution data (as `1`, `2`,
+    ...), with the zarr format (driver) and codecs of the full resolution array, and
+    `datasets` holds their entries for the multiscales metadata of the group.  Frames
+    are written with `write`, growing the levels along unbounded dimensions as needed.
+    """
+
+    def __init__(self, group: Path, levels: int, factor: int = 2) -> None:
+        import tensorstore as ts
+
+        doc = json.loads((group / "zarr.json").read_bytes())
+        base = doc["attributes"]["ome"]["multiscales"][0]["datasets"][0]
+        base_path = group / base["path"]
+        driver = "zarr3" if (base_path / "zarr.json").exists() else "zarr"
+        src = ts.open(
+            {"driver": driver, "kvstore": {"driver": "file", "path": str(base_path)}}
+        ).result()
+        base_meta = src.spec().to_json()["metadata"]
+        shape = tuple(src.shape)
+
+        n_lead = len(shape) - 2
+        base_scale = next(
+            (
+                t["scale"]
+                for t in base["coordinateTransformations"]
+                if t["type"] == "scale"
+            ),
+            [1] * len(shape),
+        )
+        self.arrays: list[ts.TensorStore] = []
+        self.datasets: list[dict] = []
+        for n in range(1, levels + 1):
+            level_shape = pyramid_shape(shape, n, factor)
+            path = str(n)
+            chunks = [1] * n_lead + [*level_shape[-2:]]
+            self.arrays.append(
+                ts.open(
+                    {
+                        "driver": driver,
+                        "kvstore": {"driver": "file", "path": str(group / path)},
+                        "metadata": _level_metadata(base_meta, level_shape, chunks),
+                    },
+                    create=True,
+                    delete_existing=True,
+                ).result()
+            )
+            if driver == "zarr" and (attrs := base_path / ".zattrs").exists():
+                # zarr v2 dimension names (_ARRAY_DIMENSIONS) are stored in .zattrs
+                (group / path / ".zattrs").write_bytes(attrs.read_bytes())
+            scale = [
+                *base_scale[:n_lead],
+                *(s * factor**n for s in base_scale[n_lead:]),
+            ]
+            self.datasets.append(
+                {
+                    "path": path,
+                    "coordinateTransformations": [{"type": "scale", "scale": scale}],
+                }
+            )
+
+    def write(self, index: tuple[int, ...], level: int, data: np.ndarray) -> None:
+        """Write the plane `data` of `level` (1-based) at (non-YX) `index`."""
+        ary = self.arrays[level - 1]
+        shape = ary.shape
+        if any(i >= n for i, n in zip(index, shape, strict=False)):
+            new_shape = [max(i + 1, n) for i, n in zip(index, shape, strict=False)]
+            ary = ary.resize(exclusive_max=[*new_shape, *shape[len(index) :]]).result()
+            self.arrays[level - 1] = ary
+        ary[index].write(data).result()
+
+
+def _level_metadata(base: dict, shape: tuple[int, ...], chunks: list[int]) -> dict:
+    """Return zarr metadata for a pyramid level of `shape`, based on `base`."""
+    if "zarr_format" not in base or base["zarr_format"] == 2:
+        keep_v2 = ("dtype", "compressor", "filters", "fill_value", "order")
+        meta = {k: base[k] for k in keep_v2 if k in base}
+        if "dimension_separator" in base:
+            meta["dimension_separator"] = base["dimension_separator"]
+        return {**meta, "shape": list(shape), "chunks": chunks}
+
+    codecs = base.get("codecs", [])
+    if codecs and codecs[0].get("name") == "sharding_indexed":
+        # the level is a single chunk per plane: use the codecs of the inner chunks
+        codecs = codecs[0]["configuration"]["codecs"]
+    keep = ("data_type", "fill_value", "chunk_key_encoding", "dimension_names")
+    return {
+        **{k: base[k] for k in keep if k in base},
+        "shape": list(shape),
+        "chunk_grid": {"name": "regular", "configuration": {"chunk_shape": chunks}},
+        "codecs": codecs,
+    }
+
+
 def _frame_meta_to_ome(meta: FrameMetaV1) -> dict:
     """Convert FrameMetaV1 to ome-writers frame_metadata dict."""
     # TODO:
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Sequence
+
+    from pymmcore_plus.mda._runner import SinkView
+
+
+class FrameCache:
+    """Thread-safe LRU cache of frames, bounded by the total number of bytes.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum number of bytes to hold.  When exceeded, the least recently used
+        frames are evicted.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._frames: OrderedDict[Hashable, np.ndarray] = OrderedDict()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return `{"hits", "misses", "frames", "nbytes"}` for the cache."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "frames": len(self._frames),
+                "nbytes": self._nbytes,
+            }
+
+    def get(self, key: Hashable) -> np.ndarray | None:
+        """Return the frame for `key` (marking it as recently used), or None."""
+        with self._lock:
+            if (frame := self._frames.get(key)) is None:
+                self._misses += 1
+                return None
+            self._frames.move_to_end(key)
+            self._hits += 1
+            return frame
+
+    def put(self, key: Hashable, frame: np.ndarray) -> None:
+        """Add (or replace) the frame for `key`, evicting old frames if needed.
+
+        The frame is stored read-only; callers must not modify it afterwards.
+        """
+        if frame.nbytes > self.max_bytes:
+            return
+        frame = frame.view()
+        frame.flags.writeable = False
+        with self._lock:
+            if (old := self._frames.pop(key, None)) is not None:
+                self._nbytes -= old.nbytes
+            self._frames[key] = frame
+            self._nbytes += frame.nbytes
+            while self._nbytes > self.max_bytes:
+                _, evicted = self._frames.popitem(last=False)
+                self._nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Remove all frames and reset the counters."""
+        with self._lock:
+            self._frames.clear()
+            self._nbytes = self._hits = self._misses = 0
+
+
+class CachedView:
+    """A `SinkView` that serves reads of (whole or partial) single frames from a cache.
+
+    Reads that select a single frame (i.e. an integer index for every dimension but
+    the last two) are served from `cache` if possible.  On a miss, the whole frame is
+    read from `view` and added to the cache, *if* `is_written(index)` says the frame
+    has already been written (frames that are yet to be acquired are never cached).
+    All other reads go straight to `view`.  Other attributes (`dims`, `coords`, ...)
+    are forwarded to `view`.
+    """
+
+    def __init__(
+        self,
+        view: SinkView,
+        cache: FrameCache,
+        is_written: Callable[[tuple[int, ...]], bool],
+    ) -> None:
+        self._view = view
+        self._cache = cache
+        self._is_written = is_written
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._view, name)
+
+    def __repr__(self) -> str:
+        return f"CachedView({self._view!r})"
+
+    @property
+    def dtype(self) -> Any:
+        return self._view.dtype
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self._view.shape
+
+    @property
+    def ndim(self) -> int:
+        return self._view.ndim
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Hits, misses, and size of the frame cache (see `FrameCache.stats`)."""
+        return self._cache.stats
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> np.ndarray:
+        return np.asarray(self._view, dtype=dtype)
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        if (index := self._frame_index(key)) is None:
+            return self._view[key]
+        in_frame = (key if isinstance(key, tuple) else (key,))[len(index) :]
+        if (frame := self._cache.get(index)) is None:
+            frame = np.asarray(self._view[index])
+            if self._is_written(index):
+                self._cache.put(index, frame)
+        return frame[in_frame] if in_frame else frame
+
+    def _frame_index(self, key: Any) -> tuple[int, ...] | None:
+        """Return the (non-negative) frame index selected by `key`, if any."""
+        keys: Sequence = key if isinstance(key, tuple) else (key,)
+        n_lead = self.ndim - 2
+        if len(keys) < n_lead:
+            return None
+        index = []
+        for k, size in zip(keys[:n_lead], self.shape, strict=False):
+            if not isinstance(k, (int, np.integer)):
+                return None
+            index.append(int(k) + size if k < 0 else int(k))
+        return tuple(index)
@@ -33,3 +33,12 @@ class PMDASignaler(Protocol):
     """  # noqa: E501
     eventStarted: ClassVar[PSignal]
     """Emits `(event: MDAEvent)` immediately before event setup and execution."""
+    previewReady: ClassVar[PSignal]
+    """Emits `(preview: np.ndarray, event: MDAEvent, metadata: dict)` with a downsampled preview of a frame.
+
+    Previews are disabled by default: nothing is emitted until `core.mda.preview.fps`
+    is set.  They are then emitted from a worker thread, at most `fps` times per second
+    for each camera and channel, and are downsampled so that their longest side is at
+    most 512 pixels by default.  See
+    [`MDARunner.preview`][pymmcore_plus.mda.MDARunner.preview] to configure them.
+    """  # noqa: E501
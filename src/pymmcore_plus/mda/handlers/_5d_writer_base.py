@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import threading
 import warnings
 from abc import abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
 from typing import TYPE_CHECKING, Generic, Protocol, TypeVar
 
+from pymmcore_plus.mda._generator_sequence import GeneratorMDASequence
+
+from ._chunk_assembler import ChunkAssembler
+from ._frame_meta_store import FrameMetaStore
 from ._util import position_sizes
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
+    from concurrent.futures import Future, ThreadPoolExecutor
 
     import numpy as np
     import useq
@@ -42,7 +48,28 @@ class _5DWriterBase(Generic[T]):
     `write_frame` method to customize how the data is written to disk, the
     `finalize_metadata` method to write frame metadata to disk at the end of the
     sequence, and the `store_frame_metadata` method to customize how metadata for each
-    frame is stored/handled
+    frame is stored/handled.  Subclasses whose arrays are chunked along the non-XY
+    dimensions SHOULD override `frame_chunks`, so that frames are assembled into
+    complete chunks before being written (see `ChunkAssembler`).
+
+    Parameters
+    ----------
+    metadata_spill_dir : str | None
+        If provided, accumulated frame metadata is periodically spilled to disk in this
+        directory (see `FrameMetaStore`), rather than being held in memory until the
+        end of the sequence.
+    max_chunk_buffer_bytes : int
+        Maximum number of bytes held in incomplete chunks (see `frame_chunks`), by
+        default 256 MiB.
+    position_workers : int
+        If greater than 0, `write_frame` is called on a pool of this many threads,
+        rather than in `frameReady`.  Each position key is assigned to one thread, so
+        frames of a position are written in order, while different positions are
+        compressed and written in parallel.  `frameReady` blocks when
+        `2 * position_workers` frames are waiting to be written, and all writes are
+        joined in `sequenceFinished`.  By default 0 (write in `frameReady`).
+        Subclasses that use this option must make `write_frame` safe to call
+        concurrently for *different* position arrays.
 
     Attributes
     ----------
@@ -50,10 +77,11 @@ class _5DWriterBase(Generic[T]):
         Local cache of {position index -> T}, where T is the type of data to be written
         by the writer (for example, `zarr.Array` or a `np.memmap`).  `T` must support
         `__setitem__` for adding frames to a specific index.
-    frame_metadatas : defaultdict[str, list[dict]]
-        Will accumulate frame metadata for each frame as the experiment progresses.
-        It is up to subclasses to do something with it in `finalize_metadata()`, and it
-        will be cleared at the end of each sequence.
+    frame_metadatas : defaultdict[str, FrameMetaStore]
+        Will accumulate frame metadata for each frame as the experiment progresses
+        (in a compact, columnar `FrameMetaStore` for each position key).  It is up to
+        subclasses to do something with it in `finalize_metadata()`, and it will be
+        cleared at the end of each sequence.
     current_sequence : useq.MDASequence | None
         The current sequence being written.  This will be set during `sequenceStarted`
         and cleared during `sequenceFinished`.
@@ -64,14 +92,37 @@ class _5DWriterBase(Generic[T]):
         singletons will be included, and 'p' will be removed
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        metadata_spill_dir: str | None = None,
+        max_chunk_buffer_bytes: int = 256 * 2**20,
+        position_workers: int = 0,
+    ) -> None:
         # local cache of {position index -> zarr.Array}
         # (will have a dataset for each position)
         self.position_arrays: dict[str, T] = {}
 
         # storage of individual frame metadata
-        # maps position key to list of frame metadata
-        self.frame_metadatas: defaultdict[str, list[FrameMetaV1]] = defaultdict(list)
+        # maps position key to a (columnar) store of frame metadata
+        self._metadata_spill_dir = metadata_spill_dir
+        self.frame_metadatas: defaultdict[str, FrameMetaStore] = defaultdict(
+            self._new_frame_meta_store
+        )
+
+        # buffers frames until their (multi-frame) chunk is complete
+        self._max_chunk_buffer_bytes = max_chunk_buffer_bytes
+        self._chunk_assembler = ChunkAssembler(max_chunk_buffer_bytes)
+
+        # per-position write threads (if position_workers > 0)
+        # each thread has its own ChunkAssembler (held in a thread-local),
+        # since the arrays of a position are only ever written by one thread.
+        self._position_workers = position_workers
+        self._lanes: list[ThreadPoolExecutor] = []
+        self._lane_assemblers: list[ChunkAssembler] = []
+        self._position_lanes: dict[str, int] = {}
+        self._pending_writes: deque[Future] = deque()
+        self._lane_local = threading.local()
 
         # set during sequenceStarted and cleared during sequenceFinished
         self.current_sequence: useq.MDASequence | None = None
@@ -85,6 +136,9 @@ class _5DWriterBase(Generic[T]):
         # actual timestamps for each frame
         self._timestamps: list[float] = []
 
+    def _new_frame_meta_store(self) -> FrameMetaStore:
+        return FrameMetaStore(spill_dir=self._metadata_spill_dir)
+
     # The next three methods - `sequenceStarted`, `sequenceFinished`, and `frameReady`
     # are to be connected directly to the MDA's signals, perhaps via listener_connected
 
@@ -118,11 +172,25 @@ class _5DWriterBase(Generic[T]):
             )
         self.frame_metadatas.clear()
         self.current_sequence = seq
-        if seq:
+        if isinstance(seq, GeneratorMDASequence):
+            # the shape of the experiment is unknown
+            self._position_sizes = []
+        elif seq:
             self._position_sizes = position_sizes(seq)
 
     def sequenceFinished(self, seq: useq.MDASequence) -> None:
         """On sequence finished, clear the current sequence."""
+        try:
+            self._join_writes()
+        finally:
+            for lane in self._lanes:
+                lane.shutdown()
+            self._lanes.clear()
+            self._position_lanes.clear()
+        for assembler in (self._chunk_assembler, *self._lane_assemblers):
+            assembler.flush()
+        # replaced rather than cleared, for `isel` calls from other threads
+        self._lane_assemblers = []
         self.finalize_metadata()
         self.frame_metadatas.clear()
 
@@ -148,6 +216,11 @@ class _5DWriterBase(Generic[T]):
         """Write frame to the zarr array for the appropriate position."""
         # get the position key to store the array in the group
         p_index = event.index.get("p", 0)
+        if isinstance(self.current_sequence, GeneratorMDASequence):
+            # positions (and their sizes) aren't known in advance:
+            # frames of each position are simply stored in the order they arrive.
+            while len(self._position_sizes) <= p_index:
+                self._position_sizes.append({})
         key = self.get_position_key(event)
         pos_sizes = self.position_sizes[p_index]
         if key in self.position_arrays:
@@ -173,9 +246,54 @@ class _5DWriterBase(Generic[T]):
         t = event.index.get("t", 0)
         if t >= len(self._timestamps) and "runner_time_ms" in meta:
             self._timestamps.append(meta["runner_time_ms"])
-        self.write_frame(ary, index, frame)
+        if self._position_workers > 0:
+            self._submit_write(key, ary, index, frame)
+        else:
+            self.write_frame(ary, index, frame)
         self.store_frame_metadata(key, event, meta)
 
+    def _submit_write(
+        self, key: str, ary: T, index: tuple[int, ...], frame: np.ndarray
+    ) -> None:
+        """Call `write_frame` on the worker thread assigned to position `key`."""
+        if not self._lanes:
+            from concurrent.futures import ThreadPoolExecutor
+
+            name = type(self).__name__
+            for i in range(self._position_workers):
+                assembler = ChunkAssembler(
+                    self._max_chunk_buffer_bytes // self._position_workers
+                )
+                self._lane_assemblers.append(assembler)
+                self._lanes.append(
+                    ThreadPoolExecutor(
+                        1,
+                        thread_name_prefix=f"{name}-writer-{i}",
+                        initializer=self._init_lane,
+                        initargs=(assembler,),
+                    )
+                )
+        lane = self._position_lanes.setdefault(
+            key, len(self._position_lanes) % self._position_workers
+        )
+
+        pending = self._pending_writes
+        max_pending = 2 * self._position_workers
+        while pending and (len(pending) >= max_pending or pending[0].done()):
+            pending.popleft().result()
+        pending.append(self._lanes[lane].submit(self.write_frame, ary, index, frame))
+
+    def _init_lane(self, assembler: ChunkAssembler) -> None:
+        self._lane_local.assembler = assembler
+
+    def _join_writes(self) -> None:
+        """Block until all frames submitted to the position workers are written.
+
+        Any exception raised while writing a frame is re-raised here.
+        """
+        while self._pending_writes:
+            self._pending_writes.popleft().result()
+
     @abstractmethod
     def new_array(
         self, position_key: str, dtype: np.dtype, dim_sizes: dict[str, int]
@@ -203,8 +321,10 @@ class _5DWriterBase(Generic[T]):
 
         Subclasses may override this method to customize how the data is written to
         disk.  The default implementation is to simply write the frame to the array at
-        the given index with `ary[index] = frame`.  Depending on the type of datastore,
-        additional steps may be necessary to flush or sync the data to disk.
+        the given index with `ary[index] = frame` (or, if `frame_chunks` returns chunks
+        spanning multiple frames, to buffer frames until their chunk is complete).
+        Depending on the type of datastore, additional steps may be necessary to flush
+        or sync the data to disk.
 
         Parameters
         ----------
@@ -216,7 +336,21 @@ class _5DWriterBase(Generic[T]):
             The incoming frame to write to disk.
         """
         # WRITE DATA TO DISK
-        ary[index] = frame
+        if (chunks := self.frame_chunks(ary)) and any(c > 1 for c in chunks):
+            assembler = getattr(self._lane_local, "assembler", self._chunk_assembler)
+            assembler.write(ary, index, frame, chunks)
+        else:
+            ary[index] = frame
+
+    def frame_chunks(self, ary: T) -> tuple[int, ...] | None:
+        """Return the chunk size of `ary` along its leading (non-XY) dimensions.
+
+        If any of these is larger than 1, `write_frame` will buffer frames until their
+        chunk is complete, and then write the whole chunk at once (rather than making
+        the datastore read-modify-write a partial chunk for every frame).  The default
+        implementation returns None (frames are written directly).
+        """
+        return None
 
     def store_frame_metadata(
         self, key: str, event: useq.MDAEvent, meta: FrameMetaV1
@@ -237,7 +371,7 @@ class _5DWriterBase(Generic[T]):
             Metadata associated with the frame.
         """
         # needn't be re-implemented in subclasses
-        # default implementation is to store the metadata in self._frame_metas
+        # default implementation is to store the metadata in self.frame_metadatas
         # use finalize_metadata to write to disk at the end of the sequence.
         self.frame_metadatas[key].append(meta or {})
 
@@ -259,7 +393,9 @@ class _5DWriterBase(Generic[T]):
 
         This is a convenience method to select data from the array for a given position
         key.  It will call the appropriate `__getitem__` method on the array with the
-        given indexers.
+        given indexers.  It may be called from another thread during the acquisition:
+        frames buffered in incomplete chunks are included, but frames still waiting
+        for a position worker (see `position_workers`) may not be visible yet.
 
         Parameters
         ----------
@@ -292,7 +428,14 @@ class _5DWriterBase(Generic[T]):
             raise IndexError(
                 f"Position index {p_index} out of range for {len(self.position_sizes)}"
             ) from e
-        data = self.position_arrays[self._position_key_map[p_index]]
+        key = self._position_key_map[p_index]
+        data = self.position_arrays[key]
         full = slice(None, None)
         index = tuple(indexers.get(k, full) for k in sizes)
-        return data[index]  # type: ignore
+        # include frames still buffered in incomplete chunks (without writing them),
+        # in the assembler of the worker thread that writes this position, if any
+        assembler = self._chunk_assembler
+        lane_assemblers = self._lane_assemblers
+        if (lane := self._position_lanes.get(key)) is not None and lane_assemblers:
+            assembler = lane_assemblers[lane]
+        return assembler.read(data, index)
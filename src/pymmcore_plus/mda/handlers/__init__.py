@@ -3,6 +3,10 @@ from __future__ import annotations
 import warnings
 from pathlib import Path
 
+from ._chunk_assembler import ChunkAssembler
+from ._dataset import Dataset, open_dataset
+from ._frame_meta_shards import FrameMetaShardWriter, iter_frame_meta_shards
+from ._frame_meta_store import FrameMetaStore
 from ._img_sequence_writer import ImageSequenceWriter
 from ._ome_tiff_writer import OMETiffWriter
 from ._ome_zarr_writer import OMEZarrWriter
@@ -18,11 +22,17 @@ warnings.warn(
 )
 
 __all__ = [
+    "ChunkAssembler",
+    "Dataset",
+    "FrameMetaShardWriter",
+    "FrameMetaStore",
     "ImageSequenceWriter",
     "OMETiffWriter",
     "OMEZarrWriter",
     "TensorStoreHandler",
     "handler_for_path",
+    "iter_frame_meta_shards",
+    "open_dataset",
 ]
 
 
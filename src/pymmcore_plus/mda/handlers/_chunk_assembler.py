@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _PartialChunk:
+    __slots__ = ("ary", "data", "filled", "start")
+
+    def __init__(self, ary: Any, start: tuple[int, ...], data: np.ndarray) -> None:
+        self.ary = ary
+        self.start = start
+        self.data = data
+        # which frames (along the leading dimensions) have been received
+        self.filled = np.zeros(data.shape[: len(start)], dtype=bool)
+
+    def frame_indices(self) -> Iterator[tuple[tuple[int, ...], tuple[int, ...]]]:
+        """Yield (local index, global index) for each frame received so far."""
+        for idx in np.argwhere(self.filled):
+            local = tuple(int(i) for i in idx)
+            yield local, tuple(i + s for i, s in zip(local, self.start, strict=False))
+
+
+class ChunkAssembler:
+    """Assembles frames into complete chunks before writing them to an array.
+
+    Writing single frames into an array whose chunks span multiple frames (e.g. chunks
+    of 10 z-planes) forces the storage library to read, modify, and re-compress the
+    whole chunk for every frame.  Instead, frames passed to `write` are buffered until
+    all frames of their chunk have arrived (in any order), and then the whole chunk is
+    written at once.
+
+    If the buffered chunks exceed `max_bytes`, the oldest incomplete chunks are
+    written frame-by-frame (i.e. falling back to read-modify-write) to free memory.
+    Call `flush` at the end of the acquisition to write any incomplete chunks.
+
+    `read` may be called from another thread while frames are being written: it
+    returns the data in the array, with the frames that are still buffered overlaid.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Maximum number of bytes to hold in incomplete chunks, by default 256 MiB.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20) -> None:
+        self.max_bytes = max_bytes
+        self._chunks: dict[tuple[int, tuple[int, ...]], _PartialChunk] = {}
+        self._nbytes = 0
+        # held while chunks are buffered or moved to their array, so that `read`
+        # sees every frame either in the buffer or in the array
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes currently held in incomplete chunks."""
+        return self._nbytes
+
+    def __len__(self) -> int:
+        """Number of incomplete chunks."""
+        return len(self._chunks)
+
+    def write(
+        self,
+        ary: Any,
+        index: tuple[int, ...],
+        frame: np.ndarray,
+        chunks: tuple[int, ...],
+    ) -> None:
+        """Buffer `frame` for `ary[index]`, writing its chunk to `ary` once complete.
+
+        Parameters
+        ----------
+        ary : Any
+            The array to write to. Must have `shape`, `dtype` and support `__setitem__`.
+        index : tuple[int, ...]
+            Index of the frame along the leading (non-frame) dimensions of `ary`.
+        frame : np.ndarray
+            The frame.  Its shape must match the trailing dimensions of `ary`.
+        chunks : tuple[int, ...]
+            Chunk size of `ary` along each of the leading dimensions.
+        """
+        with self._lock:
+            self._buffer(ary, index, frame, chunks)
+
+    def _buffer(
+        self,
+        ary: Any,
+        index: tuple[int, ...],
+        frame: np.ndarray,
+        chunks: tuple[int, ...],
+    ) -> None:
+        coords = tuple(i // c for i, c in zip(index, chunks, strict=False))
+        key = (id(ary), coords)
+        if (chunk := self._chunks.get(key)) is None:
+            start = tuple(c * s for c, s in zip(coords, chunks, strict=False))
+            shape = tuple(
+                min(c, n - s) for c, n, s in zip(chunks, ary.shape, start, strict=False)
+            )
+            data = np.zeros((*shape, *frame.shape), dtype=ary.dtype)
+            chunk = self._chunks[key] = _PartialChunk(ary, start, data)
+            self._nbytes += data.nbytes
+
+        local = tuple(i - s for i, s in zip(index, chunk.start, strict=False))
+        chunk.data[local] = frame
+        chunk.filled[local] = True
+        if chunk.filled.all():
+            self._write(key)
+
+        # evict the oldest incomplete chunks if we're over budget
+        while self._nbytes > self.max_bytes and self._chunks:
+            self._write(next(iter(self._chunks)))
+
+    def flush(self, ary: Any = None) -> None:
+        """Write all incomplete chunks (of `ary`, if provided) to their arrays."""
+        with self._lock:
+            for key in list(self._chunks):
+                if ary is None or key[0] == id(ary):
+                    self._write(key)
+
+    def read(self, ary: Any, index: tuple[int | slice, ...]) -> np.ndarray:
+        """Return `ary[index]`, including the frames of `ary` that are still buffered.
+
+        Nothing is written to `ary`.  `index` must have one int or slice for each
+        leading (non-frame) dimension, optionally followed by the frame (YX) index.
+        """
+        with self._lock:
+            chunks = [c for k, c in self._chunks.items() if k[0] == id(ary)]
+            if not chunks:
+                return ary[index]  # type: ignore[no-any-return]
+
+            # read with every leading dimension kept, to place the buffered frames
+            ndim = len(chunks[0].start)
+            lead = [range(n) for n in ary.shape[:ndim]]
+            for d, i in enumerate(index[:ndim]):
+                lead[d] = (
+                    lead[d][i : i + 1 or None] if isinstance(i, int) else lead[d][i]
+                )
+            in_frame = tuple(index[ndim:])
+            out = np.array(ary[(*(_as_slice(r) for r in lead), *in_frame)])
+            for chunk in chunks:
+                for local, global_ in chunk.frame_indices():
+                    if all(g in r for g, r in zip(global_, lead, strict=False)):
+                        pos = tuple(
+                            r.index(g) for g, r in zip(global_, lead, strict=False)
+                        )
+                        out[pos] = chunk.data[local][in_frame]
+
+        drop = tuple(0 if isinstance(i, int) else slice(None) for i in index[:ndim])
+        return out[drop]
+
+    def _write(self, key: tuple[int, tuple[int, ...]]) -> None:
+        chunk = self._chunks.pop(key)
+        self._nbytes -= chunk.data.nbytes
+        if chunk.filled.all():
+            shape: tuple[int, ...] = chunk.filled.shape
+            idx = tuple(
+                slice(s, s + n) for s, n in zip(chunk.start, shape, strict=False)
+            )
+            chunk.ary[idx] = chunk.data
+        else:
+            for local, global_ in chunk.frame_indices():
+                chunk.ary[global_] = chunk.data[local]
+
+
+def _as_slice(r: range) -> slice:
+    """Return the slice selecting the indices in `r`."""
+    return slice(r.start, r.stop if r.stop >= 0 else None, r.step)
@@ -0,0 +1,605 @@
+"""Lazy readers for the data written by the built-in handlers."""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from pymmcore_plus.metadata.serialize import json_loads
+
+from ._frame_index import FrameIndexTable
+from ._frame_meta_shards import iter_frame_meta_shards
+from ._frame_meta_store import FrameMetaStore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Mapping
+    from os import PathLike
+
+    import tensorstore as ts
+    from typing_extensions import Self  # py311
+
+    Index = int | slice
+
+DEFAULT_CACHE_BYTES = 256 * 2**20
+
+
+def open_dataset(
+    path: str | PathLike[str],
+    *,
+    cache_bytes: int = DEFAULT_CACHE_BYTES,
+    metadata_spill_dir: str | PathLike[str] | None = None,
+) -> Dataset:
+    """Open the data written by one of the built-in handlers, for lazy reading.
+
+    The layout on disk is detected from `path`:
+
+    - `OMETiffWriter`: the `.tif`/`.tiff` filename passed to the writer (files of
+      multiple positions, named `<name>_<key>.ome.tif`, are found automatically).
+      Frames are read from a NumPy memmap of each file.
+    - `OMEZarrWriter`: the zarr group directory.  One array per position.
+    - `TensorStoreHandler`: the zarr (v2 or v3) array directory.
+    - `ImageSequenceWriter`: the directory of image files.
+
+    Zarr arrays are read with tensorstore, with up to `cache_bytes` of decoded chunks
+    cached in memory.  Nothing is read until data (or frame metadata) is requested.
+
+    Parameters
+    ----------
+    path : str | PathLike
+        Path to the dataset.
+    cache_bytes : int
+        Size of the chunk cache for zarr datasets, by default 256 MiB.
+    metadata_spill_dir : str | PathLike | None
+        Passed to the `FrameMetaStore` that holds the frame metadata (see
+        `Dataset.frame_metadata`), to bound the memory it uses.
+
+    Examples
+    --------
+    >>> ds = open_dataset("experiment.ome.zarr")
+    >>> ds.sizes()
+    {'t': 10, 'c': 2, 'y': 512, 'x': 512}
+    >>> ds.isel(t=3, c=0).shape
+    (512, 512)
+    >>> ds.frame_metadata().column("runner_time_ms")
+    array([...])
+    """
+    path = Path(path).expanduser()
+    kwargs: dict[str, Any] = {"metadata_spill_dir": metadata_spill_dir}
+    if ".tif" in path.name.lower():
+        return OMETiffDataset(path, **kwargs)
+    if not path.is_dir():
+        raise FileNotFoundError(f"No dataset found at {str(path)!r}")
+    if (path / ".zgroup").exists():
+        return OMEZarrDataset(path, cache_bytes=cache_bytes, **kwargs)
+    if (path / ".zarray").exists() or (path / "zarr.json").exists():
+        return TensorStoreDataset(path, cache_bytes=cache_bytes, **kwargs)
+    return ImageSequenceDataset(path, **kwargs)
+
+
+class Dataset(ABC):
+    """A read-only, lazily-loaded dataset written by one of the built-in handlers.
+
+    A dataset contains one array per key (e.g. per position, for the writers that
+    store each position separately), each with named dimensions.  Use `isel` to read
+    data by dimension name, or index the arrays returned by `array` directly (only
+    the requested frames are read from disk).
+    """
+
+    def __init__(
+        self, path: Path, *, metadata_spill_dir: str | PathLike[str] | None = None
+    ) -> None:
+        self.path = path
+        self._metadata_spill_dir = metadata_spill_dir
+        self._frame_metadata: dict[str, FrameMetaStore] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.path)!r}, keys={self.keys})"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release any open files and cached frame metadata."""
+        for store in self._frame_metadata.values():
+            store.clear()
+        self._frame_metadata.clear()
+
+    @property
+    @abstractmethod
+    def keys(self) -> tuple[str, ...]:
+        """Keys of the arrays in the dataset (e.g. `("p0", "p1")`)."""
+
+    @abstractmethod
+    def dims(self, key: str | None = None) -> tuple[str, ...]:
+        """Dimension names of the array at `key` (by default, the first)."""
+
+    @abstractmethod
+    def array(self, key: str | None = None) -> Any:
+        """Lazy array for `key`, indexing it returns a NumPy array."""
+
+    @abstractmethod
+    def _iter_frame_metadata(self, key: str) -> Iterable[Mapping[str, Any]]:
+        """Yield the metadata of each frame of `key`, in the order they were written."""
+
+    def __getitem__(self, key: str) -> Any:
+        return self.array(key)
+
+    def sizes(self, key: str | None = None) -> dict[str, int]:
+        """Return `{dim: size}` for the array at `key` (by default, the first)."""
+        return dict(zip(self.dims(key), self.array(key).shape, strict=False))
+
+    def isel(
+        self,
+        indexers: Mapping[str, int | slice] | None = None,
+        **indexers_kwargs: int | slice,
+    ) -> np.ndarray:
+        """Select data by dimension name.
+
+        If the dataset has one array per position, the `p` indexer selects the
+        position (by index in `keys`, default 0).  Dimensions that are not in
+        `indexers` are returned in full.
+
+        Examples
+        --------
+        >>> data = ds.isel(p=1, t=0, z=slice(0, 4), x=slice(128, 256))
+        """
+        indexers = {**(indexers or {}), **indexers_kwargs}
+        key = self.keys[0]
+        if "p" not in self.dims(key):
+            p_index = indexers.pop("p", 0)
+            if isinstance(p_index, slice):
+                raise NotImplementedError("Cannot slice over position index")
+            try:
+                key = self.keys[p_index]
+            except IndexError as e:
+                raise IndexError(
+                    f"Position index {p_index} out of range for {len(self.keys)}"
+                ) from e
+        dims = self.dims(key)
+        if unknown := set(indexers) - set(dims):
+            raise KeyError(f"Unknown dimension(s) {unknown}. Must be one of {dims}.")
+        full = slice(None)
+        return np.asarray(self.array(key)[tuple(indexers.get(d, full) for d in dims)])
+
+    def frame_metadata(self, key: str | None = None) -> FrameMetaStore:
+        """Metadata of each frame of the array at `key` (by default, the first).
+
+        The metadata is read (once) into a columnar `FrameMetaStore`, use
+        `FrameMetaStore.column` to get the values of a single field as an array.
+        """
+        key = self.keys[0] if key is None else key
+        if (store := self._frame_metadata.get(key)) is None:
+            store = FrameMetaStore(spill_dir=self._metadata_spill_dir)
+            store.extend(self._iter_frame_metadata(key))
+            self._frame_metadata[key] = store
+        return store
+
+
+# ---------------------------------------------------------------------------
+# lazy arrays
+
+
+class _TensorStoreArray:
+    """Wraps a tensorstore, so that indexing returns a NumPy array."""
+
+    def __init__(self, store: ts.TensorStore) -> None:
+        self.store = store
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(self.store.shape)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return np.dtype(self.store.dtype.numpy_dtype)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    def __getitem__(self, index: Any) -> np.ndarray:
+        return np.asarray(self.store[index].read().result())
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        return np.asarray(self[...], dtype=dtype)
+
+
+class _FrameStack:
+    """A dense, N-dimensional view of individually stored frames.
+
+    The frame at each (leading) index is found with `rows`, and read with
+    `read_frames`.  Indices with no frame are filled with zeros.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        frame_shape: tuple[int, ...],
+        dtype: np.dtype,
+        rows: Callable[[np.ndarray], np.ndarray],
+        read_frames: Callable[[np.ndarray], Iterable[np.ndarray]],
+    ) -> None:
+        self.shape = (*shape, *frame_shape)
+        self.dtype = np.dtype(dtype)
+        self._lead_shape = shape
+        self._rows = rows
+        self._read_frames = read_frames
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    def __array__(self, dtype: Any = None, copy: Any = None) -> np.ndarray:
+        return np.asarray(self[...], dtype=dtype)
+
+    def __getitem__(self, index: Any) -> np.ndarray:
+        if not isinstance(index, tuple):
+            index = (index,)
+        if any(i is Ellipsis for i in index):
+            i = index.index(Ellipsis)
+            fill = (slice(None),) * (self.ndim - len(index) + 1)
+            index = (*index[:i], *fill, *index[i + 1 :])
+        index = index + (slice(None),) * (self.ndim - len(index))
+        n_lead = len(self._lead_shape)
+        lead, trailing = index[:n_lead], index[n_lead:]
+
+        ranges, squeeze = [], []
+        for i, n in zip(lead, self._lead_shape, strict=False):
+            if isinstance(i, slice):
+                ranges.append(np.arange(*i.indices(n)))
+                squeeze.append(slice(None))
+            else:
+                i = int(i)
+                if not -n <= i < n:
+                    raise IndexError(f"index {i} is out of bounds for size {n}")
+                ranges.append(np.array([i % n]))
+                squeeze.append(0)  # type: ignore[arg-type]
+
+        lens = tuple(len(r) for r in ranges)
+        frame_shape = self.shape[n_lead:]
+        out = np.zeros((*lens, *frame_shape), dtype=self.dtype)
+        if out.size:
+            grid = np.meshgrid(*ranges, indexing="ij") if ranges else []
+            linear = (
+                np.ravel_multi_index([g.ravel() for g in grid], self._lead_shape)
+                if ranges
+                else np.zeros(1, dtype=np.intp)
+            )
+            rows = self._rows(linear)
+            flat = out.reshape(-1, *frame_shape)
+            found = np.flatnonzero(rows >= 0)
+            for i, frame in zip(found, self._read_frames(rows[found]), strict=True):
+                flat[i] = frame
+        return out[(*squeeze, *trailing)]
+
+
+def _table_rows(table: FrameIndexTable, shape: tuple[int, ...]) -> Callable:
+    """Return a function mapping linear (C-order) indices to rows of `table`.
+
+    Axes that are missing from a frame's index are treated as 0, and if the same
+    index was written more than once, the last frame is used.
+    """
+    coords = np.maximum(table.coords, 0).astype(np.intp)
+    keys = np.ravel_multi_index(coords.T, shape) if len(coords) else coords[:, 0]
+    # sort by key, keeping only the last row for repeated keys
+    order = np.lexsort((np.arange(len(keys)), keys))
+    keys, rows = keys[order], order
+    last = np.ones(len(keys), dtype=bool)
+    last[:-1] = keys[1:] != keys[:-1]
+    keys, rows = keys[last], rows[last]
+
+    def _rows(linear: np.ndarray) -> np.ndarray:
+        if not len(keys):
+            return np.full(len(linear), -1)
+        pos = np.minimum(np.searchsorted(keys, linear), len(keys) - 1)
+        return np.where(keys[pos] == linear, rows[pos], -1)
+
+    return _rows
+
+
+def _table_shape(table: FrameIndexTable) -> tuple[int, ...]:
+    return tuple(table.axis_max(ax) + 1 for ax in table.axes)
+
+
+# ---------------------------------------------------------------------------
+# datasets
+
+
+class OMETiffDataset(Dataset):
+    """Dataset written by `OMETiffWriter` (one file per position)."""
+
+    def __init__(self, path: Path, **kwargs: Any) -> None:
+        super().__init__(path, **kwargs)
+        self._files = _tiff_position_files(path)
+        if not self._files:
+            raise FileNotFoundError(f"No dataset found at {str(path)!r}")
+        self._arrays: dict[str, Any] = {}
+        self._dims: dict[str, tuple[str, ...]] = {}
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        return tuple(self._files)
+
+    def dims(self, key: str | None = None) -> tuple[str, ...]:
+        key = self.keys[0] if key is None else key
+        if key not in self._dims:
+            self.array(key)
+        return self._dims[key]
+
+    def array(self, key: str | None = None) -> Any:
+        import tifffile
+
+        key = self.keys[0] if key is None else key
+        if key not in self._arrays:
+            with tifffile.TiffFile(self._files[key]) as tf:
+                series = tf.series[0]
+                axes, shape, dtype = series.axes, series.shape, series.dtype
+                contiguous = series.dataoffset is not None
+            self._dims[key] = tuple(axes.lower())
+            if contiguous:
+                self._arrays[key] = tifffile.memmap(self._files[key], mode="r")
+            else:  # pragma: no cover
+                self._arrays[key] = self._page_stack(key, shape, dtype)
+        return self._arrays[key]
+
+    def _page_stack(
+        self, key: str, shape: tuple[int, ...], dtype: np.dtype
+    ) -> _FrameStack:
+        """Fallback for non-contiguous files: read the pages of each frame."""
+        import tifffile
+
+        path = self._files[key]
+
+        def _read_pages(pages: np.ndarray) -> Iterator[np.ndarray]:
+            with tifffile.TiffFile(path) as tf:
+                for page in pages:
+                    yield tf.pages[int(page)].asarray()
+
+        return _FrameStack(shape[:-2], shape[-2:], dtype, lambda i: i, _read_pages)
+
+    def _iter_frame_metadata(self, key: str) -> Iterable[Mapping[str, Any]]:
+        # OMETiffWriter doesn't store per-frame metadata
+        return ()
+
+
+def _tiff_position_files(path: Path) -> dict[str, Path]:
+    """Return {position key: file} for the files written by `OMETiffWriter`."""
+    if path.exists():
+        return {"p0": path}
+    # multiple positions are written to `<name>_<key><ext>`
+    ext = ".ome.tif" if ".ome.tif" in path.name else ".tif"
+    prefix, _, suffix = path.name.partition(ext)
+    pattern = re.compile(rf"{re.escape(prefix)}_(.+){re.escape(ext + suffix)}$")
+    files = {}
+    for file in path.parent.glob(f"{prefix}_*{ext}{suffix}"):
+        if match := pattern.match(file.name):
+            files[match.group(1)] = file
+    return dict(sorted(files.items(), key=lambda kv: _natural_key(kv[0])))
+
+
+def _natural_key(key: str) -> tuple:
+    return tuple(int(s) if s.isdigit() else s for s in re.split(r"(\d+)", key))
+
+
+class _ZarrDatasetBase(Dataset):
+    def __init__(
+        self, path: Path, *, cache_bytes: int = DEFAULT_CACHE_BYTES, **kwargs: Any
+    ) -> None:
+        import tensorstore as ts
+
+        super().__init__(path, **kwargs)
+        self._ts = ts
+        # a single chunk cache shared by all arrays of the dataset
+        self._context = ts.Context({"cache_pool": {"total_bytes_limit": cache_bytes}})
+        self._arrays: dict[str, Any] = {}
+
+    def _open(self, path: Path) -> ts.TensorStore:
+        driver = "zarr3" if (path / "zarr.json").exists() else "zarr"
+        spec = {"driver": driver, "kvstore": {"driver": "file", "path": str(path)}}
+        return self._ts.open(spec, read=True, context=self._context).result()
+
+    def _read_attrs(self, path: Path) -> dict[str, Any]:
+        if (zattrs := path / ".zattrs").exists():
+            return json_loads(zattrs.read_bytes())  # type: ignore[no-any-return]
+        if (zarr_json := path / "zarr.json").exists():
+            return json_loads(zarr_json.read_bytes()).get("attributes", {})  # type: ignore[no-any-return]
+        return {}
+
+    def _iter_attrs_metadata(
+        self, root: Path, attrs: Mapping[str, Any], list_key: str, shards_key: str
+    ) -> Iterable[Mapping[str, Any]]:
+        if (pointer := attrs.get(shards_key)) is not None:
+            return iter_frame_meta_shards(lambda k: (root / k).read_bytes(), pointer)
+        return attrs.get(list_key, ())  # type: ignore[no-any-return]
+
+
+class OMEZarrDataset(_ZarrDatasetBase):
+    """Dataset written by `OMEZarrWriter` (one array per position)."""
+
+    def __init__(self, path: Path, **kwargs: Any) -> None:
+        super().__init__(path, **kwargs)
+        attrs = self._read_attrs(path)
+        self._keys = tuple(
+            item["datasets"][0]["path"] for item in attrs.get("multiscales", ())
+        )
+        self._dims: dict[str, tuple[str, ...]] = {}
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        return self._keys
+
+    def dims(self, key: str | None = None) -> tuple[str, ...]:
+        key = self.keys[0] if key is None else key
+        if key not in self._dims:
+            attrs = self._read_attrs(self.path / key)
+            self._dims[key] = tuple(attrs.get("_ARRAY_DIMENSIONS", ()))
+        return self._dims[key]
+
+    def array(self, key: str | None = None) -> _TensorStoreArray:
+        key = self.keys[0] if key is None else key
+        if key not in self._arrays:
+            self._arrays[key] = _TensorStoreArray(self._open(self.path / key))
+        return self._arrays[key]  # type: ignore[no-any-return]
+
+    def _iter_frame_metadata(self, key: str) -> Iterable[Mapping[str, Any]]:
+        attrs = self._read_attrs(self.path / key)
+        return self._iter_attrs_metadata(
+            self.path, attrs, "frame_meta", "frame_meta_shards"
+        )
+
+
+class TensorStoreDataset(_ZarrDatasetBase):
+    """Dataset written by `TensorStoreHandler` (a single array).
+
+    If the handler stored frames in acquisition order (along a `frame` dimension,
+    for sequences with an unknown shape), the array is presented as a dense
+    N-dimensional array using the stored frame index.
+    """
+
+    KEY = "data"
+
+    def __init__(self, path: Path, **kwargs: Any) -> None:
+        super().__init__(path, **kwargs)
+        self._attrs = self._read_attrs(path)
+        self._dims: tuple[str, ...] | None = None
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        return (self.KEY,)
+
+    def dims(self, key: str | None = None) -> tuple[str, ...]:
+        self.array()
+        return self._dims  # type: ignore[return-value]
+
+    def array(self, key: str | None = None) -> Any:
+        if self.KEY not in self._arrays:
+            store = self._open(self.path)
+            dims = tuple(self._attrs.get("_ARRAY_DIMENSIONS", ())) or tuple(
+                store.domain.labels
+            )
+            ary: Any = _TensorStoreArray(store)
+            if (index := self._attrs.get("frame_indices")) is not None:
+                ary, dims = self._frame_stack(ary, FrameIndexTable.from_json(index))
+            self._arrays[self.KEY], self._dims = ary, dims
+        return self._arrays[self.KEY]
+
+    def _frame_stack(
+        self, frames: _TensorStoreArray, table: FrameIndexTable
+    ) -> tuple[_FrameStack, tuple[str, ...]]:
+        shape = _table_shape(table)
+
+        def _read(rows: np.ndarray) -> np.ndarray:
+            return frames[self._ts.d[0][rows.tolist()]] if len(rows) else rows
+
+        stack = _FrameStack(
+            shape, frames.shape[1:], frames.dtype, _table_rows(table, shape), _read
+        )
+        return stack, (*table.axes, "y", "x")
+
+    def _iter_frame_metadata(self, key: str) -> Iterable[Mapping[str, Any]]:
+        return self._iter_attrs_metadata(
+            self.path, self._attrs, "frame_metadatas", "frame_metadata_shards"
+        )
+
+
+class ImageSequenceDataset(Dataset):
+    """Dataset written by `ImageSequenceWriter` (one file per frame).
+
+    The files are presented as a dense N-dimensional array, using the event index
+    of each frame (from the frame metadata, or else parsed from the filenames).
+    """
+
+    KEY = "data"
+
+    def __init__(self, path: Path, **kwargs: Any) -> None:
+        from ._img_sequence_writer import ImageSequenceWriter
+
+        super().__init__(path, **kwargs)
+        self._meta_file = path / ImageSequenceWriter.FRAME_META_PATH
+        self._meta_log = path / ImageSequenceWriter.FRAME_META_LOG_PATH
+        self._array: _FrameStack | None = None
+        self._files: list[str] = []
+        self._table = FrameIndexTable()
+
+    @property
+    def keys(self) -> tuple[str, ...]:
+        return (self.KEY,)
+
+    def dims(self, key: str | None = None) -> tuple[str, ...]:
+        self.array()
+        return (*self._table.axes, "y", "x")
+
+    def array(self, key: str | None = None) -> _FrameStack:
+        if self._array is None:
+            self._index_files()
+            if not self._files:
+                raise FileNotFoundError(f"No images found in {str(self.path)!r}")
+            first = _imread(self.path / self._files[0])
+            shape = _table_shape(self._table)
+            self._array = _FrameStack(
+                shape,
+                first.shape,
+                first.dtype,
+                _table_rows(self._table, shape),
+                self._read_files,
+            )
+        return self._array
+
+    def _read_files(self, rows: np.ndarray) -> Iterator[np.ndarray]:
+        for row in rows:
+            yield _imread(self.path / self._files[row])
+
+    def _index_files(self) -> None:
+        """Find the files and event index of each frame."""
+        for fname, meta in self._iter_file_metadata():
+            index = (meta.get("mda_event") or {}).get("index")
+            self._add_file(fname, index)
+        if not self._files:
+            # no metadata... parse the indices from the file names
+            pattern = re.compile(r"(?:^|_)([a-z])(\d+)(?=_|\.)")
+            for file in sorted(self.path.iterdir()):
+                if file.name.startswith("_") or not file.is_file():
+                    continue
+                self._add_file(file.name, None, pattern)
+
+    def _add_file(
+        self, fname: str, index: Mapping[str, int] | None, pattern: Any = None
+    ) -> None:
+        if index is None:
+            pattern = pattern or re.compile(r"(?:^|_)([a-z])(\d+)(?=_|\.)")
+            index = {k: int(v) for k, v in pattern.findall(fname)}
+        self._files.append(fname)
+        self._table.append(index)
+
+    def _iter_file_metadata(self) -> Iterator[tuple[str, Mapping[str, Any]]]:
+        """Yield (filename, metadata) for each frame, in the order they were written."""
+        if self._meta_file.exists():
+            yield from json_loads(self._meta_file.read_bytes()).items()
+        elif self._meta_log.exists():
+            # the acquisition didn't finish... read the log
+            with open(self._meta_log, "rb") as fh:
+                for line in fh:
+                    if line.strip():
+                        yield from json_loads(line).items()
+
+    def _iter_frame_metadata(self, key: str) -> Iterable[Mapping[str, Any]]:
+        return (meta for _, meta in self._iter_file_metadata())
+
+
+def _imread(path: Path) -> np.ndarray:
+    if path.suffix.lower() in {".tif", ".tiff"}:
+        import tifffile
+
+        return tifffile.imread(path)
+    try:
+        import imageio
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(f"imageio is required to read {path.suffix!r} files") from e
+    return np.asarray(imageio.imread(path))  # pragma: no cover
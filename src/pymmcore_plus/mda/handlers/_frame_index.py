@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import base64
+import warnings
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# coordinate used for axes that are not present in a frame's event index
+MISSING = -1
+
+
+class FrameIndexTable:
+    """Table of the event index of each frame, in the order the frames were written.
+
+    Row `i` holds the coordinates (one int32 column per axis) of the `i`-th frame, so
+    looking up the frame(s) for an event index is a vectorised comparison over the
+    columns rather than a Python dict lookup per frame.  Axes that are absent from a
+    frame's event index are stored as -1.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.axes: list[str] = []
+        self._coords = np.full((capacity, 0), MISSING, dtype=np.int32)
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def coords(self) -> np.ndarray:
+        """(nframes, naxes) array of the coordinates of each frame."""
+        return self._coords[: self._len]
+
+    def clear(self) -> None:
+        """Remove all frames."""
+        self.axes = []
+        self._coords = np.full((len(self._coords), 0), MISSING, dtype=np.int32)
+        self._len = 0
+
+    def append(self, index: Mapping[str, int]) -> int:
+        """Add a frame with event `index`, returning its frame number."""
+        if new_axes := [k for k in index if k not in self.axes]:
+            self.axes.extend(new_axes)
+            pad = np.full((len(self._coords), len(new_axes)), MISSING, np.int32)
+            self._coords = np.hstack([self._coords, pad])
+        if self._len == len(self._coords):
+            grow = np.full(
+                (max(len(self._coords), 1), len(self.axes)), MISSING, np.int32
+            )
+            self._coords = np.vstack([self._coords, grow])
+        row = self._coords[self._len]
+        for k, v in index.items():
+            row[self.axes.index(k)] = v
+        self._len += 1
+        return self._len - 1
+
+    def axis_max(self, axis: str) -> int:
+        """Return the highest coordinate seen along `axis` (-1 if never seen)."""
+        if axis not in self.axes or not self._len:
+            return MISSING
+        return int(self.coords[:, self.axes.index(axis)].max())
+
+    def lookup(self, indexers: Mapping[str, int | slice]) -> list[int]:
+        """Return the frame numbers matching `indexers`.
+
+        Each indexer may be an int or a slice (resolved against the highest coordinate
+        seen along its axis).  Frames must match *exactly*: axes that are not in
+        `indexers` must also be absent from the frame's event index.  Frames are
+        returned in C-order of the `indexers` (the first indexer varies slowest), in the
+        order of the values selected by each slice (so e.g. `slice(None, None, -1)`
+        returns frames in reverse).  If the same event index was written more than
+        once, the last frame is used.
+        """
+        coords = self.coords
+        mask = np.ones(len(coords), dtype=bool)
+        cols: list[int] = []
+        # position of each coordinate in the requested values of each indexer
+        ranks: list[np.ndarray] = []
+        n_requested = 1
+        for axis, value in indexers.items():
+            if axis not in self.axes:
+                mask[:] = False
+                break
+            col = self.axes.index(axis)
+            cols.append(col)
+            if isinstance(value, slice):
+                values = np.arange(*value.indices(self.axis_max(axis) + 1))
+                n_requested *= len(values)
+                mask &= np.isin(coords[:, col], values)
+                rank = np.zeros(self.axis_max(axis) + 1, dtype=np.intp)
+                rank[values] = np.arange(len(values))
+                ranks.append(rank)
+            else:
+                mask &= coords[:, col] == value
+                ranks.append(np.zeros(max(value, 0) + 1, dtype=np.intp))
+        for col, axis in enumerate(self.axes):
+            if axis not in indexers:
+                mask &= coords[:, col] == MISSING
+
+        rows = np.flatnonzero(mask)
+        if cols and len(rows) > 1:
+            # order by the position of each coordinate in the requested values
+            keys = np.stack(
+                [
+                    rank[coords[rows, col]]
+                    for rank, col in zip(ranks, cols, strict=True)
+                ],
+                axis=1,
+            )
+            # lexsort is stable, so duplicates stay in write order
+            order = np.lexsort(keys.T[::-1])
+            rows, keys = rows[order], keys[order]
+            last = np.ones(len(rows), dtype=bool)
+            last[:-1] = np.any(keys[1:] != keys[:-1], axis=1)
+            rows = rows[last]
+
+        if len(rows) < n_requested and any(
+            isinstance(v, slice) for v in indexers.values()
+        ):
+            warnings.warn(
+                f"{n_requested - len(rows)} of {n_requested} indices in {indexers} "
+                "not found in frame_indices.",
+                stacklevel=3,
+            )
+        return rows.tolist()
+
+    def to_json(self) -> dict[str, Any]:
+        """Return a compact JSON-serializable representation of the table."""
+        coords = self.coords.astype("<i4", copy=False)
+        return {
+            "axes": list(self.axes),
+            "shape": list(coords.shape),
+            "dtype": "<i4",
+            "data": base64.b64encode(coords.tobytes()).decode("ascii"),
+        }
+
+    @classmethod
+    def from_json(cls, data: Mapping[str, Any] | Sequence) -> FrameIndexTable:
+        """Create a table from the output of `to_json`.
+
+        The legacy format (a list of `[[[axis, coord], ...], frame]` items) is also
+        accepted.
+        """
+        table = cls(capacity=0)
+        if not isinstance(data, Mapping):
+            return table._from_legacy_json(data)
+        buf = base64.b64decode(data["data"])
+        coords = np.frombuffer(buf, dtype=data.get("dtype", "<i4"))
+        table.axes = list(data["axes"])
+        table._coords = coords.reshape(data["shape"]).astype(np.int32)
+        table._len = len(table._coords)
+        return table
+
+    def _from_legacy_json(self, data: Sequence) -> FrameIndexTable:
+        items = [(dict(index), int(frame)) for index, frame in data]
+        for index, _ in items:
+            self.axes.extend(k for k in index if k not in self.axes)
+        # frames that were overwritten are absent (and stay all-MISSING here)
+        n_frames = max((frame for _, frame in items), default=-1) + 1
+        self._coords = np.full((n_frames, len(self.axes)), MISSING, dtype=np.int32)
+        for index, frame in items:
+            for k, v in index.items():
+                self._coords[frame, self.axes.index(k)] = v
+        self._len = n_frames
+        return self
@@ -0,0 +1,103 @@
+"""Incremental (sharded) storage of per-frame metadata next to the image data."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from pymmcore_plus.metadata.serialize import json_dumps, json_loads
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Mapping
+
+    from pymmcore_plus.metadata import FrameMetaV1
+
+SHARDS_FORMAT = "jsonl-shards"
+
+
+class FrameMetaShardWriter:
+    """Writes frame metadata to JSON-lines shards as frames arrive.
+
+    Every `shard_size` frames, the (JSON-encoded) metadata of those frames is written
+    as one shard, under `{prefix}/{n}.jsonl`, by calling `write(key, data)`.  This way
+    the metadata is flushed to storage during the acquisition, and `close` only has to
+    write the last (partial) shard and return a small pointer to the shards (which
+    can be stored in the attributes of the dataset, and passed to
+    `iter_frame_meta_shards` to read the metadata back).
+
+    Parameters
+    ----------
+    write : Callable[[str, bytes], Any]
+        Called with a key and the encoded shard to store it.
+    prefix : str
+        Key prefix of the shards (e.g. `"frame_meta/p0"`).
+    shard_size : int
+        Number of frames per shard, by default 1000.
+    """
+
+    def __init__(
+        self, write: Callable[[str, bytes], Any], prefix: str, shard_size: int = 1000
+    ) -> None:
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1.")
+        self._write = write
+        self.prefix = prefix.rstrip("/")
+        self.shard_size = shard_size
+        self._lines: list[bytes] = []
+        self._n_shards = 0
+        self._count = 0
+        self._last: FrameMetaV1 | Mapping[str, Any] | None = None
+
+    def __len__(self) -> int:
+        """Number of frames appended."""
+        return self._count
+
+    @property
+    def last(self) -> FrameMetaV1 | Mapping[str, Any] | None:
+        """Metadata of the most recently appended frame (None if there isn't one)."""
+        return self._last
+
+    def append(self, meta: FrameMetaV1 | Mapping[str, Any]) -> None:
+        """Add metadata for a frame, writing a shard if it is full."""
+        self._lines.append(json_dumps(meta))
+        self._count += 1
+        self._last = meta
+        if len(self._lines) >= self.shard_size:
+            self._write_shard()
+
+    def close(self) -> dict[str, Any]:
+        """Write any remaining frames, and return a pointer to the shards."""
+        if self._lines:
+            self._write_shard()
+        return {
+            "format": SHARDS_FORMAT,
+            "path": self.prefix,
+            "shard_size": self.shard_size,
+            "count": self._count,
+        }
+
+    def _write_shard(self) -> None:
+        key = f"{self.prefix}/{self._n_shards}.jsonl"
+        self._write(key, b"\n".join(self._lines) + b"\n")
+        self._lines = []
+        self._n_shards += 1
+
+
+def iter_frame_meta_shards(
+    read: Callable[[str], bytes], pointer: Mapping[str, Any]
+) -> Iterator[dict[str, Any]]:
+    """Yield the frame metadata dicts stored by a `FrameMetaShardWriter`.
+
+    Parameters
+    ----------
+    read : Callable[[str], bytes]
+        Called with the key of each shard, to read its contents.
+    pointer : Mapping[str, Any]
+        The pointer returned by `FrameMetaShardWriter.close`.
+    """
+    if pointer.get("format") != SHARDS_FORMAT:  # pragma: no cover
+        raise ValueError(f"Unknown frame metadata format: {pointer.get('format')!r}")
+    n_shards = -(-pointer["count"] // pointer["shard_size"])
+    for n in range(n_shards):
+        for line in read(f"{pointer['path']}/{n}.jsonl").splitlines():
+            if line:
+                yield json_loads(line)
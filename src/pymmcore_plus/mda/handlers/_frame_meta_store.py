@@ -0,0 +1,361 @@
+"""Compact, columnar storage of per-frame metadata."""
+
+from __future__ import annotations
+
+import shutil
+import tempfile
+import weakref
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, overload
+
+import numpy as np
+
+from pymmcore_plus.metadata.serialize import json_dumps, json_loads, to_builtins
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from os import PathLike
+    from typing import IO
+
+    from pymmcore_plus.metadata import FrameMetaV1
+
+# column kinds
+_BOOL, _INT, _FLOAT, _STR, _JSON = "b", "i", "f", "s", "j"
+# (strings and JSON-encoded values are stored as indices into a string table)
+_DTYPES = {
+    _BOOL: bool,
+    _INT: np.int64,
+    _FLOAT: np.float64,
+    _STR: np.int32,
+    _JSON: np.int32,
+}
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+_MIN_CAPACITY = 256
+
+
+class _Column:
+    __slots__ = ("kind", "present", "values")
+
+    def __init__(self, kind: str, capacity: int) -> None:
+        self.kind = kind
+        self.values: np.ndarray = np.zeros(capacity, dtype=_DTYPES[kind])
+        self.present: np.ndarray = np.zeros(capacity, dtype=bool)
+
+    def resize(self, capacity: int) -> None:
+        for attr in ("values", "present"):
+            old = getattr(self, attr)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, attr, new)
+
+
+class FrameMetaStore(Sequence["FrameMetaV1"]):
+    """Columnar accumulator for per-frame metadata.
+
+    Frame metadata dicts are mostly the same from frame to frame: the same keys,
+    numbers that vary, and strings/nested values that are highly repetitive.  Rather
+    than keeping one dict per frame, this store flattens each (nested) dict and keeps
+    every leaf in a typed column:
+
+    - `bool`, `int` and `float` values are stored in NumPy arrays.
+    - strings are interned in a string table, and stored as `int32` codes.
+    - anything else (lists, `None`, empty dicts) is JSON-encoded and interned.
+
+    It behaves like a read-only sequence of frame metadata dicts: indexing or
+    iterating over it rebuilds the dicts (as JSON-compatible builtins; e.g. the
+    `mda_event` is a dict rather than a `useq.MDAEvent`).  Use `column()` to get all
+    values for a single key as an array without building any dicts.
+
+    Parameters
+    ----------
+    spill_dir : str | PathLike | None
+        If provided, rows are spilled to (chunked) JSON-lines files in a temporary
+        directory inside `spill_dir` every `max_rows` frames, bounding the memory used
+        by the store. The temporary directory is deleted when the store is cleared
+        or garbage collected.  By default, everything is kept in memory.
+    max_rows : int
+        The maximum number of rows held in memory when `spill_dir` is provided.
+    """
+
+    def __init__(
+        self, *, spill_dir: str | PathLike[str] | None = None, max_rows: int = 10_000
+    ) -> None:
+        if max_rows < 1:
+            raise ValueError("max_rows must be at least 1.")
+        self._spill_root = spill_dir
+        self._max_rows = max_rows
+        self._spill_path: Path | None = None
+        self._spill_finalizer: weakref.finalize | None = None
+        # (path, number of rows) for each spilled chunk
+        self._chunks: list[tuple[Path, int]] = []
+        self._n_spilled = 0
+        # (chunk index, rows) of the last chunk that was read back
+        self._chunk_cache: tuple[int, list[Any]] = (-1, [])
+        self._reset_columns()
+
+    def _reset_columns(self) -> None:
+        self._columns: dict[tuple[str, ...], _Column] = {}
+        self._strings: list[str] = []
+        self._string_codes: dict[str, int] = {}
+        self._n = 0  # rows held in memory
+        self._capacity = _MIN_CAPACITY
+
+    # ------------------------------------------------------------------
+
+    def append(self, meta: FrameMetaV1 | Mapping[str, Any]) -> None:
+        """Add metadata for a frame."""
+        if self._n >= self._capacity:
+            self._capacity *= 2
+            for column in self._columns.values():
+                column.resize(self._capacity)
+
+        row = self._n
+        for path, value in _flatten(to_builtins(meta)):
+            kind = _kind(value)
+            if (col := self._columns.get(path)) is None:
+                col = self._columns[path] = _Column(kind, self._capacity)
+            elif col.kind != kind:
+                kind = self._promote(col, kind)
+            if kind == _STR:
+                value = self._intern(value)
+            elif kind == _JSON:
+                value = self._intern(json_dumps(value).decode())
+            col.values[row] = value
+            col.present[row] = True
+        self._n += 1
+
+        if self._spill_root is not None and self._n >= self._max_rows:
+            self._spill()
+
+    def extend(self, metas: Iterable[FrameMetaV1 | Mapping[str, Any]]) -> None:
+        """Add metadata for multiple frames."""
+        for meta in metas:
+            self.append(meta)
+
+    def clear(self) -> None:
+        """Remove all frame metadata (including spilled chunks)."""
+        self._reset_columns()
+        self._chunks.clear()
+        self._n_spilled = 0
+        self._chunk_cache = (-1, [])
+        if self._spill_finalizer is not None:
+            self._spill_finalizer()
+            self._spill_path = self._spill_finalizer = None
+
+    def column(self, *keys: str) -> np.ndarray:
+        """Return all values of a (nested) key as an array.
+
+        Numeric columns are returned as numeric arrays (with `nan` for frames missing
+        the key, if any).  Other columns are returned as object arrays (with `None`
+        for missing values).
+
+        Examples
+        --------
+        >>> store.column("runner_time_ms")
+        >>> store.column("position", "x")
+        """
+        spilled: list[Any] = []
+        if self._chunks:
+            for rows in self._iter_spilled_rows():
+                spilled.append(_get_nested(rows, keys))
+
+        col = self._columns.get(keys)
+        if col is None:
+            mem = np.full(self._n, None, dtype=object)
+        elif col.kind in (_STR, _JSON):
+            decode = _decoder(col.kind, self._strings)
+            mem = np.full(self._n, None, dtype=object)
+            present = col.present[: self._n]
+            mem[present] = [decode(v) for v in col.values[: self._n][present]]
+        else:
+            mem = col.values[: self._n]
+            if not col.present[: self._n].all():
+                mem = np.where(col.present[: self._n], mem, np.nan)
+
+        if not spilled:
+            return mem.copy()
+        if mem.dtype != object and all(
+            isinstance(v, (int, float)) or v is None for v in spilled
+        ):
+            if None in spilled:
+                spilled = [np.nan if v is None else v for v in spilled]
+            head = np.asarray(spilled)
+            dtype = np.result_type(head, mem)
+            return np.concatenate([head.astype(dtype), mem.astype(dtype)])
+        head = np.fromiter(spilled, dtype=object, count=len(spilled))
+        return np.concatenate([head, mem.astype(object)])
+
+    def iter_json(self) -> Iterator[bytes]:
+        """Iterate over the JSON encoded metadata of each frame."""
+        for path, _ in self._chunks:
+            with open(path, "rb") as fh:
+                for line in fh:
+                    yield line.rstrip(b"\n")
+        for i in range(self._n):
+            yield json_dumps(self._row(i))
+
+    def write_json(self, fh: IO[bytes], keys: Sequence[str] | None = None) -> None:
+        """Write all frame metadata to `fh` as a JSON array, one frame at a time.
+
+        If `keys` is provided, a JSON object mapping each key to the metadata of the
+        corresponding frame is written instead.
+        """
+        if keys is not None and len(keys) != len(self):
+            raise ValueError(f"Got {len(keys)} keys for {len(self)} frames.")
+        fh.write(b"{" if keys is not None else b"[")
+        for i, record in enumerate(self.iter_json()):
+            fh.write(b",\n" if i else b"\n")
+            if keys is not None:
+                fh.write(json_dumps(keys[i]) + b": ")
+            fh.write(record)
+        fh.write(b"\n}" if keys is not None else b"\n]")
+
+    def to_json(self) -> bytes:
+        """Return all frame metadata as a JSON array."""
+        return b"[" + b",".join(self.iter_json()) + b"]"
+
+    # ------------------------ Sequence interface ------------------------
+
+    def __len__(self) -> int:
+        return self._n_spilled + self._n
+
+    @overload
+    def __getitem__(self, index: int) -> FrameMetaV1: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[FrameMetaV1]: ...
+    def __getitem__(self, index: int | slice) -> FrameMetaV1 | list[FrameMetaV1]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("FrameMetaStore index out of range")
+        if index >= self._n_spilled:
+            return self._row(index - self._n_spilled)
+        return self._spilled_row(index)  # type: ignore[no-any-return]
+
+    def __iter__(self) -> Iterator[FrameMetaV1]:
+        yield from self._iter_spilled_rows()
+        for i in range(self._n):
+            yield self._row(i)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} ({len(self)} frames, {len(self._columns)} columns,"
+            f" {len(self._strings)} strings)>"
+        )
+
+    # ------------------------- private -------------------------
+
+    def _intern(self, value: str) -> int:
+        if (code := self._string_codes.get(value)) is None:
+            code = self._string_codes[value] = len(self._strings)
+            self._strings.append(value)
+        return code
+
+    def _promote(self, col: _Column, kind: str) -> str:
+        """Change the kind of `col` so that it can hold values of `kind`."""
+        if {col.kind, kind} <= {_INT, _FLOAT}:
+            new_kind = _FLOAT
+            col.values = col.values.astype(np.float64)
+        else:
+            new_kind = _JSON
+            decode = _decoder(col.kind, self._strings)
+            values = np.zeros(len(col.values), dtype=_DTYPES[_JSON])
+            for i in np.flatnonzero(col.present[: self._n]):
+                values[i] = self._intern(json_dumps(decode(col.values[i])).decode())
+            col.values = values
+        col.kind = new_kind
+        return new_kind
+
+    def _row(self, i: int) -> FrameMetaV1:
+        out: dict[str, Any] = {}
+        strings = self._strings
+        for path, col in self._columns.items():
+            if not col.present[i]:
+                continue
+            d = out
+            for key in path[:-1]:
+                d = d.setdefault(key, {})
+            d[path[-1]] = _decoder(col.kind, strings)(col.values[i])
+        return out  # type: ignore[return-value]
+
+    def _spill(self) -> None:
+        if self._spill_path is None:
+            root = Path(self._spill_root).expanduser()  # type: ignore[arg-type]
+            root.mkdir(parents=True, exist_ok=True)
+            self._spill_path = Path(tempfile.mkdtemp(prefix="frame_meta_", dir=root))
+            self._spill_finalizer = weakref.finalize(
+                self, shutil.rmtree, self._spill_path, ignore_errors=True
+            )
+        path = self._spill_path / f"{len(self._chunks):06d}.jsonl"
+        with open(path, "wb") as fh:
+            for i in range(self._n):
+                fh.write(json_dumps(self._row(i)) + b"\n")
+        self._chunks.append((path, self._n))
+        self._n_spilled += self._n
+        self._reset_columns()
+
+    def _read_chunk(self, chunk: int) -> list[Any]:
+        if self._chunk_cache[0] != chunk:
+            with open(self._chunks[chunk][0], "rb") as fh:
+                self._chunk_cache = (chunk, [json_loads(line) for line in fh])
+        return self._chunk_cache[1]
+
+    def _spilled_row(self, index: int) -> Any:
+        for chunk, (_, n) in enumerate(self._chunks):
+            if index < n:
+                return self._read_chunk(chunk)[index]
+            index -= n
+        raise IndexError(index)  # pragma: no cover
+
+    def _iter_spilled_rows(self) -> Iterator[Any]:
+        for path, _ in self._chunks:
+            with open(path, "rb") as fh:
+                for line in fh:
+                    yield json_loads(line)
+
+
+def _kind(value: Any) -> str:
+    if isinstance(value, bool):
+        return _BOOL
+    if isinstance(value, int):
+        return _INT if _INT64_MIN <= value <= _INT64_MAX else _JSON
+    if isinstance(value, float):
+        return _FLOAT
+    if isinstance(value, str):
+        return _STR
+    return _JSON
+
+
+def _decoder(kind: str, strings: list[str]) -> Any:
+    if kind == _STR:
+        return strings.__getitem__
+    if kind == _JSON:
+        return lambda code: json_loads(strings[code])
+    if kind == _BOOL:
+        return bool
+    if kind == _INT:
+        return int
+    return float
+
+
+def _flatten(
+    d: Mapping[str, Any], prefix: tuple[str, ...] = ()
+) -> Iterator[tuple[tuple[str, ...], Any]]:
+    """Yield `(path, value)` for each leaf of a nested dict."""
+    for key, value in d.items():
+        if isinstance(value, dict) and value:
+            yield from _flatten(value, (*prefix, key))
+        else:
+            yield (*prefix, key), value
+
+
+def _get_nested(d: Any, keys: tuple[str, ...]) -> Any:
+    for key in keys:
+        if not isinstance(d, dict) or key not in d:
+            return None
+        d = d[key]
+    return d
@@ -7,16 +7,21 @@ provided.
 
 from __future__ import annotations
 
+import queue
+import threading
+from collections import deque
 from collections.abc import Callable, Mapping, Sequence
 from itertools import count
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-from pymmcore_plus.metadata.serialize import json_dumps
+from pymmcore_plus.metadata.serialize import json_dumps, json_loads
 
+from ._frame_meta_store import FrameMetaStore
 from ._util import get_full_sequence_axes
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
     from typing import TypeAlias  # py310
 
     import numpy as np
@@ -44,7 +49,12 @@ class ImageSequenceWriter:
     The metadata for each frame is stored in a JSON file in the directory (by default,
     named "_frame_metadata.json").  The metadata is stored as a dict, with the key
     being the index string for the frame (see index_template), and the value being
-    the metadata dict for that frame.
+    the metadata dict for that frame.  During acquisition, frame metadata is appended
+    (on a background thread) to a JSON-lines log, "_frame_metadata.jsonl", with one
+    `{filename: metadata}` record per line.  The log is compacted into the JSON file
+    when the sequence finishes, so if an acquisition is interrupted, the metadata of
+    all frames written so far may still be read from the log.  Frame metadata is not
+    kept in memory: `frame_metadatas` reads it back from disk.
 
     The metadata for the entire MDA sequence is stored in a JSON file in the directory
     (by default, named "_useq_MDASequence.json").
@@ -88,9 +98,21 @@ class ImageSequenceWriter:
         ensure unique keys. by default True
     imwrite_kwargs: dict | None
         Extra keyword arguments to pass to the `imwrite` function.
+    max_workers: int
+        Number of threads used to write frames to disk.  By default (0), frames are
+        written synchronously in `frameReady`.  Writing in a pool of threads is
+        useful when `imwrite` is CPU-bound (e.g. when compressing images, as with
+        `imwrite_kwargs={"compression": "zlib"}`).  Filenames (and the frame counter)
+        are always assigned in the order that frames arrive, and all pending writes
+        are completed in `sequenceFinished`.
+    max_pending: int | None
+        Maximum number of frames waiting to be written when `max_workers > 0`.  When
+        the limit is reached, `frameReady` blocks until the oldest frame has been
+        written.  By default, `2 * max_workers`.
     """
 
     FRAME_META_PATH: ClassVar[str] = "_frame_metadata.json"
+    FRAME_META_LOG_PATH: ClassVar[str] = "_frame_metadata.jsonl"
     SEQ_META_PATH: ClassVar[str] = "_useq_MDASequence.json"
 
     def __init__(
@@ -103,9 +125,18 @@ class ImageSequenceWriter:
         overwrite: bool = False,
         include_frame_count: bool = True,
         imwrite_kwargs: dict | None = None,
+        max_workers: int = 0,
+        max_pending: int | None = None,
     ) -> None:
         self._imwrite = self._pick_writer(imwrite, extension)
         self._imwrite_kwargs = imwrite_kwargs or {}
+        if max_workers < 0:
+            raise ValueError("max_workers must be non-negative")
+        self._max_workers = max_workers
+        self._max_pending = max(1, max_pending or 2 * max_workers)
+        self._pool: ThreadPoolExecutor | None = None
+        # pending writes, in the order they were submitted
+        self._pending: deque[Future] = deque()
         self._prefix = prefix
         self._ext = extension
 
@@ -120,9 +151,10 @@ class ImageSequenceWriter:
 
             shutil.rmtree(self._directory)
 
-        # ongoing dict of frame meta... stored for easy rewrite without reading
-        self._frame_metadata: dict[str, FrameMetaV1] = {}
+        # append-only log of frame metadata, compacted at the end of the sequence
+        self._frame_meta_log: _FrameMetaLog | None = None
         self._frame_meta_file = self._directory.joinpath(self.FRAME_META_PATH)
+        self._frame_meta_log_file = self._directory.joinpath(self.FRAME_META_LOG_PATH)
         self._seq_meta_file = self._directory.joinpath(self.SEQ_META_PATH)
 
         # options related to file naming
@@ -166,8 +198,11 @@ class ImageSequenceWriter:
     def sequenceStarted(self, seq: useq.MDASequence) -> None:
         """Store the sequence metadata and reset the frame counter."""
         self._counter = count()  # reset counter
-        self._frame_metadata = {}  # reset metadata
         self._directory.mkdir(parents=True, exist_ok=True)
+        # reset metadata
+        if self._frame_meta_log is not None:
+            self._frame_meta_log.close()
+        self._frame_meta_log = _FrameMetaLog(self._frame_meta_log_file)
 
         self._current_sequence = seq
         axes = get_full_sequence_axes(seq)
@@ -186,8 +221,38 @@ class ImageSequenceWriter:
             )
 
     def sequenceFinished(self, seq: useq.MDASequence) -> None:
-        # write final frame metadata to disk
-        self._frame_meta_file.write_bytes(json_dumps(self._frame_metadata, indent=2))
+        try:
+            # wait for all pending frames to be written
+            self.flush()
+        finally:
+            self._pending.clear()
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
+
+            # finish writing the frame metadata log, and compact it into a single file
+            if (log := self._frame_meta_log) is not None:
+                self._frame_meta_log = None
+                log.close()
+                log.compact(self._frame_meta_file)
+
+    @property
+    def frame_metadatas(self) -> FrameMetaStore:
+        """Return the metadata of the frames written so far (in the order received).
+
+        Frame metadata isn't kept in memory, so this reads it back from the log (or,
+        once the sequence has finished, from the frame metadata file) into a new
+        `FrameMetaStore`.
+        """
+        store = FrameMetaStore()
+        if (log := self._frame_meta_log) is not None:
+            log.flush()
+            with open(log.path, "rb") as fh:
+                records = (json_loads(line) for line in fh if line.strip())
+                store.extend(meta for record in records for meta in record.values())
+        elif self._frame_meta_file.exists():
+            store.extend(json_loads(self._frame_meta_file.read_bytes()).values())
+        return store
 
     def frameReady(
         self, frame: np.ndarray, event: useq.MDAEvent, meta: FrameMetaV1, /
@@ -205,15 +270,41 @@ class ImageSequenceWriter:
             filename = f"{self._prefix}_fr{frame_idx:05}.tif"
 
         # WRITE DATA TO DISK
-        self._imwrite(str(self._directory / filename), frame, **self._imwrite_kwargs)
+        path = str(self._directory / filename)
+        if self._max_workers:
+            self._submit(path, frame)
+        else:
+            self._imwrite(path, frame, **self._imwrite_kwargs)
 
         # store metadata
-        self._frame_metadata[filename] = meta
-        # write metadata to disk every 10 frames
-        if frame_idx % 10 == 0:
-            self._frame_meta_file.write_bytes(
-                json_dumps(self._frame_metadata, indent=2)
+        if self._frame_meta_log is None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._frame_meta_log = _FrameMetaLog(self._frame_meta_log_file)
+        self._frame_meta_log.append(filename, meta)
+
+    def flush(self) -> None:
+        """Block until all pending frames have been written to disk.
+
+        Any exception raised while writing a frame is re-raised here.
+        """
+        while self._pending:
+            self._pending.popleft().result()
+
+    def _submit(self, path: str, frame: np.ndarray) -> None:
+        """Write `frame` to `path` in the thread pool."""
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._pool = ThreadPoolExecutor(
+                self._max_workers, thread_name_prefix="ImageSequenceWriter"
             )
+        # bound the number of frames in flight (and surface errors early)
+        pending = self._pending
+        while pending and (len(pending) >= self._max_pending or pending[0].done()):
+            pending.popleft().result()
+        pending.append(
+            self._pool.submit(self._imwrite, path, frame, **self._imwrite_kwargs)
+        )
 
     @staticmethod
     def fname_template(
@@ -271,6 +362,90 @@ class ImageSequenceWriter:
         return f"{prefix}{items}{extension}"
 
 
+class _FrameMetaLog:
+    """Append-only JSON-lines log of `{filename: metadata}` records.
+
+    Records are encoded and written on a background thread, and flushed to disk
+    after each batch, so that the log on disk is always readable.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        # records, events to set once everything before them is on disk, or None
+        self._queue: queue.SimpleQueue[tuple[str, Any] | threading.Event | None] = (
+            queue.SimpleQueue()
+        )
+        self._error: BaseException | None = None
+        self._file = open(path, "wb")
+        self._thread = threading.Thread(
+            target=self._run, name="FrameMetaLog", daemon=True
+        )
+        self._thread.start()
+
+    def append(self, filename: str, meta: Any) -> None:
+        """Queue the metadata for `filename` to be written."""
+        if self._error is not None:
+            raise RuntimeError("Failed to write frame metadata") from self._error
+        self._queue.put((filename, meta))
+
+    def flush(self) -> None:
+        """Block until all queued records have been written to disk."""
+        done = threading.Event()
+        self._queue.put(done)
+        while not done.wait(0.1) and self._thread.is_alive():
+            pass
+        if self._error is not None:
+            raise RuntimeError("Failed to write frame metadata") from self._error
+
+    def close(self) -> None:
+        """Write all pending records and close the file."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._file.close()
+        if self._error is not None:
+            raise RuntimeError("Failed to write frame metadata") from self._error
+
+    def compact(self, dest: Path) -> None:
+        """Combine all records into a single JSON object at `dest`, and remove the log.
+
+        Records are copied line by line (without decoding them), so this requires
+        little memory, regardless of the number of frames.
+        """
+        with open(self.path, "rb") as src, open(dest, "wb") as fh:
+            fh.write(b"{")
+            sep = b"\n"
+            for line in src:
+                # each line is a single `{filename: meta}` object. strip the braces.
+                if record := line.strip()[1:-1]:
+                    fh.write(sep + record)
+                    sep = b",\n"
+            fh.write(b"\n}")
+        self.path.unlink()
+
+    def _run(self) -> None:
+        get = self._queue.get
+        write = self._file.write
+        while True:
+            item = get()
+            try:
+                # drain everything that's pending before flushing
+                while isinstance(item, tuple):
+                    write(json_dumps({item[0]: item[1]}) + b"\n")
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                self._file.flush()
+            except Exception as e:  # pragma: no cover
+                self._error = e
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is None:
+                return
+
+
 # fmt: off
 IIO_FORMATS = {
     '.lfp', '.hdp', '.tif', '.hdr', '.wdp', '.fz', '.nhdr', '.ppm', '.pict', '.bmq',
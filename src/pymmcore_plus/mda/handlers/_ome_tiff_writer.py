@@ -36,14 +36,19 @@ Non-OME (ImageJ) hyperstack axes MUST be in TZCYXS order
 
 from __future__ import annotations
 
+import math
+import time
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+from pymmcore_plus.mda._generator_sequence import GeneratorMDASequence
+
 from ._5d_writer_base import _NULL, _5DWriterBase
 
 if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
     from pathlib import Path
 
     import useq
@@ -51,9 +56,11 @@ if TYPE_CHECKING:
     from pymmcore_plus.metadata import SummaryMetaV1
 
 IMAGEJ_AXIS_ORDER = "tzcyxs"
+# written to the first page in streaming mode, and replaced by OME-XML on close.
+_OME_PLACEHOLDER = "OME-XML will be written when the file is closed"
 
 
-class OMETiffWriter(_5DWriterBase[np.memmap]):
+class OMETiffWriter(_5DWriterBase["np.memmap | _OMETiffStream"]):
     """MDA handler that writes to a 5D OME-TIFF file.
 
     Positions will be split into different files.
@@ -61,13 +68,49 @@ class OMETiffWriter(_5DWriterBase[np.memmap]):
     Data is memory-mapped to disk using numpy.memmap via tifffile.  Tifffile handles
     the OME-TIFF format.
 
+    Flushing the memmap to disk (an `msync` of the whole file) is expensive, so by
+    default it only happens once, at the end of the sequence (before that, the OS
+    writes dirty pages back to disk whenever it sees fit).  Use `flush_every` and/or
+    `flush_interval` to flush more often during the acquisition.
+
+    In `streaming` mode, nothing is preallocated: each frame is appended to a BigTIFF
+    file (so files may exceed 4 GB) as it arrives, and the OME-XML is written when the
+    sequence finishes.  Disk usage grows with the data, and the shape of the
+    experiment needn't be known in advance.  The first (outermost) axis is unbounded,
+    and with a `GeneratorMDASequence` (e.g. an event-driven run of unknown length)
+    the frames of each position are stored along a single time axis in the order
+    they arrive (the first position gets `filename`, and subsequent positions get
+    their position key appended to it). In this mode, frames of each position must
+    arrive in order (skipped frames are filled with zeros).  Frames written so far
+    can be read back (e.g. with `isel`) while the sequence is running: frames that
+    haven't been written yet read as zeros.
+
     Parameters
     ----------
     filename : Path | str
         The filename to write to.  Must end with '.ome.tiff' or '.ome.tif'.
+    flush_every : int | None
+        If provided, flush data to disk every `flush_every` frames.
+    flush_interval : float | None
+        If provided, flush data to disk (after a frame is written) if at least
+        `flush_interval` seconds have passed since the last flush.
+    background_flush : bool
+        Whether to perform the periodic flushes on a background thread, rather than in
+        `write_frame`.  (All data is always flushed before `sequenceFinished` returns.)
+    streaming : bool
+        Whether to append frames to a BigTIFF file rather than writing to a
+        preallocated memmap.  Only supported for OME-TIFF files (not ImageJ).
     """
 
-    def __init__(self, filename: Path | str) -> None:
+    def __init__(
+        self,
+        filename: Path | str,
+        *,
+        flush_every: int | None = None,
+        flush_interval: float | None = None,
+        background_flush: bool = False,
+        streaming: bool = False,
+    ) -> None:
         try:
             import tifffile  # noqa: F401
         except ImportError as e:  # pragma: no cover
@@ -80,6 +123,21 @@ class OMETiffWriter(_5DWriterBase[np.memmap]):
         if not self._filename.endswith((".tiff", ".tif")):  # pragma: no cover
             raise ValueError("filename must end with '.tiff' or '.tif'")
         self._is_ome = ".ome.tif" in self._filename
+        if streaming and not self._is_ome:
+            raise ValueError("streaming mode is only supported for OME-TIFF files")
+        self._streaming = streaming
+
+        if flush_every is not None and flush_every < 1:
+            raise ValueError("flush_every must be a positive integer")
+        self._flush_every = flush_every
+        self._flush_interval = flush_interval
+        self._background_flush = background_flush
+        self._flush_pool: ThreadPoolExecutor | None = None
+        self._flush_future: Future | None = None
+        # arrays written to since they were last flushed {id: array}
+        self._dirty: dict[int, np.memmap | _OMETiffStream] = {}
+        self._frames_since_flush = 0
+        self._last_flush = time.perf_counter()
 
         super().__init__()
 
@@ -95,17 +153,70 @@ class OMETiffWriter(_5DWriterBase[np.memmap]):
                 {k: x[k] for k in IMAGEJ_AXIS_ORDER if k.lower() in x}
                 for x in self.position_sizes
             ]
+        self._frames_since_flush = 0
+        self._last_flush = time.perf_counter()
+
+    def sequenceFinished(self, seq: useq.MDASequence) -> None:
+        # make sure everything is on disk before the sequence is considered finished
+        self.flush()
+        if self._flush_pool is not None:
+            self._flush_pool.shutdown()
+            self._flush_pool = None
+        for ary in self.position_arrays.values():
+            if isinstance(ary, _OMETiffStream):
+                ary.close()
+        super().sequenceFinished(seq)
 
     def write_frame(
-        self, ary: np.memmap, index: tuple[int, ...], frame: np.ndarray
+        self, ary: np.memmap | _OMETiffStream, index: tuple[int, ...], frame: np.ndarray
     ) -> None:
-        """Write a frame to the file."""
+        """Write a frame to the file (flushing to disk according to the policy)."""
         super().write_frame(ary, index, frame)
-        ary.flush()
+        self._dirty[id(ary)] = ary
+        self._frames_since_flush += 1
+        every, interval = self._flush_every, self._flush_interval
+        if (every and self._frames_since_flush >= every) or (
+            interval is not None and time.perf_counter() - self._last_flush >= interval
+        ):
+            self._flush_dirty()
+
+    def flush(self) -> None:
+        """Block until all data written so far has been flushed to disk."""
+        if self._flush_future is not None:
+            self._flush_future.result()
+            self._flush_future = None
+        for ary in self.position_arrays.values():
+            ary.flush()
+        self._dirty.clear()
+        self._frames_since_flush = 0
+        self._last_flush = time.perf_counter()
+
+    def _flush_dirty(self) -> None:
+        """Flush arrays that have been written to since the last flush."""
+        if not self._background_flush:
+            for ary in self._dirty.values():
+                ary.flush()
+        elif self._flush_future is None or self._flush_future.done():
+            if self._flush_future is not None:
+                self._flush_future.result()  # raise any error from the last flush
+            if self._flush_pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._flush_pool = ThreadPoolExecutor(
+                    1, thread_name_prefix="OMETiffWriterFlush"
+                )
+            arrays = list(self._dirty.values())
+            self._flush_future = self._flush_pool.submit(_flush_arrays, arrays)
+        else:
+            # the previous flush is still running... try again after the next frame
+            return
+        self._dirty.clear()
+        self._frames_since_flush = 0
+        self._last_flush = time.perf_counter()
 
     def new_array(
         self, position_key: str, dtype: np.dtype, sizes: dict[str, int]
-    ) -> np.memmap:
+    ) -> np.memmap | _OMETiffStream:
         """Create a new tifffile file and memmap for this position."""
         from tifffile import imwrite, memmap
 
@@ -115,12 +226,20 @@ class OMETiffWriter(_5DWriterBase[np.memmap]):
         metadata["axes"] = "".join(dims).upper()
 
         # append the position key to the filename if there are multiple positions
-        if (seq := self.current_sequence) and seq.sizes.get("p", 1) > 1:
+        seq = self.current_sequence
+        if isinstance(seq, GeneratorMDASequence):
+            multi_position = bool(self.position_arrays)
+        else:
+            multi_position = bool(seq and seq.sizes.get("p", 1) > 1)
+        if multi_position:
             ext = ".ome.tif" if self._is_ome else ".tif"
             fname = self._filename.replace(ext, f"_{position_key}{ext}")
         else:
             fname = self._filename
 
+        if self._streaming:
+            return _OMETiffStream(fname, dtype, sizes, metadata)
+
         # create parent directories if they don't exist
         # Path(fname).parent.mkdir(parents=True, exist_ok=True)
         # write empty file to disk
@@ -147,6 +266,8 @@ class OMETiffWriter(_5DWriterBase[np.memmap]):
         metadata: dict = {}
         # see tifffile.tifffile for more metadata options
         if seq := self.current_sequence:
+            if isinstance(seq, GeneratorMDASequence):
+                return metadata
             if seq.time_plan and hasattr(seq.time_plan, "interval"):
                 interval = seq.time_plan.interval
                 if isinstance(interval, timedelta):
@@ -174,3 +295,134 @@ class OMETiffWriter(_5DWriterBase[np.memmap]):
         # ... one option is to accumulate these things and then use `tifffile.comment`
         # to update the total metadata in finalize_metadata
         return metadata
+
+
+def _flush_arrays(arrays: list[np.memmap | _OMETiffStream]) -> None:
+    for ary in arrays:
+        ary.flush()
+
+
+class _OMETiffStream:
+    """Appends frames to a BigTIFF file as they arrive, writing OME-XML on close.
+
+    Frames are indexed by `sizes` (in C-order). The first (outermost) axis is
+    unbounded, and if `sizes` only contains "y" and "x", frames are appended along a
+    time axis in the order they arrive.  Indexing reads the frames written so far
+    (frames that haven't been written yet read as zeros), as if from an array of
+    `shape`.
+    """
+
+    def __init__(
+        self, path: str, dtype: np.dtype, sizes: dict[str, int], metadata: dict
+    ) -> None:
+        from tifffile import TiffWriter
+
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.closed = False
+        self._frame_shape = (sizes["y"], sizes["x"])
+        self._dims = [k for k in sizes if k not in "yx"]
+        self._sizes = [sizes[k] for k in self._dims]
+        # stride (in pages) of each dimension.  (the first dimension is unbounded)
+        self._strides = [
+            math.prod(self._sizes[i + 1 :]) for i in range(len(self._sizes))
+        ]
+        self._metadata = {k: v for k, v in metadata.items() if k != "axes"}
+        self._n_pages = 0
+        # file offset of the data of each page, for reading frames back
+        self._offsets: list[int] = []
+        self._writer = TiffWriter(path, bigtiff=True, ome=False)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Shape of the array (the first axis grows if more frames arrive)."""
+        if not self._dims:
+            return (self._n_pages, *self._frame_shape)
+        n_outer = max(self._sizes[0], math.ceil(self._n_pages / self._strides[0]))
+        return (n_outer, *self._sizes[1:], *self._frame_shape)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        keys = key if isinstance(key, tuple) else (key,)
+        n_lead = self.ndim - 2
+        lead, in_frame = keys[:n_lead], keys[n_lead:]
+        pages = np.arange(math.prod(self.shape[:n_lead])).reshape(self.shape[:n_lead])
+        pages = pages[lead]
+        out = np.zeros((*pages.shape, *self._frame_shape), dtype=self.dtype)
+        if not self.closed:
+            self._writer.filehandle.flush()
+        with open(self.path, "rb") as fh:
+            for idx, page in np.ndenumerate(pages):
+                if page < self._n_pages:
+                    fh.seek(self._offsets[page])
+                    frame = np.fromfile(fh, self.dtype, math.prod(self._frame_shape))
+                    out[idx] = frame.reshape(self._frame_shape)
+        # apply the frame (YX) part of the key to the trailing two axes
+        return out[(Ellipsis, *in_frame)] if in_frame else out
+
+    def __setitem__(self, index: tuple[int, ...], frame: np.ndarray) -> None:
+        if not index:  # unknown shape: append frames in order
+            page = self._n_pages
+        else:
+            page = sum(i * s for i, s in zip(index, self._strides, strict=False))
+        if page < self._n_pages:
+            raise ValueError(
+                f"Cannot write frame at index {index} to {self.path!r}: in streaming "
+                "mode, frames of each position must arrive in order."
+            )
+        self._pad_to(page)
+        self._write_page(frame)
+
+    def flush(self) -> None:
+        if not self.closed:
+            self._writer.filehandle.flush()
+
+    def close(self) -> None:
+        """Finish the last (outermost) index, close the file, and write OME-XML."""
+        if self.closed:
+            return
+        self.closed = True
+        from tifffile import OmeXml, tiffcomment
+
+        if self._dims:
+            per_outer = self._strides[0]
+            n_outer = max(1, math.ceil(self._n_pages / per_outer))
+            self._pad_to(n_outer * per_outer)
+            shape = (n_outer, *self._sizes[1:])
+            axes = "".join(self._dims).upper()
+        else:
+            shape, axes = (self._n_pages,), "T"
+        self._writer.close()
+
+        ome = OmeXml()
+        ome.addimage(
+            self.dtype,
+            (*shape, *self._frame_shape),
+            (self._n_pages, 1, 1, *self._frame_shape, 1),
+            axes=f"{axes}YX",
+            **self._metadata,
+        )
+        # TIFF ASCII tags can't hold e.g. "µm": use XML character references
+        xml = ome.tostring().encode("ascii", "xmlcharrefreplace")
+        tiffcomment(self.path, comment=xml)
+
+    def _pad_to(self, page: int) -> None:
+        """Fill skipped frames with zeros."""
+        if page > self._n_pages:
+            zeros = np.zeros(self._frame_shape, dtype=self.dtype)
+            while self._n_pages < page:
+                self._write_page(zeros)
+
+    def _write_page(self, frame: np.ndarray) -> None:
+        offset, _ = self._writer.write(  # type: ignore[misc]
+            frame,
+            contiguous=True,
+            metadata=None,
+            description=None if self._n_pages else _OME_PLACEHOLDER,
+            returnoffset=True,
+        )
+        self._offsets.append(offset)
+        self._n_pages += 1
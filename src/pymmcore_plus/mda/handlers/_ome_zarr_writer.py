@@ -10,21 +10,26 @@ from typing import TYPE_CHECKING, Any, Literal, Protocol
 
 import numpy as np
 
+from pymmcore_plus.mda._pyramid import PyramidBuilder, pyramid_shape
 from pymmcore_plus.metadata.serialize import to_builtins
 
 from ._5d_writer_base import _5DWriterBase
+from ._frame_meta_shards import FrameMetaShardWriter
 
 if TYPE_CHECKING:
-    from collections.abc import MutableMapping, Sequence
+    from collections.abc import Mapping, MutableMapping, Sequence
     from contextlib import AbstractAsyncContextManager
     from os import PathLike
     from typing import TypedDict
 
+    import useq
     import xarray as xr
     import zarr
     from fsspec import FSMap
     from numcodecs.abc import Codec
 
+    from pymmcore_plus.metadata import FrameMetaV1
+
     class ZarrSynchronizer(Protocol):
         def __getitem__(self, key: str) -> AbstractAsyncContextManager: ...
 
@@ -54,9 +59,9 @@ class OMEZarrWriter(_5DWriterBase["zarr.Array"]):
     It also aims to be compatible with the xarray Zarr spec:
     https://docs.xarray.dev/en/latest/internals/zarr-encoding-spec.html
 
-    Note: this does *not* currently calculate any additional pyramid levels.
-    But it would be easy to do so after acquisition.
-    Chunk size is currently 1 XY plane.
+    By default, only the full resolution data is written.  Use `pyramid_levels` to
+    also write downsampled levels (computed on a background thread as frames arrive).
+    By default, each chunk is a single XY plane (see the `chunks` parameter).
 
     Zarr directory structure will be:
 
@@ -73,6 +78,12 @@ class OMEZarrWriter(_5DWriterBase["zarr.Array"]):
     │           └── z
     │               └── y
     │                   └── x   # chunks will be each XY plane
+    ├── frame_meta              # (optional) frame metadata shards, see
+    │   └── p0                  # `frame_meta_shard_size`
+    │       ├── 0.jsonl
+    │       └── ...
+    ├── p0_2x                   # (optional) pyramid levels, downsampled in XY
+    ├── p0_4x
     ├── ...
     ├── p<n>
     │   ├── .zarray
@@ -103,6 +114,37 @@ class OMEZarrWriter(_5DWriterBase["zarr.Array"]):
         If True, zattrs metadata will be read from disk, minified, and written
         back to disk at the end of a successful acquisition (to save space). Default is
         False.
+    chunks : Mapping[str, int] | None, optional
+        Chunk size along the non-XY dimensions, e.g. `{"z": 16}` to store stacks of 16
+        z-planes per chunk.  Dimensions that are omitted have a chunk size of 1.  Frames
+        are buffered in memory until their chunk is complete, and then each chunk is
+        written once.  By default, each chunk is a single XY plane.
+    max_chunk_buffer_bytes : int, optional
+        Maximum number of bytes held in incomplete chunks (when `chunks` spans more
+        than one frame).  When exceeded, the oldest incomplete chunks are written
+        frame-by-frame.  By default 256 MiB.
+    pyramid_levels : int, optional
+        Number of additional multiscale levels to write for each position, each
+        downsampled 2x in XY relative to the previous one (e.g. `3` writes 2x, 4x and
+        8x levels).  Levels are computed by block averaging on a worker thread as
+        frames arrive, and are added to the `datasets` of the position's multiscales
+        metadata.  By default 0 (no pyramid).
+    frame_meta_shard_size : int | None, optional
+        If provided, the metadata of each frame is written *during* the acquisition,
+        to JSON-lines shards of this many frames in `frame_meta/<position key>/`, and
+        only a small pointer to the shards is stored in the `frame_meta_shards`
+        attribute of each position array (see `iter_frame_meta_shards`).  This keeps
+        the time spent in `finalize_metadata` constant for very long acquisitions.
+        Frame metadata is then *not* kept in `frame_metadatas`, so that memory use
+        doesn't grow with the length of the acquisition.  By default (None), all frame
+        metadata is kept in `frame_metadatas`, and stored in the `frame_meta`
+        attribute of each position array at the end of the acquisition.
+    position_workers : int, optional
+        If greater than 0, frames are compressed and written on a pool of this many
+        threads, with each position assigned to one thread (so that the frames of a
+        position are written in order, while different positions, such as the wells
+        of a plate, are written in parallel).  By default 0 (frames are written in
+        `frameReady`).
     """
 
     def __init__(
@@ -114,6 +156,11 @@ class OMEZarrWriter(_5DWriterBase["zarr.Array"]):
         zarr_version: Literal[2, 3, None] = None,
         array_kwargs: ArrayCreationKwargs | None = None,
         minify_attrs_metadata: bool = False,
+        chunks: Mapping[str, int] | None = None,
+        max_chunk_buffer_bytes: int = 256 * 2**20,
+        pyramid_levels: int = 0,
+        frame_meta_shard_size: int | None = None,
+        position_workers: int = 0,
     ) -> None:
         try:
             import zarr
@@ -122,7 +169,11 @@ class OMEZarrWriter(_5DWriterBase["zarr.Array"]):
                 "zarr is required to use this handler. Install with `pip install zarr`"
             ) from e
 
-        super().__init__()
+        super().__init__(
+            max_chunk_buffer_bytes=max_chunk_buffer_bytes,
+            position_workers=position_workers,
+        )
+        self._chunks = dict(chunks or {})
 
         # main zarr group
         self._group = zarr.group(
@@ -146,6 +197,18 @@ class OMEZarrWriter(_5DWriterBase["zarr.Array"]):
         self._array_kwargs.setdefault("dimension_separator", "/")
         self._minify_metadata = minify_attrs_metadata
 
+        # downsampled levels for each position array, keyed by the array path
+        self._pyramid_arrays: dict[str, list[zarr.Array]] = {}
+        self._pyramid = (
+            PyramidBuilder(self._write_pyramid_level, levels=pyramid_levels)
+            if pyramid_levels > 0
+            else None
+        )
+
+        # frame metadata shards for each position key (if frame_meta_shard_size)
+        self._meta_shard_size = frame_meta_shard_size
+        self._meta_shards: dict[str, FrameMetaShardWriter] = {}
+
     @classmethod
     def in_tmpdir(
         cls,
@@ -190,18 +253,48 @@ class OMEZarrWriter(_5DWriterBase["zarr.Array"]):
         """Read-only access to the zarr group."""
         return self._group
 
+    def sequenceFinished(self, seq: useq.MDASequence) -> None:
+        """On sequence finished, finish writing pyramid levels and flush metadata."""
+        try:
+            # frames written by the position workers are queued for downsampling
+            self._join_writes()
+            if self._pyramid is not None:
+                self._pyramid.close()
+        finally:
+            super().sequenceFinished(seq)
+
     def finalize_metadata(self) -> None:
         """Called by superclass in sequenceFinished.  Flush metadata to disk."""
         # flush frame metadata to disk
         self._populate_xarray_coords()
+        while self._meta_shards:
+            key, shards = self._meta_shards.popitem()
+            if key in self.position_arrays:
+                self.position_arrays[key].attrs["frame_meta_shards"] = shards.close()
         while self.frame_metadatas:
             key, metas = self.frame_metadatas.popitem()
             if key in self.position_arrays:
-                self.position_arrays[key].attrs["frame_meta"] = to_builtins(metas)
+                self.position_arrays[key].attrs["frame_meta"] = list(metas)
 
         if self._minify_metadata:
             self._minify_zattrs_metadata()
 
+    def store_frame_metadata(
+        self, key: str, event: useq.MDAEvent, meta: FrameMetaV1
+    ) -> None:
+        """Store metadata for the frame, writing it to a shard if requested."""
+        if self._meta_shard_size is None:
+            super().store_frame_metadata(key, event, meta)
+            return
+        if (shards := self._meta_shards.get(key)) is None:
+            shards = self._meta_shards[key] = FrameMetaShardWriter(
+                self._write_store_key, f"frame_meta/{key}", self._meta_shard_size
+            )
+        shards.append(meta or {})
+
+    def _write_store_key(self, key: str, data: bytes) -> None:
+        self._group.store[key] = data
+
     def _populate_xarray_coords(self) -> None:
         # FIXME:
         # This provides support for xarray coordinates... but it's not obvious
@@ -214,13 +307,18 @@ class OMEZarrWriter(_5DWriterBase["zarr.Array"]):
 
         sizes = {**seq.sizes}
         px: float = 1.0
+        last: Mapping[str, Any] | None = None
         if self.frame_metadatas:
             key, metas = next(iter(self.frame_metadatas.items()))
-            if key in self.position_arrays:
-                shape = self.position_arrays[key].shape
-                px = metas[-1].get("pixel_size_um", 1)
-                with suppress(IndexError):
-                    sizes.update(y=shape[-2], x=shape[-1])
+            last = metas[-1]
+        elif self._meta_shards:
+            key, shards = next(iter(self._meta_shards.items()))
+            last = shards.last
+        if last is not None and key in self.position_arrays:
+            shape = self.position_arrays[key].shape
+            px = last.get("pixel_size_um", 1)
+            with suppress(IndexError):
+                sizes.update(y=shape[-2], x=shape[-1])
 
         for dim, size in sizes.items():
             if size == 0:
@@ -267,14 +365,28 @@ class OMEZarrWriter(_5DWriterBase["zarr.Array"]):
         ary: zarr.Array = self._group.create(
             key,
             shape=shape,
-            chunks=(1,) * len(shape[:-2]) + shape[-2:],  # single XY plane chunks
+            chunks=self._chunk_shape(dims, shape),
             dtype=dtype,
             **self._array_kwargs,
         )
 
         # add minimal OME-NGFF metadata
         scales = self._group.attrs.get("multiscales", [])
-        scales.append(self._multiscales_item(ary.path, ary.path, dims))
+        item = self._multiscales_item(ary.path, ary.path, dims)
+        if self._pyramid is not None:
+            levels = self._new_pyramid_arrays(key, dtype, dims, shape)
+            self._pyramid_arrays[ary.path] = levels
+            for n, level in enumerate(levels, 1):
+                scale = [1] * (len(dims) - 2) + [self._pyramid.factor**n] * 2
+                item["datasets"].append(
+                    {
+                        "coordinateTransformations": [
+                            {"scale": scale, "type": "scale"}
+                        ],
+                        "path": level.path,
+                    }
+                )
+        scales.append(item)
         self._group.attrs["multiscales"] = scales
         ary.attrs["_ARRAY_DIMENSIONS"] = dims
         if seq := self.current_sequence:
@@ -282,11 +394,58 @@ class OMEZarrWriter(_5DWriterBase["zarr.Array"]):
 
         return ary
 
-    # # the superclass implementation is all we need
-    # def write_frame(
-    #     self, ary: zarr.Array, frame: np.ndarray, event: useq.MDAEvent
-    # ) -> None:
-    #     super().write_frame(ary, frame, event)
+    def write_frame(
+        self, ary: zarr.Array, index: tuple[int, ...], frame: np.ndarray
+    ) -> None:
+        """Write `frame` to `ary`, and queue it for downsampling (if requested)."""
+        super().write_frame(ary, index, frame)
+        if self._pyramid is not None and ary.path in self._pyramid_arrays:
+            self._pyramid.submit((ary.path, index), frame)
+
+    def _new_pyramid_arrays(
+        self, key: str, dtype: np.dtype, dims: Sequence[str], shape: Sequence[int]
+    ) -> list[zarr.Array]:
+        """Create the downsampled levels for the position array at `key`."""
+        if self._pyramid is None:  # pragma: no cover
+            return []
+        levels = []
+        factor = self._pyramid.factor
+        for n in range(1, self._pyramid.levels + 1):
+            level_shape = pyramid_shape(tuple(shape), n, factor)
+            level = self._group.create(
+                f"{key}_{factor**n}x",
+                shape=level_shape,
+                chunks=(*[1] * (len(shape) - 2), *level_shape[-2:]),
+                dtype=dtype,
+                **self._array_kwargs,
+            )
+            # xarray requires dimension names to have a consistent size
+            level.attrs["_ARRAY_DIMENSIONS"] = [
+                f"{d}_{factor**n}x" if d in ("y", "x") else d for d in dims
+            ]
+            levels.append(level)
+        return levels
+
+    def _write_pyramid_level(
+        self, key: tuple[str, tuple[int, ...]], level: int, data: np.ndarray
+    ) -> None:
+        """Called by the PyramidBuilder (on its worker thread) for each level."""
+        path, index = key
+        self._pyramid_arrays[path][level - 1][index] = data
+
+    def frame_chunks(self, ary: zarr.Array) -> tuple[int, ...]:
+        """Return the chunk size of `ary` along the non-XY dimensions."""
+        return tuple(ary.chunks[:-2])
+
+    def _chunk_shape(
+        self, dims: Sequence[str], shape: Sequence[int]
+    ) -> tuple[int, ...]:
+        """Chunk shape for a new array: whole XY planes, `self._chunks` elsewhere."""
+        leading = (
+            max(1, min(self._chunks.get(d, 1), n))
+            for d, n in zip(dims[:-2], shape[:-2], strict=False)
+        )
+        return (*leading, *shape[-2:])
 
     def _multiscales_item(self, path: str, name: str, axes: Sequence[str]) -> dict:
         """ome-zarr multiscales image metadata.
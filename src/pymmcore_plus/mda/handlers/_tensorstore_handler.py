@@ -4,19 +4,24 @@ import atexit
 import os
 import shutil
 import tempfile
+import time
 import warnings
-from itertools import product
+from collections import deque
+from collections.abc import Sequence
 from os import PathLike
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, cast, overload
 
 import numpy as np
 
 from pymmcore_plus.metadata.serialize import json_dumps, json_loads
 
+from ._frame_index import FrameIndexTable
+from ._frame_meta_shards import FrameMetaShardWriter
+from ._frame_meta_store import FrameMetaStore
 from ._util import position_sizes
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Mapping
     from typing import Literal, TypeAlias
 
     import tensorstore as ts
@@ -26,12 +31,45 @@ if TYPE_CHECKING:
     from pymmcore_plus.metadata import FrameMetaV1, SummaryMetaV1
 
     TsDriver: TypeAlias = Literal["zarr", "zarr3", "n5", "neuroglancer_precomputed"]
-    EventKey: TypeAlias = frozenset[tuple[str, int]]
 
 # special dimension label used when _nd_storage is False
 FRAME_DIM = "frame"
 
 
+class _FrameMetadatas(Sequence["tuple[useq.MDAEvent, FrameMetaV1]"]):
+    """The `(event, metadata)` pairs of each frame written by a TensorStoreHandler.
+
+    The metadata itself is kept in a columnar `FrameMetaStore` (`metas`).
+    """
+
+    def __init__(self) -> None:
+        self.events: list[useq.MDAEvent] = []
+        self.metas = FrameMetaStore()
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @overload
+    def __getitem__(self, index: int) -> tuple[useq.MDAEvent, FrameMetaV1]: ...
+    @overload
+    def __getitem__(self, index: slice) -> list[tuple[useq.MDAEvent, FrameMetaV1]]: ...
+    def __getitem__(
+        self, index: int | slice
+    ) -> tuple[useq.MDAEvent, FrameMetaV1] | list[tuple[useq.MDAEvent, FrameMetaV1]]:
+        if isinstance(index, slice):
+            return list(zip(self.events[index], self.metas[index], strict=True))
+        return self.events[index], self.metas[index]
+
+    def append(self, item: tuple[useq.MDAEvent, FrameMetaV1]) -> None:
+        event, meta = item
+        self.events.append(event)
+        self.metas.append(meta)
+
+    def clear(self) -> None:
+        self.events.clear()
+        self.metas.clear()
+
+
 class TensorStoreHandler:
     """Tensorstore handler for writing MDA sequences.
 
@@ -65,6 +103,22 @@ class TensorStoreHandler:
         in this object will override the default values provided by the handler.
         This is a complex object that can completely define the tensorstore, see
         <https://google.github.io/tensorstore/spec.html> for more information.
+    max_pending_writes : int, optional
+        Maximum number of frame writes that may be in flight at once, by default 64.
+        Completed writes are reaped on every frame; when the limit is reached,
+        `frameReady` blocks until the oldest write has completed (applying
+        backpressure when storage falls behind, rather than holding every frame in
+        memory until the end of the sequence).  See `write_stats` for counters.
+    frame_meta_shard_size : int | None, optional
+        If provided, the metadata of each frame is written *during* the acquisition,
+        to JSON-lines shards of this many frames under `frame_meta/` in the kvstore
+        of the array, and only a small pointer to the shards is stored in the
+        `frame_metadata_shards` attribute (see `iter_frame_meta_shards`).  This keeps
+        the time spent in `finalize_metadata` constant for very long acquisitions.
+        Frame metadata is then *not* kept in `frame_metadatas`, so that memory use
+        doesn't grow with the length of the acquisition.  By default (None), all frame
+        metadata is kept in `frame_metadatas`, and stored in the `frame_metadatas`
+        attribute at the end of the acquisition.
 
     Examples
     --------
@@ -98,6 +152,8 @@ class TensorStoreHandler:
         path: str | PathLike | None = None,
         delete_existing: bool = False,
         spec: Mapping | None = None,
+        max_pending_writes: int = 64,
+        frame_meta_shard_size: int | None = None,
     ) -> None:
         try:
             import tensorstore
@@ -119,15 +175,24 @@ class TensorStoreHandler:
 
         self._current_sequence: useq.MDASequence | None = None
 
-        # storage of individual frame metadata
-        # maps position key to list of frame metadata
-        self.frame_metadatas: list[tuple[useq.MDAEvent, FrameMetaV1]] = []
+        # (event, metadata) of each frame, with the metadata stored columnar
+        self.frame_metadatas = _FrameMetadatas()
+        # frame metadata shards written during the run (if frame_meta_shard_size)
+        self._meta_shard_size = frame_meta_shard_size
+        self._meta_shards: FrameMetaShardWriter | None = None
+        self._meta_futures: list[ts.Future] = []
 
         self._size_increment = 300
 
         self._store: ts.TensorStore | None = None
-        self._futures: list[ts.Future | ts.WriteFutures] = []
-        self._frame_indices: dict[EventKey, int | ts.DimExpression] = {}
+        # in-flight writes, in the order they were submitted
+        self._futures: deque[ts.WriteFutures] = deque()
+        self._max_pending_writes = max(1, max_pending_writes)
+        self._writes_completed = 0
+        self._backpressure_waits = 0
+        self._backpressure_seconds = 0.0
+        # event index of each frame (when _nd_storage is False), in write order
+        self._frame_indices = FrameIndexTable()
 
         # "_nd_storage" means we're greedily attempting to store the data in a
         # multi-dimensional format based on the axes of the sequence.
@@ -137,14 +202,28 @@ class TensorStoreHandler:
         self._nd_storage: bool = True
         self._frame_index: int = 0
 
-        # the highest index seen for each axis
-        self._axis_max: dict[str, int] = {}
-
     @property
     def store(self) -> ts.TensorStore | None:
         """The current tensorstore."""
         return self._store
 
+    @property
+    def write_stats(self) -> dict[str, int | float]:
+        """Counters for the frame writes of the current sequence.
+
+        - `pending`: number of writes currently in flight.
+        - `completed`: number of writes that have completed.
+        - `backpressure_waits`: number of times `frameReady` blocked because
+          `max_pending_writes` writes were in flight.
+        - `backpressure_seconds`: total time spent blocked.
+        """
+        return {
+            "pending": len(self._futures),
+            "completed": self._writes_completed,
+            "backpressure_waits": self._backpressure_waits,
+            "backpressure_seconds": self._backpressure_seconds,
+        }
+
     @classmethod
     def in_tmpdir(
         cls,
@@ -189,6 +268,11 @@ class TensorStoreHandler:
         self._frame_index = 0
         self._store = None
         self._futures.clear()
+        self._frame_indices.clear()
+        self._meta_shards = None
+        self._meta_futures.clear()
+        self._writes_completed = self._backpressure_waits = 0
+        self._backpressure_seconds = 0.0
         self.frame_metadatas.clear()
         self._current_sequence = sequence
 
@@ -209,13 +293,12 @@ class TensorStoreHandler:
         if self._store is None:
             return  # pragma: no cover
 
-        while self._futures:
-            self._futures.pop().result()
+        self.flush()
         if not self._nd_storage:
             self._store = self._store.resize(
                 exclusive_max=(self._frame_index, *self._store.shape[-2:])
             ).result()
-        if self.frame_metadatas:
+        if self.frame_metadatas or self._meta_shards is not None:
             self.finalize_metadata()
 
     def frameReady(
@@ -233,18 +316,47 @@ class TensorStoreHandler:
                 self._store = self._expand_store(self._store).result()
             ts_index = self._frame_index
             # store reverse lookup of event.index -> frame_index
-            self._frame_indices[frozenset(event.index.items())] = ts_index
+            self._frame_indices.append(event.index)
 
         # write the new frame asynchronously
+        self._reap_writes()
         self._futures.append(self._store[ts_index].write(frame))
 
-        # store, but do not process yet, the frame metadata
-        self.frame_metadatas.append((event, meta))
+        if self._meta_shard_size is not None and self._store.kvstore is not None:
+            # write the frame metadata to a shard (as soon as it is full)
+            if self._meta_shards is None:
+                self._meta_shards = FrameMetaShardWriter(
+                    self._write_kvstore_key, "frame_meta", self._meta_shard_size
+                )
+            self._meta_shards.append(meta)
+        else:
+            # store, but do not process yet, the frame metadata
+            self.frame_metadatas.append((event, meta))
         # update the frame counter
         self._frame_index += 1
-        # remember the highest index seen for each axis
-        for k, v in event.index.items():
-            self._axis_max[k] = max(self._axis_max.get(k, 0), v)
+
+    def flush(self) -> None:
+        """Block until all in-flight frame writes have completed.
+
+        Any exception raised while writing a frame is re-raised here.
+        """
+        while self._futures:
+            self._futures.popleft().result()
+            self._writes_completed += 1
+
+    def _reap_writes(self) -> None:
+        """Release completed writes, and wait for the oldest ones if over the limit."""
+        futures = self._futures
+        while futures and futures[0].done():
+            futures.popleft().result()
+            self._writes_completed += 1
+        if len(futures) >= self._max_pending_writes:
+            t0 = time.perf_counter()
+            while len(futures) >= self._max_pending_writes:
+                futures.popleft().result()
+                self._writes_completed += 1
+            self._backpressure_waits += 1
+            self._backpressure_seconds += time.perf_counter() - t0
 
     def isel(
         self,
@@ -318,22 +430,37 @@ class TensorStoreHandler:
         if not (store := self._store) or not store.kvstore:
             return  # pragma: no cover
 
-        metadata = {"frame_metadatas": [m[1] for m in self.frame_metadatas]}
+        # zarr v2 doesn't store the domain labels, so record them (as xarray does)
+        metadata: dict[str, Any] = {"_ARRAY_DIMENSIONS": list(store.domain.labels)}
         if not self._nd_storage:
-            metadata["frame_indices"] = [
-                (tuple(dict(k).items()), v)  # type: ignore
-                for k, v in self._frame_indices.items()
-            ]
+            metadata["frame_indices"] = self._frame_indices.to_json()
+
+        if self._meta_shards is not None:
+            metadata["frame_metadata_shards"] = self._meta_shards.close()
+            while self._meta_futures:
+                self._meta_futures.pop().result()
 
         if self.ts_driver.startswith("zarr"):
-            store.kvstore.write(
-                ".zattrs", json_dumps(metadata).decode("utf-8")
-            ).result()
+            zattrs = json_dumps(metadata)
+            if self._meta_shards is None:
+                # encode the frame metadata one frame at a time, rather than building
+                # a list of dicts for all frames
+                zattrs = zattrs[:-1] + b","
+                zattrs += (
+                    b'"frame_metadatas":' + self.frame_metadatas.metas.to_json() + b"}"
+                )
+            store.kvstore.write(".zattrs", zattrs.decode("utf-8")).result()
         elif self.ts_driver == "n5":  # pragma: no cover
+            if self._meta_shards is None:
+                metadata["frame_metadatas"] = list(self.frame_metadatas.metas)
             attrs = json_loads(store.kvstore.read("attributes.json").result().value)
             attrs.update(metadata)
             store.kvstore.write("attributes.json", json_dumps(attrs).decode("utf-8"))
 
+    def _write_kvstore_key(self, key: str, data: bytes) -> None:
+        if self._store is not None and (kvstore := self._store.kvstore) is not None:
+            self._meta_futures.append(kvstore.write(key, data))
+
     def _expand_store(self, store: ts.TensorStore) -> ts.Future[ts.TensorStore]:
         """Grow the store by `self._size_increment` frames.
 
@@ -353,36 +480,15 @@ class TensorStoreHandler:
             keys, values = zip(*index.items(), strict=False)
             return self._ts.d[keys][values]
 
+        frames = self._frame_indices.lookup(index)
         if any(isinstance(v, slice) for v in index.values()):
-            idx: list | int | ts.DimExpression = self._get_frame_indices(index)
+            idx: list[int] | int = frames
+        elif frames:
+            idx = frames[-1]
         else:
-            try:
-                idx = self._frame_indices[frozenset(index.items())]  # type: ignore
-            except KeyError as e:
-                raise KeyError(f"Index {index} not found in frame_indices.") from e
+            raise KeyError(f"Index {index} not found in frame_indices.")
         return self._ts.d[FRAME_DIM][idx]
 
-    def _get_frame_indices(self, indexers: Mapping[str, int | slice]) -> list[int]:
-        """Convert indexers (with slices) to a list of frame indices."""
-        # converting slice objects to actual indices
-        axis_indices: dict[str, Sequence[int]] = {}
-        for k, v in indexers.items():
-            if isinstance(v, slice):
-                axis_indices[k] = tuple(range(*v.indices(self._axis_max.get(k, 0) + 1)))
-            else:
-                axis_indices[k] = (v,)
-
-        indices: list[int] = []
-        for p in product(*axis_indices.values()):
-            key = frozenset(dict(zip(axis_indices.keys(), p, strict=False)).items())
-            try:
-                indices.append(self._frame_indices[key])
-            except KeyError:  # pragma: no cover
-                warnings.warn(
-                    f"Index {dict(key)} not found in frame_indices.", stacklevel=2
-                )
-        return indices
-
 
 def _merge_nested_dicts(dict1: dict, dict2: Mapping) -> None:
     """Merge two nested dictionaries.
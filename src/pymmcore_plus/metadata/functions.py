@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import weakref
 from contextlib import suppress
 from typing import TYPE_CHECKING, Any, TypedDict
 
@@ -57,18 +58,35 @@ def summary_metadata(
 
     See [pymmcore_plus.metadata.SummaryMetaV1][] for a description of the
     dictionary format.
+
+    If `cached` is `True` (the default), the parts of the summary that rarely
+    change (device descriptions, property details such as allowed values and limits,
+    config group and pixel size definitions) are memoized per core, and invalidated
+    by the relevant core signals (`systemConfigurationLoaded`, `propertiesChanged`,
+    `configDefined`, `configDeleted`, `configGroupDeleted`, `pixelSizeChanged`, ...).
+    Only the dynamic values (property values, positions, image info) are
+    recomputed.
     """
+    if cached and (memo := _StaticInfoCache.for_core(core)) is not None:
+        devices = memo.devices_info(core, include_property_details)
+        groups = memo.config_groups(core)
+        px_configs = memo.pixel_size_configs(core)
+    else:
+        devices = devices_info(
+            core, cached=cached, include_property_details=include_property_details
+        )
+        groups = config_groups(core)
+        px_configs = pixel_size_configs(core)
+
     summary: SummaryMetaV1 = {
         "format": "summary-dict",
         "version": "1.0",
-        "devices": devices_info(
-            core, cached=cached, include_property_details=include_property_details
-        ),
+        "devices": devices,
         "system_info": system_info(core),
         "image_infos": image_infos(core),
         "position": position(core),
-        "config_groups": config_groups(core),
-        "pixel_size_configs": pixel_size_configs(core),
+        "config_groups": groups,
+        "pixel_size_configs": px_configs,
     }
     if include_time:
         summary["datetime"] = timestamp()
@@ -116,6 +134,19 @@ def device_info(
     include_property_details: bool = True,
 ) -> DeviceInfo:
     """Return information about a specific device label."""
+    info = _static_device_info(core, label)
+    info["properties"] = properties(
+        core,
+        device=label,
+        cached=cached,
+        include_details=include_property_details,
+    )
+    _add_dynamic_device_info(core, info)
+    return info
+
+
+def _static_device_info(core: CMMCorePlus, label: str) -> DeviceInfo:
+    """Device info that doesn't change while the device is loaded."""
     devtype = core.getDeviceType(label)
     info: DeviceInfo = {
         "label": label,
@@ -123,25 +154,16 @@ def device_info(
         "name": core.getDeviceName(label),
         "type": devtype.name,
         "description": core.getDeviceDescription(label),
-        "properties": properties(
-            core,
-            device=label,
-            cached=cached,
-            include_details=include_property_details,
-        ),
+        "properties": (),
     }
     if parent := core.getParentLabel(label):
         info["parent_label"] = parent
     with suppress(RuntimeError):
         if devtype == DeviceType.Hub:
             info["child_names"] = core.getInstalledDevices(label)
-        if devtype == DeviceType.State:
-            info["labels"] = core.getStateLabels(label)
         elif devtype == DeviceType.Stage:
             info["is_sequenceable"] = core.isStageSequenceable(label)
             info["is_continuous_focus_drive"] = core.isContinuousFocusDrive(label)
-            with suppress(RuntimeError):
-                info["focus_direction"] = core.getFocusDirection(label).name  # type: ignore[typeddict-item]
         elif devtype == DeviceType.XYStage:
             info["is_sequenceable"] = core.isXYStageSequenceable(label)
         elif devtype == DeviceType.Camera:
@@ -151,6 +173,17 @@ def device_info(
     return info
 
 
+def _add_dynamic_device_info(core: CMMCorePlus, info: DeviceInfo) -> None:
+    """Add the parts of device info that may change at any time."""
+    label = info["label"]
+    with suppress(RuntimeError):
+        if info["type"] == DeviceType.State.name:
+            info["labels"] = core.getStateLabels(label)
+        elif info["type"] == DeviceType.Stage.name:
+            with suppress(RuntimeError):
+                info["focus_direction"] = core.getFocusDirection(label).name  # type: ignore[typeddict-item]
+
+
 def system_info(core: CMMCorePlus) -> SystemInfo:
     """Return general system information."""
     return {
@@ -350,19 +383,27 @@ def property_info(
     include_property_details: bool = True,
 ) -> PropertyInfo:
     """Return information on a specific device property."""
-    try:
-        if cached:
-            value = core.getPropertyFromCache(device, prop)
-        else:  # pragma: no cover
-            value = core.getProperty(device, prop)
-    except Exception:  # pragma: no cover
-        value = None
     info: PropertyInfo = {
         "name": prop,
-        "value": value,
+        "value": _property_value(core, device, prop, cached),
     }
-    if not include_property_details:
-        return info
+    if include_property_details:
+        info.update(_property_details(core, device, prop))  # type: ignore[typeddict-item]
+    return info
+
+
+def _property_value(core: CMMCorePlus, device: str, prop: str, cached: bool) -> Any:
+    try:
+        if cached:
+            return _cached_property_value(core, device, prop)
+        return core.getProperty(device, prop)  # pragma: no cover
+    except Exception:  # pragma: no cover
+        return None
+
+
+def _property_details(core: CMMCorePlus, device: str, prop: str) -> dict[str, Any]:
+    """Return the static details of a property (type, allowed values, limits...)."""
+    info: dict[str, Any] = {}
     info["data_type"] = core.getPropertyType(device, prop).__repr__()
     info["allowed_values"] = tuple(core.getAllowedPropertyValues(device, prop))
     info["is_read_only"] = core.isPropertyReadOnly(device, prop)
@@ -379,6 +420,14 @@ def property_info(
     return info
 
 
+def _cached_property_value(core: CMMCorePlus, device: str, prop: str) -> Any:
+    """Read a property value from the core's state mirror (or the state cache)."""
+    if (mirror := getattr(core, "getSystemStateMirror", None)) is not None:
+        with suppress(KeyError):
+            return mirror()[(device, prop)]
+    return core.getPropertyFromCache(device, prop)
+
+
 def properties(
     core: CMMCorePlus,
     device: str,
@@ -406,3 +455,114 @@ def pixel_size_configs(core: CMMCorePlus) -> tuple[PixelSizeConfigPreset, ...]:
         pixel_size_config(core, config_name=config_name)
         for config_name in core.getAvailablePixelSizeConfigs()
     )
+
+
+# ----------------------------------------------
+# memoization of static summary metadata
+# ----------------------------------------------
+
+
+class _StaticInfoCache:
+    """Per-core cache of the parts of the summary metadata that rarely change.
+
+    Cleared (in whole or in part) by core signals.
+    """
+
+    _instances: weakref.WeakKeyDictionary[CMMCorePlus, _StaticInfoCache] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    @classmethod
+    def for_core(cls, core: CMMCorePlus) -> _StaticInfoCache | None:
+        """Return the cache for `core`, or None if it can't be cached.
+
+        (e.g. for mocks: without signals we can't know when to invalidate.)
+        """
+        if not isinstance(core, pymmcore_plus.CMMCorePlus):
+            return None
+        if (cache := cls._instances.get(core)) is None:
+            cache = cls._instances[core] = cls(core)
+        return cache
+
+    def __init__(self, core: CMMCorePlus) -> None:
+        # {label: (static device info, {prop: details})}
+        self._devices: dict[str, tuple[DeviceInfo, dict[str, dict[str, Any]]]] = {}
+        self._config_groups: tuple[ConfigGroup, ...] | None = None
+        self._pixel_size_configs: tuple[PixelSizeConfigPreset, ...] | None = None
+
+        ev = core.events
+        ev.systemConfigurationLoaded.connect(self.clear)
+        ev.propertiesChanged.connect(self._clear_devices)
+        for sig in (ev.configDefined, ev.configDeleted, ev.configGroupDeleted):
+            sig.connect(self._clear_config_groups)
+        for sig in (ev.pixelSizeChanged, ev.pixelSizeAffineChanged):
+            sig.connect(self._clear_pixel_size_configs)
+
+    def clear(self) -> None:
+        self._clear_devices()
+        self._clear_config_groups()
+        self._clear_pixel_size_configs()
+
+    def _clear_devices(self) -> None:
+        self._devices = {}
+
+    def _clear_config_groups(self, *_: Any) -> None:
+        self._config_groups = None
+
+    def _clear_pixel_size_configs(self, *_: Any) -> None:
+        self._pixel_size_configs = None
+
+    def devices_info(
+        self, core: CMMCorePlus, include_property_details: bool
+    ) -> tuple[DeviceInfo, ...]:
+        devices = self._devices
+        infos: list[DeviceInfo] = []
+        for label in core.getLoadedDevices():
+            cached = devices.get(label)
+            # make sure a different device wasn't loaded with the same label
+            if cached is None or cached[0]["name"] != core.getDeviceName(label):
+                static = _static_device_info(core, label)
+                details = {
+                    prop: _property_details(core, label, prop)
+                    for prop in core.getDevicePropertyNames(label)
+                }
+                cached = devices[label] = (static, details)
+
+            static, details = cached
+            info = static.copy()
+            props: list[PropertyInfo] = []
+            for prop, prop_details in details.items():
+                prop_info: PropertyInfo = {
+                    "name": prop,
+                    "value": _property_value(core, label, prop, cached=True),
+                }
+                if include_property_details:
+                    prop_info.update(prop_details)  # type: ignore[typeddict-item]
+                props.append(prop_info)
+            info["properties"] = tuple(props)
+            _add_dynamic_device_info(core, info)
+            infos.append(info)
+        return tuple(infos)
+
+    def config_groups(self, core: CMMCorePlus) -> tuple[ConfigGroup, ...]:
+        groups = self._config_groups
+        if groups is not None:
+            # groups/presets may have been renamed (which emits no signal)
+            names = [
+                (g, tuple(core.getAvailableConfigs(g)))
+                for g in core.getAvailableConfigGroups()
+            ]
+            if names != [
+                (g["name"], tuple(p["name"] for p in g["presets"])) for g in groups
+            ]:
+                groups = None
+        if groups is None:
+            groups = self._config_groups = config_groups(core)
+        return groups
+
+    def pixel_size_configs(
+        self, core: CMMCorePlus
+    ) -> tuple[PixelSizeConfigPreset, ...]:
+        if (configs := self._pixel_size_configs) is None:
+            configs = self._pixel_size_configs = pixel_size_configs(core)
+        return configs
@@ -256,6 +256,32 @@ def test_continuous_sequence_acquisition(device: str) -> None:
     assert isinstance(core.popNextImage(), np.ndarray)
 
 
+@pytest.mark.parametrize("device", ["python", "c++"])
+def test_stream(device: str) -> None:
+    core = UniMMCore()
+    _load_device(core, device)
+    core.setExposure(1)
+
+    with core.stream(maxsize=2) as stream:
+        assert core.isSequenceRunning()
+        for n, (img, _md) in enumerate(stream):
+            assert isinstance(img, np.ndarray)
+            time.sleep(0.02)  # consume slower than the camera
+            if n == 4:
+                break
+    assert not core.isSequenceRunning()
+    assert stream.frames_dropped > 0
+    assert stream.frames_received >= 5 + stream.frames_dropped
+
+    # iterating starts (and stops) the stream
+    for _ in core.stream(drop_policy="latest"):
+        break
+    assert not core.isSequenceRunning()
+
+    with pytest.raises(ValueError, match="drop_policy"):
+        core.stream(drop_policy="nope")  # type: ignore[arg-type]
+
+
 def test_unload_all_stops_sequence_and_clears_unicore_state() -> None:
     core = UniMMCore()
     _load_device(core, "python")
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import numpy as np
+import pytest
+import useq
+
+from pymmcore_plus.mda.handlers._5d_writer_base import _5DWriterBase
+
+
+class _NumpyWriter(_5DWriterBase[np.ndarray]):
+    """Writes to in-memory numpy arrays, recording the thread of each write."""
+
+    def __init__(self, chunks: tuple[int, ...] | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.chunks = chunks
+        self.threads: dict[str, set[str]] = {}
+        self.order: dict[str, list[tuple[int, ...]]] = {}
+
+    def new_array(self, key: str, dtype: np.dtype, sizes: dict[str, int]) -> Any:
+        return np.zeros(tuple(sizes.values()), dtype=dtype)
+
+    def write_frame(self, ary: Any, index: tuple[int, ...], frame: np.ndarray) -> None:
+        key = next(k for k, v in self.position_arrays.items() if v is ary)
+        self.threads.setdefault(key, set()).add(threading.current_thread().name)
+        self.order.setdefault(key, []).append(index)
+        super().write_frame(ary, index, frame)
+
+    def frame_chunks(self, ary: Any) -> tuple[int, ...] | None:
+        return self.chunks
+
+
+@pytest.mark.parametrize("chunks", [None, (2, 1)])
+def test_position_workers(chunks: tuple[int, ...] | None) -> None:
+    seq = useq.MDASequence(
+        stage_positions=[(i, i) for i in range(6)],
+        time_plan={"interval": 0, "loops": 4},
+        z_plan={"range": 1, "step": 1},
+        axis_order="tpz",
+    )
+    writer = _NumpyWriter(chunks, position_workers=3)
+    writer.sequenceStarted(seq, {})  # type: ignore[arg-type]
+    for i, event in enumerate(seq):
+        frame = np.full((4, 4), i, dtype=np.uint16)
+        writer.frameReady(frame, event, {})  # type: ignore[arg-type]
+    writer.sequenceFinished(seq)
+
+    assert len(writer.position_arrays) == 6
+    for key in writer.position_arrays:
+        # each position is written by a single worker thread, in order
+        (thread,) = writer.threads[key]
+        assert thread.startswith("_NumpyWriter-writer-")
+        assert writer.order[key] == sorted(writer.order[key])
+    assert len(set.union(*writer.threads.values())) == 3
+
+    expected = [e.index for e in seq]
+    for i, index in enumerate(expected):
+        ary = writer.position_arrays[f"p{index['p']}"]
+        assert ary[index["t"], index["z"], 0, 0] == i
+
+
+def test_isel_buffered_frames() -> None:
+    seq = useq.MDASequence(
+        time_plan={"interval": 0, "loops": 2}, z_plan={"range": 2, "step": 1}
+    )
+    writer = _NumpyWriter(chunks=(1, 3))
+    writer.sequenceStarted(seq, {})  # type: ignore[arg-type]
+    for i, event in enumerate(list(seq)[:4]):
+        writer.frameReady(np.full((4, 4), i + 1, dtype=np.uint16), event, {})  # type: ignore[arg-type]
+
+    # the frame of the second timepoint is only buffered, but visible to isel
+    assert writer.isel(t=1, x=0, y=0).tolist() == [4, 0, 0]
+    assert writer.isel(z=0, x=0, y=0).tolist() == [1, 4]
+    assert not writer.position_arrays["p0"][1].any()
+
+
+def test_isel_during_position_workers() -> None:
+    seq = useq.MDASequence(
+        stage_positions=[(0, 0), (1, 1)],
+        time_plan={"interval": 0, "loops": 20},
+        z_plan={"range": 2, "step": 1},
+        axis_order="tpz",
+    )
+    writer = _NumpyWriter(chunks=(2, 1), position_workers=2)
+    errors: list[Exception] = []
+    done = threading.Event()
+
+    def _read() -> None:
+        while not done.is_set():
+            try:
+                for p in range(len(writer.position_arrays)):
+                    writer.isel(p=p, x=0, y=0)
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+                return
+
+    writer.sequenceStarted(seq, {})  # type: ignore[arg-type]
+    reader = threading.Thread(target=_read)
+    reader.start()
+    for event in seq:
+        if event.index["t"] < 19:
+            frame = np.full((4, 4), event.index["t"] + 1, dtype=np.uint16)
+            writer.frameReady(frame, event, {})  # type: ignore[arg-type]
+    writer._join_writes()
+    # the frames of t=18 are only buffered (their chunk is incomplete), but visible
+    assert not writer.position_arrays["p0"][18].any()
+    expected = np.repeat(np.arange(20)[:, None] + 1, 3, axis=1)
+    expected[19] = 0
+    for p in range(2):
+        np.testing.assert_array_equal(writer.isel(p=p, x=0, y=0), expected)
+    done.set()
+    reader.join()
+    writer.sequenceFinished(seq)
+    assert not errors
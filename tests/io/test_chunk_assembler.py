@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import itertools
+import random
+import threading
+import time
+from typing import Any
+
+import numpy as np
+
+from pymmcore_plus.mda.handlers import ChunkAssembler
+
+
+class _Array:
+    """Records every __setitem__ call."""
+
+    def __init__(self, shape: tuple[int, ...]) -> None:
+        self.data = np.zeros(shape, dtype="uint16")
+        self.shape, self.dtype = shape, self.data.dtype
+        self.writes: list[Any] = []
+
+    def __setitem__(self, key: Any, value: np.ndarray) -> None:
+        self.writes.append(key)
+        self.data[key] = value
+
+    def __getitem__(self, key: Any) -> np.ndarray:
+        return self.data[key]  # type: ignore[no-any-return]
+
+
+def test_chunk_assembler_out_of_order() -> None:
+    ary = _Array((3, 5, 4, 4))
+    assembler = ChunkAssembler()
+    indices = list(itertools.product(range(3), range(5)))
+    random.Random(0).shuffle(indices)
+    for t, z in indices:
+        assembler.write(ary, (t, z), np.full((4, 4), t * 10 + z), chunks=(1, 2))
+
+    # each (complete) chunk is written once: 3 timepoints * 3 z-chunks
+    assert len(ary.writes) == 9
+    assert not len(assembler) and not assembler.nbytes
+    expected = np.arange(3)[:, None] * 10 + np.arange(5)
+    np.testing.assert_array_equal(ary.data[..., 0, 0], expected)
+
+
+def test_chunk_assembler_memory_cap() -> None:
+    ary = _Array((1, 8, 4, 4))
+    frame_bytes = 4 * 4 * 2
+    # room for a single incomplete chunk of 4 frames
+    assembler = ChunkAssembler(max_bytes=4 * frame_bytes)
+    assembler.write(ary, (0, 0), np.ones((4, 4)), chunks=(1, 4))
+    assert len(assembler) == 1
+    # starting a second chunk evicts the first, frame by frame
+    assembler.write(ary, (0, 4), np.ones((4, 4)), chunks=(1, 4))
+    assert len(assembler) == 1
+    assert ary.writes == [(0, 0)]
+
+    assembler.flush()
+    assert ary.writes == [(0, 0), (0, 4)]
+    assert ary.data[0, :, 0, 0].tolist() == [1, 0, 0, 0, 1, 0, 0, 0]
+
+
+def test_chunk_assembler_read() -> None:
+    ary = _Array((2, 6, 4, 4))
+    assembler = ChunkAssembler()
+    for z in range(5):
+        assembler.write(ary, (0, z), np.full((4, 4), z + 1), chunks=(1, 3))
+    # the first chunk was written, the second is still buffered
+    assert ary.writes == [(slice(0, 1), slice(0, 3))]
+
+    data = assembler.read(ary, (0, slice(None), 0, 0))
+    assert data.tolist() == [1, 2, 3, 4, 5, 0]
+    assert assembler.read(ary, (0, -2)).shape == (4, 4)
+    assert assembler.read(ary, (0, -2))[0, 0] == 5
+    assert assembler.read(ary, (slice(None), slice(None, None, -2))).shape == (
+        2,
+        3,
+        4,
+        4,
+    )
+    assert assembler.read(ary, (0, slice(None, None, -2), 1, 1)).tolist() == [0, 4, 2]
+    # reading doesn't write the buffered frames
+    assert len(ary.writes) == 1
+    assert len(assembler) == 1
+
+
+class _SlowArray(_Array):
+    def __setitem__(self, key: Any, value: np.ndarray) -> None:
+        time.sleep(0.001)
+        super().__setitem__(key, value)
+
+
+def test_chunk_assembler_read_while_writing() -> None:
+    ary = _SlowArray((50, 4, 4, 4))
+    assembler = ChunkAssembler()
+    errors: list[Exception] = []
+    written = [0]
+    done = threading.Event()
+
+    def _read() -> None:
+        while not done.is_set():
+            n_written = written[0]
+            try:
+                data = assembler.read(ary, (slice(None), slice(None), 0, 0))
+                # every frame passed to `write` is visible, buffered or not
+                assert np.count_nonzero(data) >= n_written
+            except Exception as e:  # pragma: no cover
+                errors.append(e)
+                return
+
+    reader = threading.Thread(target=_read)
+    reader.start()
+    for t, z in itertools.product(range(50), range(4)):
+        assembler.write(ary, (t, z), np.full((4, 4), 1), chunks=(1, 4))
+        written[0] += 1
+    done.set()
+    reader.join()
+    assert not errors
+    assert ary.data.all()
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+import useq
+
+from pymmcore_plus.mda.handlers import (
+    ImageSequenceWriter,
+    OMETiffWriter,
+    TensorStoreHandler,
+    open_dataset,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SEQ = useq.MDASequence(
+    time_plan={"interval": 0, "loops": 3},
+    channels=["DAPI", "FITC"],
+    stage_positions=[(0, 0), (1, 1)],
+)
+
+
+def _frame(event: useq.MDAEvent) -> np.ndarray:
+    # encode the index in the pixel values: t + 10 * p + 100 * c
+    value = sum(
+        event.index.get(k, 0) * m for k, m in zip("tpc", (1, 10, 100), strict=True)
+    )
+    return np.full((8, 10), value, dtype=np.uint16)
+
+
+def _run(writer: Any, seq: useq.MDASequence, events: list[useq.MDAEvent]) -> None:
+    if isinstance(writer, ImageSequenceWriter):
+        writer.sequenceStarted(seq)
+    else:
+        writer.sequenceStarted(seq, {})
+    for event in events:
+        meta = {"runner_time_ms": float(event.index["t"]), "mda_event": event}
+        writer.frameReady(_frame(event), event, meta)
+    writer.sequenceFinished(seq)
+
+
+@pytest.mark.parametrize(
+    "kind", ["tensorstore", "tensorstore-zarr3", "tensorstore-shards", "ome-tiff"]
+)
+def test_open_dataset(tmp_path: Path, kind: str) -> None:
+    if kind == "ome-tiff":
+        path = tmp_path / "out.ome.tif"
+        writer: Any = OMETiffWriter(path)
+    else:
+        path = tmp_path / "out.zarr"
+        kwargs: dict = {"driver": "zarr3"} if kind.endswith("zarr3") else {}
+        if kind.endswith("shards"):
+            kwargs["frame_meta_shard_size"] = 5
+        writer = TensorStoreHandler(path=path, **kwargs)
+    _run(writer, SEQ, list(SEQ))
+
+    with open_dataset(path) as ds:
+        assert len(ds.keys) == (2 if kind == "ome-tiff" else 1)
+        assert ds.sizes()["t"] == 3
+        assert ds.sizes()["c"] == 2
+        assert ds.isel(p=1, t=2, c=1).shape == (8, 10)
+        assert ds.isel(p=1, t=2, c=1)[0, 0] == 112
+        np.testing.assert_array_equal(ds.isel(p=0, c=1, x=0, y=0), [100, 101, 102])
+        with pytest.raises(KeyError, match="Unknown dimension"):
+            ds.isel(q=0)
+
+        times = ds.frame_metadata().column("runner_time_ms")
+        if kind == "ome-tiff":
+            assert len(times) == 0  # OMETiffWriter doesn't store frame metadata
+        else:
+            assert len(times) == len(list(SEQ))
+
+
+def test_open_dataset_frame_ordered(tmp_path: Path) -> None:
+    """Frames stored in acquisition order are presented as an N-D array."""
+    seq = useq.MDASequence(time_plan={"interval": 0, "loops": 3}, channels=["DAPI"])
+    events = list(seq)
+    writer = TensorStoreHandler(path=tmp_path / "out.zarr")
+    # the shape of an empty sequence is unknown, so frames are stored in order
+    _run(writer, useq.MDASequence(), events[:-1])
+
+    ds = open_dataset(tmp_path / "out.zarr")
+    assert ds.dims() == ("t", "c", "y", "x")
+    # the missing frame is filled with zeros
+    np.testing.assert_array_equal(ds.isel(c=0, y=0, x=0), [0, 1, 0])
+    assert ds.array()[1, 0].shape == (8, 10)
+
+
+def test_open_image_sequence(tmp_path: Path) -> None:
+    seq = useq.MDASequence(time_plan={"interval": 0, "loops": 3}, channels=["A", "B"])
+    _run(ImageSequenceWriter(tmp_path / "seq"), seq, list(seq))
+
+    ds = open_dataset(tmp_path / "seq")
+    assert ds.sizes() == {"t": 3, "c": 2, "y": 8, "x": 10}
+    np.testing.assert_array_equal(ds.isel(c=1, y=0, x=0), [100, 101, 102])
+    assert len(ds.frame_metadata()) == 6
+
+    # without the metadata, the indices are parsed from the file names
+    (tmp_path / "seq" / ImageSequenceWriter.FRAME_META_PATH).unlink()
+    ds = open_dataset(tmp_path / "seq")
+    np.testing.assert_array_equal(ds.isel(t=2, y=0, x=0), [2, 102])
+
+    with pytest.raises(FileNotFoundError):
+        open_dataset(tmp_path / "missing.zarr")
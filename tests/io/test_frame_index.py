@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+
+from pymmcore_plus.mda.handlers._frame_index import FrameIndexTable
+
+
+def test_frame_index_table() -> None:
+    table = FrameIndexTable(capacity=2)
+    for t in range(3):
+        for z in range(2):
+            table.append({"t": t, "z": z})
+    table.append({"t": 0})  # different set of axes
+    table.append({"t": 1, "z": 0})  # rewritten: the latest frame wins
+    table.append({"t": 4, "z": 0})  # no frames at t=3
+    assert len(table) == 9
+    assert table.axes == ["t", "z"]
+    assert table.axis_max("z") == 1
+
+    assert table.lookup({"t": 2, "z": 1}) == [5]
+    assert table.lookup({"t": 0}) == [6]
+    assert table.lookup({"t": 1, "z": 0}) == [7]
+    assert table.lookup({"z": slice(None), "t": 1}) == [7, 3]
+    assert table.lookup({"t": slice(0, 3), "z": 1}) == [1, 3, 5]
+    # frames are returned in the order of the requested values
+    assert table.lookup({"t": slice(2, None, -2), "z": 1}) == [5, 1]
+    reverse_t = {"t": slice(2, None, -1), "z": slice(None)}
+    assert table.lookup(reverse_t) == [4, 5, 7, 3, 0, 1]
+    assert table.lookup({"c": 0}) == []
+    with pytest.warns(UserWarning, match="1 of 4"):
+        assert table.lookup({"t": slice(1, None), "z": 0}) == [7, 4, 8]
+
+    data = json.loads(json.dumps(table.to_json()))
+    restored = FrameIndexTable.from_json(data)
+    assert restored.axes == table.axes
+    np.testing.assert_array_equal(restored.coords, table.coords)
+    assert restored.lookup({"t": 2, "z": 1}) == [5]
+
+    table.clear()
+    assert len(table) == 0
+    assert not table.axes
+
+
+def test_frame_index_table_legacy_json() -> None:
+    # frame_indices written by older versions of TensorStoreHandler
+    legacy = [[[["t", 0], ["c", 0]], 0], [[["t", 0], ["c", 1]], 2], [[["t", 1]], 3]]
+    table = FrameIndexTable.from_json(legacy)
+    assert table.axes == ["t", "c"]
+    assert len(table) == 4
+    assert table.lookup({"t": 0, "c": slice(None)}) == [0, 2]
+    assert table.lookup({"t": 1}) == [3]
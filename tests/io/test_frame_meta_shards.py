@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+import useq
+
+from pymmcore_plus.mda.handlers import FrameMetaShardWriter, iter_frame_meta_shards
+from pymmcore_plus.metadata.serialize import json_dumps
+
+
+def test_frame_meta_shards() -> None:
+    store: dict[str, bytes] = {}
+    metas = [
+        {"runner_time_ms": i * 1.5, "mda_event": useq.MDAEvent(index={"t": i})}
+        for i in range(10)
+    ]
+    writer = FrameMetaShardWriter(store.__setitem__, "frame_meta/p0/", shard_size=4)
+    for i, meta in enumerate(metas):
+        writer.append(meta)
+        # full shards are written as soon as they are complete
+        assert len(store) == (i + 1) // 4
+    assert len(writer) == 10
+
+    pointer = writer.close()
+    assert pointer["count"] == 10
+    assert sorted(store) == [f"frame_meta/p0/{n}.jsonl" for n in range(3)]
+    expected = json.loads(json_dumps(metas))
+    assert list(iter_frame_meta_shards(store.__getitem__, pointer)) == expected
+
+    with pytest.raises(ValueError):
+        FrameMetaShardWriter(store.__setitem__, "x", shard_size=0)
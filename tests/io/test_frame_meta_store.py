@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pytest
+import useq
+
+from pymmcore_plus.mda.handlers import FrameMetaStore
+from pymmcore_plus.metadata.serialize import json_dumps
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _metas(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "format": "frame-dict",
+            "runner_time_ms": i * 1.5,
+            "camera_device": "Camera",
+            "property_values": ({"dev": "Dev", "prop": "P", "value": "1"},),
+            "mda_event": useq.MDAEvent(index={"t": i}),
+            "hardware_triggered": bool(i % 2),
+            "position": {"x": i, "y": 2.0},
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("spill", [False, True])
+def test_frame_meta_store(tmp_path: Path, spill: bool) -> None:
+    metas = _metas(25)
+    metas[3]["position"]["x"] = 3.5  # int column promoted to float
+    metas[4]["camera_device"] = None  # str column promoted to json
+    del metas[5]["position"]
+    expected = json.loads(json_dumps(metas))
+
+    store = FrameMetaStore(spill_dir=tmp_path if spill else None, max_rows=7)
+    store.extend(metas)
+    assert len(store) == 25
+    assert list(store) == expected
+    assert store[3] == expected[3]
+    assert store[-1] == expected[-1]
+    assert store[2:4] == expected[2:4]
+    assert json.loads(store.to_json()) == expected
+
+    np.testing.assert_allclose(store.column("runner_time_ms"), np.arange(25) * 1.5)
+    xs = store.column("position", "x")
+    assert xs[3] == 3.5
+    assert np.isnan(xs[5])
+    assert store.column("camera_device")[4] is None
+
+    if spill:
+        assert any(tmp_path.iterdir())
+    store.clear()
+    assert len(store) == 0
+    assert not any(tmp_path.iterdir())
+
+
+def test_frame_meta_store_column_dtype(tmp_path: Path) -> None:
+    # spilled floats must not be cast to the dtype of the in-memory (int) column
+    store = FrameMetaStore(spill_dir=tmp_path, max_rows=2)
+    store.extend([{"x": 0.5}, {"x": 1.5}, {"x": 2}])
+    np.testing.assert_array_equal(store.column("x"), [0.5, 1.5, 2.0])
+    # ... and vice versa
+    store.clear()
+    store.extend([{"x": 0}, {"x": 1}, {"x": 2.5}])
+    np.testing.assert_array_equal(store.column("x"), [0, 1, 2.5])
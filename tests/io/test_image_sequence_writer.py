@@ -103,3 +103,71 @@ def test_any_writer(tmp_path: Path, core: CMMCorePlus) -> None:
     assert isinstance(fname, str)
     assert str(tmp_path) in fname
     assert isinstance(ary, np.ndarray)
+
+
+def test_frame_metadata_log(tmp_path: Path) -> None:
+    seq = useq.MDASequence(time_plan={"interval": 0, "loops": 5})
+    dest = tmp_path / "out"
+    writer = ImageSequenceWriter(dest, imwrite=Mock())
+    writer.sequenceStarted(seq)
+    for i, event in enumerate(seq):
+        writer.frameReady(np.zeros((4, 4)), event, {"runner_time_ms": i})  # type: ignore
+
+    # while running, metadata is appended to the log (and not kept in memory)...
+    times = [m["runner_time_ms"] for m in writer.frame_metadatas]
+    assert times == list(range(5))
+    log = writer._frame_meta_log
+    assert log is not None
+    log.close()
+    records = [json.loads(line) for line in log.path.read_text().splitlines()]
+    assert [next(iter(r.values())) for r in records] == [
+        {"runner_time_ms": i} for i in range(5)
+    ]
+
+    # ... and compacted into a single file at the end
+    writer._frame_meta_log = log
+    writer.sequenceFinished(seq)
+    assert not (dest / ImageSequenceWriter.FRAME_META_LOG_PATH).exists()
+    frame_meta = json.loads((dest / ImageSequenceWriter.FRAME_META_PATH).read_text())
+    assert frame_meta == {k: v for r in records for k, v in r.items()}
+    assert list(writer.frame_metadatas) == list(frame_meta.values())
+
+
+def test_threaded_writer(tmp_path: Path) -> None:
+    tf = pytest.importorskip("tifffile")
+    seq = useq.MDASequence(time_plan={"interval": 0, "loops": 20})
+    dest = tmp_path / "out"
+    writer = ImageSequenceWriter(
+        dest, imwrite_kwargs={"compression": "zlib"}, max_workers=4, max_pending=3
+    )
+    writer.sequenceStarted(seq)
+    frames = [np.full((32, 32), i, dtype="uint16") for i in range(20)]
+    for frame, event in zip(frames, seq, strict=False):
+        writer.frameReady(frame, event, {})  # type: ignore
+        assert len(writer._pending) <= 3
+    writer.sequenceFinished(seq)
+    assert not writer._pending
+
+    # filenames are assigned in the order frames arrive
+    files = sorted(dest.glob("*.tif"))
+    assert len(files) == 20
+    for i, file in enumerate(files):
+        assert file.name.startswith(f"{i:05}")
+        np.testing.assert_array_equal(tf.imread(file), frames[i])
+
+
+def test_threaded_writer_error(tmp_path: Path) -> None:
+    seq = useq.MDASequence(time_plan={"interval": 0, "loops": 3})
+    dest = tmp_path / "out"
+    writer = ImageSequenceWriter(
+        dest, imwrite=Mock(side_effect=OSError("disk full")), max_workers=2
+    )
+    writer.sequenceStarted(seq)
+    writer.frameReady(np.zeros((4, 4)), next(iter(seq)), {})  # type: ignore
+    with pytest.raises(OSError, match="disk full"):
+        writer.sequenceFinished(seq)
+
+    # the pool is shut down and the metadata is still written
+    assert writer._pool is None
+    assert writer._frame_meta_log is None
+    assert (dest / ImageSequenceWriter.FRAME_META_PATH).exists()
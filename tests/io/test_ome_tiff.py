@@ -73,3 +73,104 @@ def test_ome_tiff_writer(
         )
 
         assert data.shape[:-2] == seq_shape
+
+
+@pytest.mark.parametrize("background", [True, False])
+def test_ome_tiff_flush_policy(tmp_path: Path, background: bool) -> None:
+    from unittest.mock import patch
+
+    import numpy as np
+
+    seq = useq.MDASequence(time_plan={"interval": 0, "loops": 10})
+    writer = OMETiffWriter(
+        tmp_path / "out.ome.tif", flush_every=4, background_flush=background
+    )
+    with patch.object(np.memmap, "flush", autospec=True) as mock_flush:
+        writer.sequenceStarted(seq, {})  # type: ignore
+        for i, event in enumerate(seq):
+            writer.frameReady(np.full((16, 16), i, "uint16"), event, {})  # type: ignore
+        if writer._flush_future is not None:
+            writer._flush_future.result()
+        # after frames 4 and 8 (a background flush is skipped if one is running)
+        assert 1 <= mock_flush.call_count <= 2
+        n_flushed = mock_flush.call_count
+        writer.sequenceFinished(seq)
+        assert mock_flush.call_count == n_flushed + 1  # always flushed at the end
+
+    data = tf.imread(tmp_path / "out.ome.tif")
+    np.testing.assert_array_equal(data[:, 0, 0], np.arange(10))
+
+
+def test_ome_tiff_streaming(tmp_path: Path) -> None:
+    import numpy as np
+
+    from pymmcore_plus import GeneratorMDASequence
+
+    # known shape... with the last timepoint interrupted
+    # (the z step adds non-ASCII units to the OME-XML)
+    seq = useq.MDASequence(
+        channels=["DAPI", "FITC"],
+        time_plan={"interval": 0, "loops": 3},
+        z_plan={"range": 0, "step": 1},
+    )
+    dest = tmp_path / "out.ome.tif"
+    writer = OMETiffWriter(dest, streaming=True)
+    writer.sequenceStarted(seq, {})  # type: ignore
+    events = list(seq)
+    for i, event in enumerate(events[:5]):
+        writer.frameReady(np.full((8, 8), i + 1, "uint16"), event, {})  # type: ignore
+    with pytest.raises(ValueError, match="must arrive in order"):
+        writer.frameReady(np.zeros((8, 8), "uint16"), events[0], {})  # type: ignore
+    writer.sequenceFinished(seq)
+
+    with tf.TiffFile(dest) as tif:
+        assert tif.is_bigtiff and tif.is_ome
+        assert tif.series[0].axes == "TCYX"
+        data = tif.asarray()
+    # the last timepoint is padded with zeros
+    np.testing.assert_array_equal(data[:, :, 0, 0], [[1, 2], [3, 4], [5, 0]])
+
+    # unknown shape: frames are appended along the time axis
+    dest = tmp_path / "gen.ome.tif"
+    writer = OMETiffWriter(dest, streaming=True)
+    gen = GeneratorMDASequence()
+    writer.sequenceStarted(gen, {})  # type: ignore
+    for i in range(7):
+        frame = np.full((8, 8), i, "uint16")
+        writer.frameReady(frame, useq.MDAEvent(index={"t": i}), {})  # type: ignore
+    writer.sequenceFinished(gen)
+
+    with tf.TiffFile(dest) as tif:
+        assert tif.series[0].axes == "TYX"
+        np.testing.assert_array_equal(tif.asarray()[:, 0, 0], np.arange(7))
+
+
+def test_ome_tiff_streaming_isel(tmp_path: Path) -> None:
+    import numpy as np
+
+    seq = useq.MDASequence(
+        channels=["DAPI", "FITC"],
+        time_plan={"interval": 0, "loops": 3},
+        stage_positions=[(0, 0), (1, 1)],
+        axis_order="tpc",
+    )
+    writer = OMETiffWriter(tmp_path / "out.ome.tif", streaming=True)
+    writer.sequenceStarted(seq, {})  # type: ignore
+    events = list(seq)
+    for event in events[:7]:
+        # encode the index in the pixel values: t + 10 * p + 100 * c
+        i = event.index
+        value = i["t"] + 10 * i["p"] + 100 * i["c"]
+        writer.frameReady(np.full((8, 8), value, "uint16"), event, {})  # type: ignore
+
+        # frames can be read back while the sequence is running
+        assert writer.isel(p=i["p"], t=i["t"], c=i["c"], x=0, y=0) == value
+
+    assert writer.isel(p=0, t=1, c=1).shape == (8, 8)
+    # frames that haven't been written yet read as zeros
+    np.testing.assert_array_equal(writer.isel(p=1, c=1, x=0, y=0), [110, 0, 0])
+    expected = [[0, 100], [1, 101], [0, 0]]
+    np.testing.assert_array_equal(writer.isel(p=0, x=0, y=0), expected)
+    writer.sequenceFinished(seq)
+
+    np.testing.assert_array_equal(writer.isel(p=0, t=1, y=0, x=0), [1, 101])
@@ -7,7 +7,12 @@ import numpy as np
 import pytest
 import useq
 
-from pymmcore_plus.mda.handlers import OMEZarrWriter, TensorStoreHandler
+from pymmcore_plus.mda._pyramid import pyramid_levels
+from pymmcore_plus.mda.handlers import (
+    OMEZarrWriter,
+    TensorStoreHandler,
+    iter_frame_meta_shards,
+)
 from pymmcore_plus.metadata import serialize
 
 if TYPE_CHECKING:
@@ -149,6 +154,34 @@ def test_ome_zarr_writer(
     assert isinstance(writer.isel(p=0, t=0, x=slice(0, 100)), np.ndarray)
 
 
+def test_ome_zarr_writer_chunks(tmp_path: Path, core: CMMCorePlus) -> None:
+    mda = FULL_MDA.replace(stage_positions=[(0, 0, 0)])
+    writer = OMEZarrWriter(tmp_path / "out.zarr", chunks={"z": 2, "c": 2})
+    core.mda.run(mda, output=writer)
+
+    ary = writer.position_arrays["p0"]
+    assert ary.chunks == (1, 2, 2, 512, 512)  # t, c, z, y, x
+    assert not len(writer._chunk_assembler)
+    data = zarr.open(str(tmp_path / "out.zarr"))["p0"]
+    # every plane was written
+    assert np.all(data[:].mean(axis=(-2, -1)) > 0)
+
+
+def test_ome_zarr_writer_pyramid(tmp_path: Path, core: CMMCorePlus) -> None:
+    mda = FULL_MDA.replace(stage_positions=[(0, 0, 0)])
+    writer = OMEZarrWriter(tmp_path / "out.zarr", pyramid_levels=3)
+    core.mda.run(mda, output=writer)
+
+    group = zarr.open(str(tmp_path / "out.zarr"))
+    datasets = group.attrs["multiscales"][0]["datasets"]
+    assert [d["path"] for d in datasets] == ["p0", "p0_2x", "p0_4x", "p0_8x"]
+    assert datasets[3]["coordinateTransformations"][0]["scale"][-2:] == [8, 8]
+    full, lowres = group["p0"][:], group["p0_8x"][:]
+    assert lowres.shape == (*full.shape[:-2], 64, 64)
+    # each level is built (and rounded) from the previous one
+    np.testing.assert_array_equal(lowres, pyramid_levels(full, 3)[-1])
+
+
 @requires_tensorstore
 @pytest.mark.parametrize("store, mda, expected_shapes", CASES)
 def test_tensorstore_writer(
@@ -251,3 +284,69 @@ def test_tensorstore_writer_indeterminate(tmp_path: Path, core: CMMCorePlus) ->
     assert writer.isel(t=1, z=slice(None), c=0).shape == (2, 512, 512)
     with pytest.raises(KeyError):
         writer.isel(t=2, z=2, c=0)
+
+
+@requires_tensorstore
+def test_tensorstore_writer_bounded_writes() -> None:
+    seq = useq.MDASequence(time_plan={"interval": 0, "loops": 20})
+    writer = TensorStoreHandler(max_pending_writes=4)
+    writer.sequenceStarted(seq, {})  # type: ignore[arg-type]
+    for event in seq:
+        frame = np.full((16, 16), event.index["t"], dtype=np.uint16)
+        writer.frameReady(frame, event, {"runner_time_ms": 0})  # type: ignore
+        assert writer.write_stats["pending"] <= 4
+    writer.sequenceFinished(seq)
+
+    stats = writer.write_stats
+    assert stats["pending"] == 0
+    assert stats["completed"] == 20
+    data = writer.isel(t=slice(None))
+    np.testing.assert_array_equal(data[:, 0, 0], np.arange(20))
+    # frame_metadatas holds the (event, metadata) of each frame
+    events, metas = zip(*writer.frame_metadatas, strict=True)
+    assert list(events) == list(seq)
+    assert metas[0] == {"runner_time_ms": 0}
+
+
+@requires_tensorstore
+def test_tensorstore_writer_frame_meta_shards(tmp_path: Path) -> None:
+    seq = useq.MDASequence(time_plan={"interval": 0, "loops": 5})
+    writer = TensorStoreHandler(path=tmp_path / "out.zarr", frame_meta_shard_size=2)
+    writer.sequenceStarted(seq, {})  # type: ignore[arg-type]
+    for event in seq:
+        frame = np.zeros((16, 16), dtype=np.uint16)
+        writer.frameReady(frame, event, {"runner_time_ms": event.index["t"]})  # type: ignore
+    # frame metadata isn't kept in memory
+    assert not writer.frame_metadatas
+    writer.sequenceFinished(seq)
+
+    zattrs = serialize.json_loads((tmp_path / "out.zarr" / ".zattrs").read_bytes())
+    assert "frame_metadatas" not in zattrs
+    pointer = zattrs["frame_metadata_shards"]
+    metas = list(
+        iter_frame_meta_shards(
+            lambda key: (tmp_path / "out.zarr" / key).read_bytes(), pointer
+        )
+    )
+    assert [m["runner_time_ms"] for m in metas] == list(range(5))
+
+
+def test_ome_zarr_writer_frame_meta_shards(tmp_path: Path, core: CMMCorePlus) -> None:
+    writer = OMEZarrWriter(tmp_path / "out.zarr", frame_meta_shard_size=3)
+    sizes: list[int] = []
+
+    @core.mda.events.frameReady.connect
+    def _on_frame() -> None:
+        sizes.append(sum(len(m) for m in writer.frame_metadatas.values()))
+
+    core.mda.run(SIMPLE_MDA, output=writer)
+    # frame metadata isn't kept in memory
+    assert not any(sizes)
+
+    group = zarr.open(str(tmp_path / "out.zarr"))
+    attrs = group["p0"].attrs
+    assert "frame_meta" not in attrs
+    pointer = attrs["frame_meta_shards"]
+    assert pointer["count"] == len(list(SIMPLE_MDA))
+    metas = list(iter_frame_meta_shards(group.store.__getitem__, pointer))
+    assert len(metas) == pointer["count"]
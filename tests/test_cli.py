@@ -249,6 +249,20 @@ def test_run_mda_dry() -> None:
     mock.run_mda.assert_not_called()
 
 
+def test_run_mda_estimate(core: CMMCorePlus) -> None:
+    with (
+        patch("pymmcore_plus.core._mmcore_plus._instance", lambda: core),
+        patch.object(core, "run_mda") as run_mda,
+    ):
+        result = runner.invoke(
+            app, ["run", "--estimate", "--t-interval", "0.1", "--t-loops", "3"]
+        )
+
+    assert result.exit_code == 0
+    assert "total" in result.stdout
+    run_mda.assert_not_called()
+
+
 def test_run_mda_channels() -> None:
     FITC = {"config": "FITC", "exposure": 0.1, "do_stack": False, "group": "test"}
     cmd: list[str] = [
@@ -368,3 +382,13 @@ def test_cli_bench() -> None:
     assert result.exit_code == 0
     assert "Loading config" in result.stdout
     assert "Core" in result.stdout
+
+
+def test_cli_bench_profile(tmp_path: Path) -> None:
+    local = Path(__file__).parent / "local_config.cfg"
+    dest = tmp_path / "profile.json"
+    result = runner.invoke(
+        app, ["bench", "--config", str(local), "-n", "1", "--profile", str(dest)]
+    )
+    assert result.exit_code == 0
+    assert dest.exists()
@@ -603,6 +603,93 @@ def test_snap_rgb(core: CMMCorePlus) -> None:
     np.testing.assert_equal(img[::64, -1], expect)
 
 
+def test_fix_image_rgb() -> None:
+    core = CMMCorePlus()
+    raw = np.arange(6 * 8, dtype=np.uint32).reshape(6, 8) * 0x01020304
+    bgra = raw.view(np.uint8).reshape(6, 8, 4)
+    rgb = bgra[..., [2, 1, 0]]
+
+    fixed = core.fixImage(raw, 4)
+    np.testing.assert_array_equal(fixed, rgb)
+    assert not np.shares_memory(fixed, raw)
+
+    # zero-copy views
+    view = core.fixImage(raw, 4, copy=False)
+    np.testing.assert_array_equal(view, rgb)
+    assert np.shares_memory(view, raw)
+    native = core.fixImage(raw, 4, channel_order="BGRA", copy=False)
+    np.testing.assert_array_equal(native, bgra)
+    assert np.shares_memory(native, raw)
+
+    # preallocated output
+    out = np.empty((6, 8, 3), dtype=np.uint8)
+    assert core.fixImage(raw, 4, out=out) is out
+    np.testing.assert_array_equal(out, rgb)
+    out4 = np.empty((6, 8, 4), dtype=np.uint8)
+    assert core.fixImage(raw, 4, channel_order="BGRA", out=out4) is out4
+    np.testing.assert_array_equal(out4, bgra)
+    gray = np.empty((6, 8), dtype=np.uint32)
+    assert core.fixImage(raw, 1, out=gray) is gray
+    np.testing.assert_array_equal(gray, raw)
+
+
+def test_get_tags(core: CMMCorePlus) -> None:
+    core.snapImage()
+    tags = core.getTags()
+    assert tags["Camera-Binning"] == "1"
+    assert tags["ROI"] == "0-0-512-512"
+    assert tags["Channel"] == core.getCurrentConfig("Channel")
+
+    # cached tags are updated by core signals
+    core.setROI(10, 10, 100, 100)
+    core.setProperty("Camera", "Binning", "2")
+    core.setConfig("Channel", "FITC")
+    tags = core.getTags()
+    assert tags["ROI"] == "-".join(str(x) for x in core.getROI())
+    assert tags["Width"] == core.getImageWidth()
+    assert tags["Camera-Binning"] == tags["Binning"] == "2"
+    assert tags["Channel"] == "FITC"
+
+    minimal = core.getTags(profile="minimal")
+    assert "Camera-Binning" not in minimal
+    assert {"Width", "Height", "PixelType", "Time"} <= set(minimal)
+
+    core.setTagProfile("full")
+    assert core.getTags()["XPositionUm"] == core.getXPosition()
+    with pytest.raises(ValueError, match="Unknown tag profile"):
+        core.setTagProfile("nope")  # type: ignore[arg-type]
+
+
+def test_system_state_mirror(core: CMMCorePlus) -> None:
+    mirror = core.getSystemStateMirror()
+    assert dict(mirror) == {
+        (dev, prop): val for dev, prop, val in core.getSystemStateCache()
+    }
+
+    version = mirror.version
+    assert mirror.version == version  # reading doesn't change the version
+    core.setProperty("Camera", "Binning", "2")
+    assert mirror.version > version
+    assert mirror["Camera", "Binning"] == "2"
+
+    core.setConfig("Channel", "FITC")
+    core.setPosition(42)
+    core.waitForSystem()
+    assert mirror["Dichroic", "Label"] == "Q505LP"
+    assert mirror["Z", "Position"] == core.getPropertyFromCache("Z", "Position")
+    assert mirror.device_state("Camera")["Binning"] == "2"
+
+    # only the properties that changed are reported
+    version = mirror.version
+    core.setProperty("Camera", "Binning", "4")
+    core.setProperty("Camera", "Binning", "4")  # unchanged
+    assert mirror.changes_since(version) == {("Camera", "Binning"): "4"}
+    assert mirror.changes_since(mirror.version) == {}
+    core.events.propertiesChanged.emit()
+    assert mirror.changes_since(version) is None  # rebuilt
+    assert core.getTags()["Camera-Binning"] == "4"
+
+
 def test_env_vars(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     core = CMMCorePlus()
     assert not core.debugLogEnabled()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import useq
+
+from pymmcore_plus.mda import estimate_sequence
+
+if TYPE_CHECKING:
+    from pymmcore_plus import CMMCorePlus
+
+
+def test_estimate_time_plan(core: CMMCorePlus) -> None:
+    core.setExposure(10)
+    seq = useq.MDASequence(time_plan={"interval": 1, "loops": 3})
+    est = estimate_sequence(core, seq, use_hardware_sequencing=False)
+
+    assert est.n_events == est.n_images == 3
+    assert est.n_sequenced_events == 0
+    assert est.breakdown_s["exposure"] == pytest.approx(0.03)
+    # the last timepoint starts at 2s
+    assert est.total_s >= 2
+    assert est.breakdown_s["waiting"] > 0
+    assert est.total_s == pytest.approx(sum(est.breakdown_s.values()))
+
+
+def test_estimate_does_not_move_hardware(core: CMMCorePlus) -> None:
+    x0, y0 = core.getXYPosition()
+    z0 = core.getZPosition()
+    seq = useq.MDASequence(
+        stage_positions=[(100, 100, 10), (200, 300, 20)],
+        channels=["DAPI", "FITC"],
+    )
+    est = estimate_sequence(core, seq, xy_speed=1, z_speed=0.5)
+    assert core.getXYPosition() == pytest.approx((x0, y0))
+    assert core.getZPosition() == pytest.approx(z0)
+
+    # 200 µm at 1 µm/ms (from the larger axis of the second move)
+    assert est.breakdown_s["xy_travel"] >= 0.2
+    assert est.breakdown_s["z_travel"] > 0
+
+
+def test_estimate_sequenced(core: CMMCorePlus) -> None:
+    seq = useq.MDASequence(time_plan={"interval": 0, "loops": 5})
+    est = estimate_sequence(core, seq, use_hardware_sequencing=True)
+
+    assert est.n_sequenced_events == 1
+    assert est.max_sequence_length == 5
+    assert est.peak_buffer_bytes == 5 * core.getImageBufferSize()
+    assert est.fits_in_buffer
+
+
+def test_estimate_with_latency_profile(core: CMMCorePlus) -> None:
+    from pymmcore_plus.core import LatencyModel, LatencyProfile
+
+    core.setXYPosition(0, 0)
+    core.setAutoShutter(True)
+    profile = LatencyProfile(
+        xy_stages={core.getXYStageDevice(): LatencyModel(10, 0.1)},
+        shutters={core.getShutterDevice(): (5, 5)},
+    )
+    seq = useq.MDASequence(stage_positions=[(0, 0), (100, 0)])
+    est = estimate_sequence(core, seq, profile=profile, use_hardware_sequencing=False)
+    assert est.breakdown_s["xy_travel"] == pytest.approx(0.02)
+    assert est.breakdown_s["shutter"] == pytest.approx(0.02)
+
+    # the profile registered on the core is used by default
+    core.setLatencyProfile(profile)
+    assert estimate_sequence(core, seq, use_hardware_sequencing=False) == est
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import time
 from contextlib import nullcontext
 from typing import Any
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 import pytest
 
@@ -151,6 +152,50 @@ def test_set_statedevice_property_emits_events(core: CMMCorePlus) -> None:
     assert core.getProperty("Dichroic", Keyword.State.value) == "1"
 
 
+def test_set_properties_emits_events(core: CMMCorePlus) -> None:
+    exposure = core.getProperty("Camera", "Exposure")
+    mock = Mock()
+    core.events.propertyChanged.connect(mock)
+    core.setProperties(
+        {
+            ("Camera", "Binning"): "2",
+            ("Camera", "Exposure"): float(exposure),  # unchanged: not set
+            ("Objective", Keyword.State.value): 3,
+        }
+    )
+    assert mock.call_args_list == [
+        call("Camera", "Binning", "2"),
+        call("Objective", Keyword.State.value, "3"),
+        call("Objective", Keyword.Label.value, "Nikon 20X Plan Fluor ELWD"),
+    ]
+    assert core.getProperty("Camera", "Binning") == "2"
+
+    mock.reset_mock()
+    with pytest.raises(RuntimeError, match="Failed to set properties"):
+        core.setProperties([("Camera", "Binning", "1"), ("Camera", "Nope", "1")])
+    mock.assert_called_once_with("Camera", "Binning", "1")
+
+
+def test_property_emission_policy(core: CMMCorePlus) -> None:
+    mock = Mock()
+    core.events.propertyChanged.connect(mock)
+    core.setPropertyEmissionPolicy(before_from_cache=True)
+    with patch.object(core, "getProperty", wraps=core.getProperty) as get_prop:
+        core.setProperty("Camera", "Binning", "2")
+    # only the "after" value is read from the device
+    get_prop.assert_called_once_with("Camera", "Binning")
+    mock.assert_called_once_with("Camera", "Binning", "2")
+
+    # the demo camera fires native callbacks: no need to read anything
+    mock.reset_mock()
+    core.setPropertyEmissionPolicy(native_callback_devices=["DemoCamera"])
+    with patch.object(core, "getProperty", wraps=core.getProperty) as get_prop:
+        core.setProperty("Camera", "Binning", "1")
+    get_prop.assert_not_called()
+    time.sleep(0.2)  # native callbacks may be asynchronous
+    mock.assert_any_call("Camera", "Binning", "1")
+
+
 def test_device_property_events(core: CMMCorePlus, anybot: Any) -> None:
     mock1 = Mock()
     mock2 = Mock()
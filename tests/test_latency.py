@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pymmcore_plus.core import LatencyModel, LatencyProfile, profile_latencies
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pymmcore_plus import CMMCorePlus
+
+
+def test_latency_model_fit() -> None:
+    model = LatencyModel.fit([0, 10, 20, 30], [5, 6, 7, 8])
+    assert model.offset_ms == pytest.approx(5)
+    assert model.ms_per_um == pytest.approx(0.1)
+    assert model(-20) == pytest.approx(7)
+
+    assert LatencyModel.fit([], []) == LatencyModel(0, 0)
+    assert LatencyModel.fit([10, 10], [4, 6]) == LatencyModel(5, 0)
+
+
+def test_latency_profile_roundtrip(tmp_path: Path) -> None:
+    profile = LatencyProfile(
+        xy_stages={"XY": LatencyModel(10, 0.01)},
+        stages={"Z": LatencyModel(2, 0.1)},
+        state_devices={"Filter": {0: {1: 50.0}, 1: {0: 30.0}}},
+        shutters={"Shutter": (5.0, 3.0)},
+    )
+    assert profile.xy_move_ms("XY", (0, 0), (100, 50)) == pytest.approx(11)
+    assert profile.xy_move_ms("XY", (0, 0), (0, 0)) == 0
+    assert profile.stage_move_ms("Z", 10, 0) == pytest.approx(3)
+    assert profile.state_switch_ms("Filter", 0, 1) == 50
+    # unmeasured transitions fall back to the mean
+    assert profile.state_switch_ms("Filter", 2, 0) == 40
+    assert profile.shutter_ms("Shutter", open=False) == 3
+    assert profile.stage_move_ms("Other", 0, 1) is None
+
+    path = tmp_path / "profile.json"
+    profile.save(path)
+    assert LatencyProfile.load(path) == profile
+
+
+def test_profile_latencies(core: CMMCorePlus, tmp_path: Path) -> None:
+    xy0 = core.getXYPosition()
+    state0 = core.getState("Objective")
+    profile = profile_latencies(core, xy_distances=(10, 100), repeats=1)
+
+    assert "XY" in profile.xy_stages
+    assert "Z" in profile.stages
+    assert "Objective" in profile.state_devices
+    assert "Shutter" in profile.shutters
+    # hardware is restored
+    assert core.getXYPosition() == pytest.approx(xy0)
+    assert core.getState("Objective") == state0
+
+    path = tmp_path / "profile.json"
+    profile.save(path)
+    assert core.loadLatencyProfile(path) == profile
+    assert core.getLatencyProfile() == profile
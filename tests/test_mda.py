@@ -887,6 +887,48 @@ def test_different_roi_breaks_sequencing(core: CMMCorePlus) -> None:
     assert tuple(core.getROI()) == initial_roi
 
 
+def test_channel_config_diff(core: CMMCorePlus) -> None:
+    # DAPI and Cy5 share the same dichroic: only the filters should be switched
+    seq = MDASequence(
+        channels=[
+            {"config": "DAPI", "exposure": 10},
+            {"config": "Cy5", "exposure": 10},
+        ],
+        time_plan={"interval": 0, "loops": 2},
+    )
+    config_set = Mock()
+    core.events.configSet.connect(config_set)
+    dichroic: list[str] = []
+
+    @core.mda.events.frameReady.connect
+    def _on_frame(img: Any, event: MDAEvent) -> None:
+        dichroic.append(core.getProperty("Dichroic", "Label"))
+        if len(dichroic) == 2:
+            # external change: must be picked up and undone by the next event
+            core.setProperty("Dichroic", "Label", "Q505LP")
+
+    with (
+        patch.object(core, "setConfig", wraps=core.setConfig) as set_config,
+        patch.object(core, "setProperty", wraps=core.setProperty) as set_prop,
+        patch.object(core, "setExposure", wraps=core.setExposure) as set_exposure,
+    ):
+        core.mda.run(seq)
+
+    # the first preset is applied in full, then only the differences
+    set_config.assert_called_once_with("Channel", "DAPI")
+    dichroic_sets = [
+        c for c in set_prop.call_args_list if c.args[:2] == ("Dichroic", "Label")
+    ]
+    assert len(dichroic_sets) == 2  # the external change, and its correction
+    assert dichroic == ["400DCLP"] * 4
+    assert [c.args for c in config_set.call_args_list] == [
+        ("Channel", "DAPI"),
+        ("Channel", "Cy5"),
+    ] * 2
+    # exposure doesn't change between channels
+    set_exposure.assert_called_once_with(10)
+
+
 def test_skip_event_from_setup(core: CMMCorePlus) -> None:
     """SkipEvent raised in setup_event skips exec and notifies the sink."""
     exec_mock = Mock()
@@ -6,12 +6,15 @@ import json
 from typing import TYPE_CHECKING
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 import useq
 from ome_writers import AcquisitionSettings
 
+from pymmcore_plus.mda._pyramid import pyramid_levels
 from pymmcore_plus.mda._runner import MDARunner
-from pymmcore_plus.mda._sink import OmeWritersSink
+from pymmcore_plus.mda._sink import OmeWritersSink, _ZarrPyramid
+from pymmcore_plus.mda._view_cache import CachedView
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -290,3 +293,111 @@ def test_run_with_dimension_overrides(core: CMMCorePlus, tmp_path: Path) -> None
     core.mda.run(seq, output=dest, dimension_overrides={"z": {"chunk_size": 5}})
     metadata = json.loads((dest / "0" / "zarr.json").read_bytes())
     assert metadata["chunk_grid"]["configuration"]["chunk_shape"][0] == 5
+
+
+def test_run_with_pyramid_levels(core: CMMCorePlus, tmp_path: Path) -> None:
+    """pyramid_levels adds downsampled datasets to each image group."""
+    seq = useq.MDASequence(time_plan=useq.TIntervalLoops(interval=0, loops=2))
+    dest = tmp_path / "test.ome.zarr"
+    core.mda.run(seq, output=dest, pyramid_levels=2)
+
+    ome = json.loads((dest / "zarr.json").read_bytes())["attributes"]["ome"]
+    datasets = ome["multiscales"][0]["datasets"]
+    assert [d["path"] for d in datasets] == ["0", "1", "2"]
+    base = json.loads((dest / "0" / "zarr.json").read_bytes())
+    level = json.loads((dest / "2" / "zarr.json").read_bytes())
+    assert level["shape"] == [
+        *base["shape"][:-2],
+        *(n // 4 for n in base["shape"][-2:]),
+    ]
+    assert level["dimension_names"] == base["dimension_names"]
+
+    # the levels are built from the frames as they are acquired
+    ts = pytest.importorskip("tensorstore")
+    full, lowres = (
+        ts.open({"driver": "zarr3", "kvstore": f"file://{dest / p}"}).result().read()
+        for p in ("0", "2")
+    )
+    np.testing.assert_array_equal(lowres.result(), pyramid_levels(full.result(), 2)[-1])
+
+
+@pytest.mark.parametrize("driver", ["zarr3", "zarr"])
+def test_write_zarr_pyramid_codecs(tmp_path: Path, driver: str) -> None:
+    """Pyramid levels use the format and compression of the base array."""
+    ts = pytest.importorskip("tensorstore")
+    if driver == "zarr3":
+        blosc = {"cname": "zstd", "clevel": 3, "shuffle": "shuffle", "typesize": 2}
+        inner = [{"name": "bytes"}, {"name": "blosc", "configuration": blosc}]
+        metadata: dict = {
+            "data_type": "uint16",
+            "chunk_grid": {
+                "name": "regular",
+                "configuration": {"chunk_shape": [2, 16, 16]},
+            },
+            "codecs": [
+                {
+                    "name": "sharding_indexed",
+                    "configuration": {"chunk_shape": [1, 16, 16], "codecs": inner},
+                }
+            ],
+        }
+    else:
+        compressor = {"id": "blosc", "cname": "zstd", "clevel": 3, "shuffle": 1}
+        metadata = {"dtype": "<u2", "chunks": [1, 16, 16], "compressor": compressor}
+    ts.open(
+        {
+            "driver": driver,
+            "kvstore": {"driver": "file", "path": str(tmp_path / "0")},
+            "metadata": {**metadata, "shape": [2, 16, 16]},
+        },
+        create=True,
+    ).result()
+    scale = {"type": "scale", "scale": [1, 0.5, 0.5]}
+    datasets = [{"path": "0", "coordinateTransformations": [scale]}]
+    doc = {"attributes": {"ome": {"multiscales": [{"datasets": datasets}]}}}
+    (tmp_path / "zarr.json").write_text(json.dumps(doc))
+
+    pyramid = _ZarrPyramid(tmp_path, levels=2)
+    assert [d["path"] for d in pyramid.datasets] == ["1", "2"]
+    assert pyramid.datasets[1]["coordinateTransformations"][0]["scale"] == [1, 2, 2]
+    # the third plane grows the levels along the first dimension
+    for t, value in enumerate([0, 100, 200]):
+        plane = np.full((16, 16), value, dtype=np.uint16)
+        for n, level_data in enumerate(pyramid_levels(plane, 2), 1):
+            pyramid.write((t,), n, level_data)
+    level = ts.open(
+        {"driver": driver, "kvstore": {"driver": "file", "path": str(tmp_path / "2")}}
+    ).result()
+    assert level.shape == (3, 4, 4)
+    np.testing.assert_array_equal(level.read().result()[:, 0, 0], [0, 100, 200])
+    level_meta = level.spec().to_json()["metadata"]
+    if driver == "zarr3":
+        assert level_meta["codecs"][-1]["name"] == "blosc"
+    else:
+        assert level_meta["compressor"]["id"] == "blosc"
+
+
+def test_run_with_view_cache(core: CMMCorePlus) -> None:
+    """view_cache_bytes serves single-frame reads of get_view() from memory."""
+    seq = useq.MDASequence(
+        time_plan=useq.TIntervalLoops(interval=0, loops=3),
+        stage_positions=[(0, 0), (1, 1)],
+    )
+    matches: list[bool] = []
+
+    @core.mda.events.frameReady.connect
+    def _on_frame(img: np.ndarray, event: useq.MDAEvent) -> None:
+        view = core.mda.get_view()
+        assert view is not None
+        matches.append(np.array_equal(view[event.index["t"], event.index["p"]], img))
+
+    core.mda.run(seq, output="memory", view_cache_bytes=64 * 2**20)
+    assert matches == [True] * 6
+    view = core.mda.get_view()
+    assert isinstance(view, CachedView)
+    assert view.cache_stats == {
+        "hits": 6,
+        "misses": 0,
+        "frames": 6,
+        "nbytes": 6 * core.getImageBufferSize(),
+    }
@@ -121,3 +121,24 @@ def test_multicam(core: CMMCorePlus, sequenced: bool) -> None:
         assert meta["format"] == "frame-dict"
         assert ("camera_metadata" in meta) is sequenced
         time_stamps.append(meta["runner_time_ms"])
+
+
+def test_summary_metadata_cache(core: CMMCorePlus) -> None:
+    from unittest.mock import patch
+
+    first = summary_metadata(core)
+    first.pop("datetime")
+    with patch.object(
+        core, "getAllowedPropertyValues", wraps=core.getAllowedPropertyValues
+    ) as mock:
+        second = summary_metadata(core)
+    second.pop("datetime")
+    assert second == first
+    mock.assert_not_called()
+
+    # changes to config groups are reflected
+    core.defineConfig("NewGroup", "NewPreset", "Camera", "Mode", "Noise")
+    groups = {g["name"] for g in summary_metadata(core)["config_groups"]}
+    assert "NewGroup" in groups
+    # and the uncached path still works
+    assert summary_metadata(core, cached=False)["devices"]
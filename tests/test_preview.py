@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import numpy as np
+import pytest
+import useq
+
+from pymmcore_plus.mda._preview import PreviewTap, downsample
+
+
+@pytest.mark.parametrize("mode", ["bin", "stride"])
+def test_downsample(mode: Any) -> None:
+    img = np.arange(2048 * 1000, dtype=np.uint16).reshape(1000, 2048)
+    preview = downsample(img, 512, mode)
+    assert preview.shape == (250, 512)
+    assert preview.dtype == img.dtype
+    if mode == "stride":
+        np.testing.assert_array_equal(preview, img[::4, ::4])
+    else:
+        assert preview[0, 0] == round(img[:4, :4].mean())
+    # small images are returned as is
+    assert downsample(img, 4096, mode) is img
+
+
+@pytest.mark.parametrize("mode", ["bin", "stride"])
+def test_downsample_rgb(mode: Any) -> None:
+    img = np.zeros((2048, 1024, 3), dtype=np.uint8)
+    img[..., 1] = 100
+    preview = downsample(img, 512, mode)
+    assert preview.shape == (512, 256, 3)
+    assert preview.flags.c_contiguous
+    np.testing.assert_array_equal(preview[0, 0], [0, 100, 0])
+
+
+def test_preview_tap() -> None:
+    previews: list[tuple[np.ndarray, useq.MDAEvent, str]] = []
+
+    def _emit(preview: np.ndarray, event: useq.MDAEvent, meta: Any) -> None:
+        previews.append((preview, event, threading.current_thread().name))
+
+    # previews are disabled by default
+    tap = PreviewTap(_emit, max_size=16)
+    tap.submit(np.ones((64, 64)), useq.MDAEvent(), {})  # type: ignore
+    tap.stop()
+    assert tap.n_emitted == 0
+
+    tap.fps = 1
+    frame = np.ones((64, 64), dtype=np.uint8)
+    for t in range(20):
+        for c in ("DAPI", "FITC"):
+            event = useq.MDAEvent(index={"t": t}, channel=c)
+            tap.submit(frame * t, event, {"camera_device": "Cam"})  # type: ignore
+    tap.stop()
+
+    # at 1 fps, only the first and the last frame of each channel are previewed
+    assert 2 <= len(previews) <= 4
+    assert tap.n_emitted == len(previews)
+    assert {p.shape for p, *_ in previews} == {(16, 16)}
+    assert {name for *_, name in previews} == {"PreviewTap"}
+    last = {e.channel.config: e.index["t"] for _, e, _ in previews}  # type: ignore
+    assert last == {"DAPI": 19, "FITC": 19}
+
+    # fps=0 disables previews
+    tap.fps = 0
+    tap.submit(frame, useq.MDAEvent(), {})  # type: ignore
+    tap.stop()
+    assert tap.n_emitted == len(previews)
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from pymmcore_plus.mda._pyramid import (
+    PyramidBuilder,
+    block_mean,
+    pyramid_levels,
+    pyramid_shape,
+)
+
+
+def test_block_mean() -> None:
+    img = np.arange(2 * 5 * 7, dtype=np.uint16).reshape(2, 5, 7)
+    out = block_mean(img, 2)
+    assert out.shape == (2, 2, 3)
+    assert out.dtype == np.uint16
+    expected = img[:, :4, :6].reshape(2, 2, 2, 3, 2).mean(axis=(2, 4))
+    np.testing.assert_array_equal(out, np.rint(expected))
+
+    levels = pyramid_levels(np.ones((64, 32), dtype=np.float32), 3)
+    assert [lvl.shape for lvl in levels] == [(32, 16), (16, 8), (8, 4)]
+    assert pyramid_shape((3, 64, 32), 3) == (3, 8, 4)
+
+
+def test_pyramid_builder() -> None:
+    written: dict[tuple[int, int], np.ndarray] = {}
+    threads = set()
+
+    def _write(key: int, level: int, data: np.ndarray) -> None:
+        threads.add(threading.current_thread())
+        written[(key, level)] = data
+
+    builder = PyramidBuilder(_write, levels=3, max_pending=2)
+    for i in range(5):
+        builder.submit(i, np.full((16, 16), i, dtype=np.uint8))
+    builder.flush()
+    assert len(written) == 15
+    assert written[(4, 3)].shape == (2, 2)
+    assert np.all(written[(4, 3)] == 4)
+    assert threading.current_thread() not in threads
+    builder.close()
+
+    def _fail(*_: object) -> None:
+        raise OSError("disk full")
+
+    builder = PyramidBuilder(_fail, levels=1)
+    builder.submit(0, np.zeros((4, 4)))
+    with pytest.raises(OSError, match="disk full"):
+        builder.close()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pytest
+import useq
+
+from pymmcore_plus.mda import RecentFrames
+
+
+def _push(frames: RecentFrames, value: int, channel: str, camera: str = "Cam") -> None:
+    event = useq.MDAEvent(channel=channel)
+    meta: Any = {"camera_device": camera}
+    frames.push(np.full((4, 4), value, dtype=np.uint16), event, meta)
+
+
+def test_recent_frames() -> None:
+    frames = RecentFrames()
+    _push(frames, 1, "DAPI")
+    assert frames.latest() is None  # disabled by default
+
+    frames.depth = 3
+    for i in range(5):
+        _push(frames, i, "DAPI")
+        _push(frames, 10 + i, "FITC")
+    _push(frames, 100, "DAPI", camera="Cam2")
+
+    assert sorted(frames.keys()) == [
+        ("Cam", "DAPI"),
+        ("Cam", "FITC"),
+        ("Cam2", "DAPI"),
+    ]
+    latest = frames.latest()
+    assert latest is not None
+    assert latest[0, 0] == 100
+    assert frames.latest("FITC")[0, 0] == 14  # type: ignore[index]
+    assert frames.latest("DAPI", camera="Cam")[0, 0] == 4  # type: ignore[index]
+    assert frames.latest(camera="Cam")[0, 0] == 14  # type: ignore[index]
+    assert frames.latest("TRITC") is None
+    with pytest.raises(ValueError):
+        latest[0, 0] = 0  # read-only view
+
+    np.testing.assert_array_equal(frames.recent(channel="FITC")[:, 0, 0], [12, 13, 14])
+    np.testing.assert_array_equal(frames.recent(2, "DAPI", "Cam")[:, 0, 0], [3, 4])
+    item = frames.latest_item("FITC")
+    assert item is not None
+    assert item[1].channel.config == "FITC"  # type: ignore[union-attr]
+
+    # buffers are reused after the first frame
+    buffer = frames._rings[("Cam", "DAPI")].data
+    frames.clear()
+    assert frames.latest() is None
+    _push(frames, 7, "DAPI")
+    assert frames._rings[("Cam", "DAPI")].data is buffer
+    assert frames.recent(channel="DAPI").shape == (1, 4, 4)
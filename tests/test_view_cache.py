@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pymmcore_plus.mda._view_cache import CachedView, FrameCache
+
+
+def test_frame_cache_lru() -> None:
+    frame = np.zeros((4, 4), dtype=np.uint8)  # 16 bytes
+    cache = FrameCache(max_bytes=40)
+    cache.put("a", frame)
+    cache.put("b", frame + 1)
+    assert cache.get("a") is not None  # "a" is now the most recently used
+    cache.put("c", frame + 2)  # evicts "b"
+    assert cache.get("b") is None
+    assert cache.stats == {"hits": 1, "misses": 1, "frames": 2, "nbytes": 32}
+
+    cached = cache.get("c")
+    assert cached is not None
+    with pytest.raises(ValueError):
+        cached[0, 0] = 1  # frames are read-only
+
+    cache.put("big", np.zeros((10, 10), dtype=np.uint8))  # larger than the budget
+    assert cache.get("big") is None
+    cache.clear()
+    assert cache.stats == {"hits": 0, "misses": 0, "frames": 0, "nbytes": 0}
+
+
+def test_cached_view() -> None:
+    data = np.arange(3 * 2 * 4 * 5, dtype=np.uint16).reshape(3, 2, 4, 5)
+    written = {(0, 0), (0, 1)}
+    cache = FrameCache(max_bytes=2**20)
+    view = CachedView(data, cache, written.__contains__)  # type: ignore[arg-type]
+    assert view.shape == data.shape
+
+    np.testing.assert_array_equal(view[0, 1], data[0, 1])
+    np.testing.assert_array_equal(view[0, -1, 1:3, ::2], data[0, 1, 1:3, ::2])
+    assert view.cache_stats["misses"] == 1
+    assert view.cache_stats["hits"] == 1
+
+    # frames that haven't been written are not cached
+    np.testing.assert_array_equal(view[2, 0], data[2, 0])
+    assert view.cache_stats["frames"] == 1
+    # neither are reads of more than one frame
+    np.testing.assert_array_equal(view[:, 0, 0], data[:, 0, 0])
+    assert view.cache_stats["frames"] == 1